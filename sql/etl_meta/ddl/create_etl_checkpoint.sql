@@ -0,0 +1,20 @@
+-- 수집 실행(run)별 완료된 작업(work item) 원장
+-- 데이터 INSERT와 같은 트랜잭션에서 기록되어, 중단된 실행을 재시작하면 완료된 작업을 건너뜀
+
+CREATE TABLE IF NOT EXISTS etl_checkpoint (
+  run_id TEXT NOT NULL,
+  table_name TEXT NOT NULL,
+  ticker TEXT NOT NULL,
+  start_date TEXT NOT NULL DEFAULT '',
+  end_date TEXT NOT NULL DEFAULT '',
+  completed_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (run_id, table_name, ticker, start_date, end_date)
+);
+
+COMMENT ON TABLE etl_checkpoint IS '수집 실행별 완료된 작업 원장';
+COMMENT ON COLUMN etl_checkpoint.run_id IS '수집 실행 식별자 (호출자가 지정한 값 또는 KIS_RUN_ID, 없으면 실행마다 생성: YYYYMMDD-HHMMSS-<8자리 hex>)';
+COMMENT ON COLUMN etl_checkpoint.table_name IS '수집 대상 테이블명';
+COMMENT ON COLUMN etl_checkpoint.ticker IS '종목코드';
+COMMENT ON COLUMN etl_checkpoint.start_date IS '작업의 조회 시작일 (기간 조회가 아니면 빈 문자열)';
+COMMENT ON COLUMN etl_checkpoint.end_date IS '작업의 조회 종료일 (기간 조회가 아니면 빈 문자열)';
+COMMENT ON COLUMN etl_checkpoint.completed_at IS '작업 완료 시간';
@@ -0,0 +1,13 @@
+-- 여러 수집 프로세스가 하나의 KIS 앱 키 호출 한도를 공유하기 위한 토큰 버킷 상태 테이블
+-- PostgresTokenBucketRateLimiter가 행 단위 잠금(UPDATE)으로 토큰을 예약
+
+CREATE TABLE IF NOT EXISTS etl_rate_limit_bucket (
+  bucket_key TEXT PRIMARY KEY,
+  tokens DOUBLE PRECISION NOT NULL,
+  updated_at DOUBLE PRECISION NOT NULL
+);
+
+COMMENT ON TABLE etl_rate_limit_bucket IS 'KIS API 호출 한도 공유용 토큰 버킷 상태';
+COMMENT ON COLUMN etl_rate_limit_bucket.bucket_key IS '버킷 식별자 (앱 키 단위)';
+COMMENT ON COLUMN etl_rate_limit_bucket.tokens IS '현재 남은 토큰 수 (음수이면 예약 대기 중)';
+COMMENT ON COLUMN etl_rate_limit_bucket.updated_at IS '마지막 갱신 시각 (epoch seconds, DB 시계 기준)';
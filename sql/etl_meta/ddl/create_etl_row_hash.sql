@@ -0,0 +1,16 @@
+-- 스냅샷 수집 테이블의 (테이블, 키)별 마지막 저장 행 해시
+-- 해시가 같은 행은 다시 UPSERT하지 않아 불필요한 튜플 재작성(WAL, VACUUM 부하)을 줄임
+
+CREATE TABLE IF NOT EXISTS etl_row_hash (
+  table_name TEXT NOT NULL,
+  row_key TEXT NOT NULL,
+  row_hash TEXT NOT NULL,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (table_name, row_key)
+);
+
+COMMENT ON TABLE etl_row_hash IS '스냅샷 수집 테이블의 키별 마지막 저장 행 해시';
+COMMENT ON COLUMN etl_row_hash.table_name IS '데이터 테이블명';
+COMMENT ON COLUMN etl_row_hash.row_key IS 'INSERT 문의 ON CONFLICT 키 컬럼 값을 이어 붙인 행 키';
+COMMENT ON COLUMN etl_row_hash.row_hash IS '정규화한 행 전체의 해시 (16진수)';
+COMMENT ON COLUMN etl_row_hash.updated_at IS '행이 마지막으로 변경되어 저장된 시간';
@@ -0,0 +1,44 @@
+-- 수집 실행(run) x 테이블별 실행 지표
+-- API 지연 시간, 재시도, 변환/저장 시간, 처리량을 기록하여 동시성/배치 크기 조정과 성능 회귀 탐지에 사용
+
+CREATE TABLE IF NOT EXISTS etl_run_metrics (
+  run_id TEXT NOT NULL,
+  table_name TEXT NOT NULL,
+  started_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  elapsed_seconds DOUBLE PRECISION,
+  calls INTEGER,
+  retries INTEGER,
+  errors INTEGER,
+  latency_p50_ms DOUBLE PRECISION,
+  latency_p95_ms DOUBLE PRECISION,
+  latency_p99_ms DOUBLE PRECISION,
+  response_bytes BIGINT,
+  rows_fetched BIGINT,
+  rows_written BIGINT,
+  rows_per_second DOUBLE PRECISION,
+  fetch_seconds DOUBLE PRECISION,
+  transform_seconds DOUBLE PRECISION,
+  insert_seconds DOUBLE PRECISION,
+  summary JSONB,
+  PRIMARY KEY (run_id, table_name, started_at)
+);
+
+COMMENT ON TABLE etl_run_metrics IS '수집 실행별 실행 지표';
+COMMENT ON COLUMN etl_run_metrics.run_id IS '수집 실행 식별자';
+COMMENT ON COLUMN etl_run_metrics.table_name IS '수집 대상 테이블명';
+COMMENT ON COLUMN etl_run_metrics.started_at IS '수집 시작 시간';
+COMMENT ON COLUMN etl_run_metrics.elapsed_seconds IS '전체 소요 시간(초)';
+COMMENT ON COLUMN etl_run_metrics.calls IS 'API 요청 시도 수 (재시도 포함)';
+COMMENT ON COLUMN etl_run_metrics.retries IS '재시도 수 (한도 초과 + 전송 오류)';
+COMMENT ON COLUMN etl_run_metrics.errors IS '실패한 요청 시도 수';
+COMMENT ON COLUMN etl_run_metrics.latency_p50_ms IS 'API 응답 지연 시간 p50 (ms)';
+COMMENT ON COLUMN etl_run_metrics.latency_p95_ms IS 'API 응답 지연 시간 p95 (ms)';
+COMMENT ON COLUMN etl_run_metrics.latency_p99_ms IS 'API 응답 지연 시간 p99 (ms)';
+COMMENT ON COLUMN etl_run_metrics.response_bytes IS 'API 응답 본문 크기 합계';
+COMMENT ON COLUMN etl_run_metrics.rows_fetched IS 'API에서 수집한 원본 행 수';
+COMMENT ON COLUMN etl_run_metrics.rows_written IS 'DB에 저장한 행 수';
+COMMENT ON COLUMN etl_run_metrics.rows_per_second IS '초당 저장 행 수';
+COMMENT ON COLUMN etl_run_metrics.fetch_seconds IS '작업 수집 시간 합계 (워커 스레드 시간의 합)';
+COMMENT ON COLUMN etl_run_metrics.transform_seconds IS '변환 시간 합계';
+COMMENT ON COLUMN etl_run_metrics.insert_seconds IS 'DB 저장 시간 합계';
+COMMENT ON COLUMN etl_run_metrics.summary IS '전체 실행 요약 (JSON)';
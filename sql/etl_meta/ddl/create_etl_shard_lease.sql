@@ -0,0 +1,24 @@
+-- 여러 워커가 나눠 수집하는 종목 샤드의 임대(lease) 테이블
+-- 워커는 SKIP LOCKED로 샤드를 하나씩 가져가고, 하트비트로 임대를 연장하며, 만료된 임대는 다른 워커가 회수
+
+CREATE TABLE IF NOT EXISTS etl_shard_lease (
+  run_id TEXT NOT NULL,
+  table_name TEXT NOT NULL,
+  shard_id INTEGER NOT NULL,
+  status TEXT NOT NULL DEFAULT 'pending',
+  owner TEXT,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  heartbeat_at TIMESTAMP WITH TIME ZONE,
+  lease_expires_at TIMESTAMP WITH TIME ZONE,
+  PRIMARY KEY (run_id, table_name, shard_id)
+);
+
+COMMENT ON TABLE etl_shard_lease IS '분산 수집 종목 샤드 임대';
+COMMENT ON COLUMN etl_shard_lease.run_id IS '수집 실행 식별자';
+COMMENT ON COLUMN etl_shard_lease.table_name IS '수집 대상 테이블명';
+COMMENT ON COLUMN etl_shard_lease.shard_id IS '종목 샤드 번호 (0부터 샤드 수 - 1)';
+COMMENT ON COLUMN etl_shard_lease.status IS '샤드 상태 (pending: 대기, leased: 수집 중, done: 완료)';
+COMMENT ON COLUMN etl_shard_lease.owner IS '샤드를 임대한 워커 식별자';
+COMMENT ON COLUMN etl_shard_lease.attempts IS '샤드 임대 횟수';
+COMMENT ON COLUMN etl_shard_lease.heartbeat_at IS '마지막 하트비트 시간';
+COMMENT ON COLUMN etl_shard_lease.lease_expires_at IS '임대 만료 시간 (이후 다른 워커가 회수 가능)';
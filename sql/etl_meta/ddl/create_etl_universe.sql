@@ -0,0 +1,26 @@
+-- 수집 대상 종목 유니버스
+-- 종목코드 목록(get_asset_list)을 시드로 등록하고, kr_stock_basic_info/kr_stock_price_basic에서 상장 상태와 유동성을 갱신
+
+CREATE TABLE IF NOT EXISTS etl_universe (
+  asset TEXT NOT NULL,
+  ticker TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'active',
+  market TEXT,
+  kospi200 BOOLEAN,
+  listing_date TEXT,
+  delisting_date TEXT,
+  trading_value NUMERIC,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (asset, ticker)
+);
+
+COMMENT ON TABLE etl_universe IS '수집 대상 종목 유니버스';
+COMMENT ON COLUMN etl_universe.asset IS '자산 구분 (kr_stock, us_stock 등)';
+COMMENT ON COLUMN etl_universe.ticker IS '종목코드';
+COMMENT ON COLUMN etl_universe.status IS '상장 상태 (active: 정상, suspended: 거래정지, delisted: 상장폐지)';
+COMMENT ON COLUMN etl_universe.market IS '시장ID코드 (STK: 유가증권, KSQ: 코스닥, KNX: 코넥스)';
+COMMENT ON COLUMN etl_universe.kospi200 IS '코스피200 편입 여부';
+COMMENT ON COLUMN etl_universe.listing_date IS '상장일자 (YYYYMMDD)';
+COMMENT ON COLUMN etl_universe.delisting_date IS '상장폐지일자 (YYYYMMDD)';
+COMMENT ON COLUMN etl_universe.trading_value IS '최근 누적 거래 대금';
+COMMENT ON COLUMN etl_universe.updated_at IS '마지막 갱신 시간';
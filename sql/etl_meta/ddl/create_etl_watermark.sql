@@ -0,0 +1,16 @@
+-- 기간 조회 수집기의 (테이블, 종목)별 수집 완료 시점(워터마크) 테이블
+-- 데이터 INSERT와 같은 트랜잭션에서 갱신되어, 다음 실행은 종목마다 누락된 기간만 요청
+
+CREATE TABLE IF NOT EXISTS etl_watermark (
+  table_name TEXT NOT NULL,
+  ticker TEXT NOT NULL,
+  watermark_date TEXT NOT NULL,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (table_name, ticker)
+);
+
+COMMENT ON TABLE etl_watermark IS '기간 조회 수집기의 종목별 수집 완료 시점';
+COMMENT ON COLUMN etl_watermark.table_name IS '수집 대상 테이블명';
+COMMENT ON COLUMN etl_watermark.ticker IS '종목코드';
+COMMENT ON COLUMN etl_watermark.watermark_date IS '수집이 완료된 마지막 일자 (YYYYMMDD)';
+COMMENT ON COLUMN etl_watermark.updated_at IS '워터마크 마지막 갱신 시간';
@@ -0,0 +1,18 @@
+-- 대기 중이거나 임대가 만료된 샤드 하나를 임대합니다.
+-- 다른 워커가 잠근 행은 SKIP LOCKED로 건너뛰므로, 여러 워커가 같은 샤드를 동시에 가져가지 않습니다.
+
+UPDATE etl_shard_lease AS lease SET
+  status = 'leased',
+  owner = :owner,
+  attempts = lease.attempts + 1,
+  heartbeat_at = CURRENT_TIMESTAMP,
+  lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => :lease_seconds)
+WHERE (lease.run_id, lease.table_name, lease.shard_id) = (
+  SELECT run_id, table_name, shard_id FROM etl_shard_lease
+  WHERE run_id = :run_id AND table_name = :table_name
+    AND (status = 'pending' OR (status = 'leased' AND lease_expires_at < CURRENT_TIMESTAMP))
+  ORDER BY shard_id
+  LIMIT 1
+  FOR UPDATE SKIP LOCKED
+)
+RETURNING lease.shard_id;
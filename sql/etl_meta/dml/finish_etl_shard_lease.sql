@@ -0,0 +1,9 @@
+-- 임대 중인 샤드를 완료(done)하거나, 실패 시 다른 워커가 가져갈 수 있도록 반납(pending)합니다.
+
+UPDATE etl_shard_lease SET
+  status = :status,
+  heartbeat_at = CURRENT_TIMESTAMP,
+  lease_expires_at = NULL
+WHERE run_id = :run_id AND table_name = :table_name AND shard_id = :shard_id
+  AND owner = :owner AND status = 'leased'
+RETURNING shard_id;
@@ -0,0 +1,8 @@
+-- 임대 중인 샤드의 만료 시간을 연장합니다. 임대를 잃었으면(다른 워커가 회수) 갱신되는 행이 없습니다.
+
+UPDATE etl_shard_lease SET
+  heartbeat_at = CURRENT_TIMESTAMP,
+  lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => :lease_seconds)
+WHERE run_id = :run_id AND table_name = :table_name AND shard_id = :shard_id
+  AND owner = :owner AND status = 'leased'
+RETURNING shard_id;
@@ -0,0 +1,7 @@
+-- etl_checkpoint에 완료된 작업을 기록합니다.
+-- 같은 작업이 다시 완료되면 완료 시간만 갱신합니다.
+
+INSERT INTO etl_checkpoint (run_id, table_name, ticker, start_date, end_date)
+VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (run_id, table_name, ticker, start_date, end_date) DO UPDATE SET
+  completed_at = CURRENT_TIMESTAMP;
@@ -0,0 +1,9 @@
+-- etl_run_metrics에 수집 실행 지표를 기록합니다.
+
+INSERT INTO etl_run_metrics (
+  run_id, table_name, started_at, elapsed_seconds, calls, retries, errors,
+  latency_p50_ms, latency_p95_ms, latency_p99_ms, response_bytes, rows_fetched, rows_written,
+  rows_per_second, fetch_seconds, transform_seconds, insert_seconds, summary
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb)
+ON CONFLICT (run_id, table_name, started_at) DO NOTHING;
@@ -0,0 +1,32 @@
+-- kr_stock_basic_info(상장/폐지/시장/지수 편입)와 kr_stock_price_basic(거래 대금)으로 국내 주식 유니버스를 갱신합니다.
+-- 값이 바뀐 종목만 UPDATE하여 불필요한 튜플 재작성을 피합니다.
+
+WITH source AS (
+  SELECT
+    b.ticker,
+    CASE
+      WHEN NULLIF(NULLIF(b.lstg_abol_dt, ''), '00000000') <= to_char(CURRENT_DATE, 'YYYYMMDD') THEN 'delisted'
+      WHEN b.tr_stop_yn = 'Y' THEN 'suspended'
+      ELSE 'active'
+    END AS status,
+    NULLIF(b.mket_id_cd, '') AS market,
+    b.kospi200_item_yn = 'Y' AS kospi200,
+    LEAST(NULLIF(NULLIF(b.scts_mket_lstg_dt, ''), '00000000'), NULLIF(NULLIF(b.kosdaq_mket_lstg_dt, ''), '00000000')) AS listing_date,
+    NULLIF(NULLIF(b.lstg_abol_dt, ''), '00000000') AS delisting_date,
+    CASE WHEN p.acml_tr_pbmn ~ '^-?[0-9]+(\.[0-9]+)?$' THEN p.acml_tr_pbmn::NUMERIC END AS trading_value
+  FROM kr_stock_basic_info AS b
+  LEFT JOIN kr_stock_price_basic AS p ON p.ticker = b.ticker
+)
+UPDATE etl_universe AS u SET
+  status = s.status,
+  market = s.market,
+  kospi200 = s.kospi200,
+  listing_date = s.listing_date,
+  delisting_date = s.delisting_date,
+  trading_value = s.trading_value,
+  updated_at = CURRENT_TIMESTAMP
+FROM source AS s
+WHERE u.asset = 'kr_stock' AND u.ticker = s.ticker
+  AND (u.status, u.market, u.kospi200, u.listing_date, u.delisting_date, u.trading_value)
+    IS DISTINCT FROM (s.status, s.market, s.kospi200, s.listing_date, s.delisting_date, s.trading_value)
+RETURNING u.ticker;
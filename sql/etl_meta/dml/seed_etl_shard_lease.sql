@@ -0,0 +1,5 @@
+-- 실행(run)의 샤드 임대 행을 미리 만들어 둡니다. 이미 존재하면 그대로 둡니다.
+
+INSERT INTO etl_shard_lease (run_id, table_name, shard_id)
+SELECT :run_id, :table_name, shard_id FROM generate_series(0, :shard_count - 1) AS shard_id
+ON CONFLICT (run_id, table_name, shard_id) DO NOTHING;
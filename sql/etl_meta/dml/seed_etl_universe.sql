@@ -0,0 +1,5 @@
+-- etl_universe에 종목코드를 등록합니다. 이미 등록된 종목은 그대로 둡니다.
+
+INSERT INTO etl_universe (asset, ticker)
+VALUES (%s, %s)
+ON CONFLICT (asset, ticker) DO NOTHING;
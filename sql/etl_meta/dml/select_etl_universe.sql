@@ -0,0 +1,6 @@
+-- 자산의 유니버스 전체를 조회합니다. (필터링은 스냅샷을 읽는 쪽에서 수행)
+
+SELECT ticker, status, market, kospi200, listing_date, delisting_date, trading_value::DOUBLE PRECISION
+FROM etl_universe
+WHERE asset = :asset
+ORDER BY ticker;
@@ -0,0 +1,8 @@
+-- etl_row_hash에 (테이블, 키)별 행 해시를 기록합니다.
+-- 이미 존재하면 새 해시로 갱신합니다.
+
+INSERT INTO etl_row_hash (table_name, row_key, row_hash)
+VALUES (%s, %s, %s)
+ON CONFLICT (table_name, row_key) DO UPDATE SET
+  row_hash = EXCLUDED.row_hash,
+  updated_at = CURRENT_TIMESTAMP;
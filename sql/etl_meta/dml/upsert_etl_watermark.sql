@@ -0,0 +1,8 @@
+-- etl_watermark에 (테이블, 종목)별 수집 완료 일자를 기록합니다.
+-- 이미 존재하면 더 늦은 일자로만 갱신합니다. (워터마크는 뒤로 가지 않음)
+
+INSERT INTO etl_watermark (table_name, ticker, watermark_date)
+VALUES (%s, %s, %s)
+ON CONFLICT (table_name, ticker) DO UPDATE SET
+  watermark_date = GREATEST(etl_watermark.watermark_date, EXCLUDED.watermark_date),
+  updated_at = CURRENT_TIMESTAMP;
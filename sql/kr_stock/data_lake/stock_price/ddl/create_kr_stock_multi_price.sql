@@ -0,0 +1,73 @@
+-- KIS(한국투자증권) API의 "[국내주식] 시세 > 관심종목(멀티종목) 시세조회"의 데이터를 수집
+-- 이 테이블은 API의 원본 데이터를 그대로 저장하는 Data Lake 역할 수행
+
+CREATE TABLE IF NOT EXISTS kr_stock_multi_price(
+  id SERIAL PRIMARY KEY,
+  ticker TEXT NOT NULL UNIQUE,
+  kospi_kosdaq_cls_name TEXT,
+  mrkt_trtm_cls_name TEXT,
+  hour_cls_code TEXT,
+  inter_shrn_iscd TEXT,
+  inter_kor_isnm TEXT,
+  inter2_prpr TEXT,
+  inter2_prdy_vrss TEXT,
+  prdy_vrss_sign TEXT,
+  prdy_ctrt TEXT,
+  acml_vol TEXT,
+  inter2_oprc TEXT,
+  inter2_hgpr TEXT,
+  inter2_lwpr TEXT,
+  inter2_llam TEXT,
+  inter2_mxpr TEXT,
+  inter2_askp TEXT,
+  inter2_bidp TEXT,
+  seln_rsqn TEXT,
+  shnu_rsqn TEXT,
+  total_askp_rsqn TEXT,
+  total_bidp_rsqn TEXT,
+  acml_tr_pbmn TEXT,
+  inter2_prdy_clpr TEXT,
+  oprc_vrss_hgpr_rate TEXT,
+  intr_antc_cntg_vrss TEXT,
+  intr_antc_cntg_vrss_sign TEXT,
+  intr_antc_cntg_prdy_ctrt TEXT,
+  intr_antc_vol TEXT,
+  inter2_sdpr TEXT,
+  -- 데이터 수집 시간을 기록
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 각 컬럼에 대한 설명(주석)을 추가
+COMMENT ON TABLE kr_stock_multi_price IS '국내 주식 관심종목(멀티종목) 시세 원본 데이터 테이블';
+COMMENT ON COLUMN kr_stock_multi_price.id IS '행 고유 ID';
+COMMENT ON COLUMN kr_stock_multi_price.ticker IS '데이터 조회의 기준이 된 종목코드';
+COMMENT ON COLUMN kr_stock_multi_price.kospi_kosdaq_cls_name IS '코스피 코스닥 구분 명';
+COMMENT ON COLUMN kr_stock_multi_price.mrkt_trtm_cls_name IS '시장 조치 구분 명';
+COMMENT ON COLUMN kr_stock_multi_price.hour_cls_code IS '시간 구분 코드';
+COMMENT ON COLUMN kr_stock_multi_price.inter_shrn_iscd IS '관심 단축 종목코드';
+COMMENT ON COLUMN kr_stock_multi_price.inter_kor_isnm IS '관심 한글 종목명';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_prpr IS '관심2 현재가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_prdy_vrss IS '관심2 전일 대비';
+COMMENT ON COLUMN kr_stock_multi_price.prdy_vrss_sign IS '전일 대비 부호';
+COMMENT ON COLUMN kr_stock_multi_price.prdy_ctrt IS '전일 대비율';
+COMMENT ON COLUMN kr_stock_multi_price.acml_vol IS '누적 거래량';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_oprc IS '관심2 시가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_hgpr IS '관심2 고가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_lwpr IS '관심2 저가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_llam IS '관심2 하한가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_mxpr IS '관심2 상한가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_askp IS '관심2 매도호가';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_bidp IS '관심2 매수호가';
+COMMENT ON COLUMN kr_stock_multi_price.seln_rsqn IS '매도 잔량';
+COMMENT ON COLUMN kr_stock_multi_price.shnu_rsqn IS '매수2 잔량';
+COMMENT ON COLUMN kr_stock_multi_price.total_askp_rsqn IS '총 매도호가 잔량';
+COMMENT ON COLUMN kr_stock_multi_price.total_bidp_rsqn IS '총 매수호가 잔량';
+COMMENT ON COLUMN kr_stock_multi_price.acml_tr_pbmn IS '누적 거래 대금';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_prdy_clpr IS '관심2 전일 종가';
+COMMENT ON COLUMN kr_stock_multi_price.oprc_vrss_hgpr_rate IS '시가 대비 최고가 비율';
+COMMENT ON COLUMN kr_stock_multi_price.intr_antc_cntg_vrss IS '관심 예상 체결 대비';
+COMMENT ON COLUMN kr_stock_multi_price.intr_antc_cntg_vrss_sign IS '관심 예상 체결 대비 부호';
+COMMENT ON COLUMN kr_stock_multi_price.intr_antc_cntg_prdy_ctrt IS '관심 예상 체결 전일 대비율';
+COMMENT ON COLUMN kr_stock_multi_price.intr_antc_vol IS '관심 예상 거래량';
+COMMENT ON COLUMN kr_stock_multi_price.inter2_sdpr IS '관심2 기준가';
+COMMENT ON COLUMN kr_stock_multi_price.updated_at IS '데이터 마지막 수집 시간';
\ No newline at end of file
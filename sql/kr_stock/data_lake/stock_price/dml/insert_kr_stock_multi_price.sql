@@ -0,0 +1,44 @@
+-- kr_stock_multi_price 테이블에 데이터를 삽입하거나,
+-- ticker가 동일한 데이터가 이미 존재하는 경우 최신 정보로 업데이트합니다. (UPSERT)
+
+INSERT INTO kr_stock_multi_price (
+  ticker, kospi_kosdaq_cls_name, mrkt_trtm_cls_name, hour_cls_code, inter_shrn_iscd, inter_kor_isnm,
+  inter2_prpr, inter2_prdy_vrss, prdy_vrss_sign, prdy_ctrt, acml_vol, inter2_oprc,
+  inter2_hgpr, inter2_lwpr, inter2_llam, inter2_mxpr, inter2_askp, inter2_bidp,
+  seln_rsqn, shnu_rsqn, total_askp_rsqn, total_bidp_rsqn, acml_tr_pbmn, inter2_prdy_clpr,
+  oprc_vrss_hgpr_rate, intr_antc_cntg_vrss, intr_antc_cntg_vrss_sign, intr_antc_cntg_prdy_ctrt, intr_antc_vol, inter2_sdpr
+) VALUES (
+  %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+  %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+)
+ON CONFLICT (ticker) DO UPDATE SET
+  kospi_kosdaq_cls_name = EXCLUDED.kospi_kosdaq_cls_name,
+  mrkt_trtm_cls_name = EXCLUDED.mrkt_trtm_cls_name,
+  hour_cls_code = EXCLUDED.hour_cls_code,
+  inter_shrn_iscd = EXCLUDED.inter_shrn_iscd,
+  inter_kor_isnm = EXCLUDED.inter_kor_isnm,
+  inter2_prpr = EXCLUDED.inter2_prpr,
+  inter2_prdy_vrss = EXCLUDED.inter2_prdy_vrss,
+  prdy_vrss_sign = EXCLUDED.prdy_vrss_sign,
+  prdy_ctrt = EXCLUDED.prdy_ctrt,
+  acml_vol = EXCLUDED.acml_vol,
+  inter2_oprc = EXCLUDED.inter2_oprc,
+  inter2_hgpr = EXCLUDED.inter2_hgpr,
+  inter2_lwpr = EXCLUDED.inter2_lwpr,
+  inter2_llam = EXCLUDED.inter2_llam,
+  inter2_mxpr = EXCLUDED.inter2_mxpr,
+  inter2_askp = EXCLUDED.inter2_askp,
+  inter2_bidp = EXCLUDED.inter2_bidp,
+  seln_rsqn = EXCLUDED.seln_rsqn,
+  shnu_rsqn = EXCLUDED.shnu_rsqn,
+  total_askp_rsqn = EXCLUDED.total_askp_rsqn,
+  total_bidp_rsqn = EXCLUDED.total_bidp_rsqn,
+  acml_tr_pbmn = EXCLUDED.acml_tr_pbmn,
+  inter2_prdy_clpr = EXCLUDED.inter2_prdy_clpr,
+  oprc_vrss_hgpr_rate = EXCLUDED.oprc_vrss_hgpr_rate,
+  intr_antc_cntg_vrss = EXCLUDED.intr_antc_cntg_vrss,
+  intr_antc_cntg_vrss_sign = EXCLUDED.intr_antc_cntg_vrss_sign,
+  intr_antc_cntg_prdy_ctrt = EXCLUDED.intr_antc_cntg_prdy_ctrt,
+  intr_antc_vol = EXCLUDED.intr_antc_vol,
+  inter2_sdpr = EXCLUDED.inter2_sdpr,
+  updated_at = CURRENT_TIMESTAMP;
\ No newline at end of file
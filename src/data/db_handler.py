@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import pandas as pd
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -118,47 +118,86 @@ class DBHandler:
     except Exception as e:
       print(f"❌ 동적 테이블 생성 및 데이터 저장 중 에러 발생: {e}")
 
-  def insert_data(self, df: pd.DataFrame, path: str):
+  def insert_data(self, df: pd.DataFrame, path: str, companion_rows: Optional[Dict[str, List[tuple]]] = None) -> bool:
     """DataFrame의 데이터를 데이터베이스에 대량 삽입(Bulk Insert)합니다.
 
     .sql 파일에서 INSERT 문을 로드한 후, DBAPI의 'executemany'를 사용하여 
     Pandas DataFrame의 데이터를 효율적으로 삽입합니다.
+    companion_rows가 주어지면 같은 트랜잭션 안에서 함께 실행하므로,
+    수집 메타데이터(워터마크 등)가 데이터와 항상 함께 커밋되거나 함께 롤백됩니다.
 
     Args:
       df (pd.DataFrame): 데이터베이스에 삽입할 데이터가 담긴 DataFrame.
       path (str): 실행할 INSERT 문이 포함된 .sql 파일의 경로.
+      companion_rows (Dict[str, List[tuple]] | None): 함께 실행할 .sql 파일 경로 -> 파라미터 튜플 목록.
+
+    Returns:
+      bool: 커밋에 성공하면 True, 저장하지 못했거나 오류가 발생하면 False.
+        (저장할 데이터가 없는 경우는 True)
     """
     if self.engine is None:
       print("❌ DB 엔진이 없어 저장을 건너뜁니다.")
-      return
+      return False
 
-    if df.empty:
+    companion_rows = {sql_path: rows for sql_path, rows in (companion_rows or {}).items() if rows}
+    if df.empty and not companion_rows:
       print("저장할 데이터가 없어 DB 저장을 건너뜁니다.")
-      return
+      return True
     
-    insert_sql = self._load_sql(path)
-    if not insert_sql: 
-      return
+    statements = [(path, [tuple(row) for row in df.itertuples(index=False)])] if not df.empty else []
+    statements += list(companion_rows.items())
+    loaded = [(self._load_sql(sql_path), rows) for sql_path, rows in statements]
+    if not all(sql for sql, _ in loaded):
+      return False
     
     # SQLAlchemy 엔진에서 기본 DBAPI 연결(raw_connection)을 가져옵니다.
     conn = self.engine.raw_connection()
     try:
       with conn.cursor() as cursor:
-        # DataFrame의 각 행을 튜플로 변환하여 리스트를 생성합니다.
-        data_tuples = [tuple(row) for row in df.itertuples(index=False)]
-        
         # executemany는 튜플의 리스트를 받아 대량 INSERT를 수행하는 데 최적화되어 있습니다.
-        cursor.executemany(insert_sql, data_tuples)
+        for sql, rows in loaded:
+          cursor.executemany(sql, rows)
           
       conn.commit()
-      print(f"✅ 총 {len(data_tuples)}개 행 INSERT 성공!")
+      print(f"✅ 총 {len(df)}개 행 INSERT 성공!")
+      return True
     except Exception as e:
       print(f"❌ INSERT 작업 중 에러 발생: {e}")
       conn.rollback()
+      return False
     finally:
       conn.close()
 
 
+  def execute_sql(self, path: str, params: Optional[dict] = None) -> List[tuple] | None:
+    """.sql 파일의 단일 문(이름 기반 파라미터 `:name`)을 하나의 트랜잭션으로 실행합니다.
+
+    임대(lease) 획득처럼 조회와 갱신을 한 문으로 처리하는 메타데이터 작업에 사용합니다.
+
+    Args:
+      path (str): 실행할 SQL 문이 포함된 .sql 파일의 경로.
+      params (dict | None): 바인딩할 파라미터.
+
+    Returns:
+      List[tuple] | None: RETURNING/SELECT 결과 행 목록 (결과가 없는 문은 빈 리스트).
+        엔진이 없거나 오류가 발생하면 None.
+    """
+    if self.engine is None:
+      print("❌ DB 엔진이 없어 SQL 실행을 건너뜁니다.")
+      return None
+
+    sql = self._load_sql(path)
+    if not sql:
+      return None
+
+    try:
+      with self.engine.begin() as conn:
+        result = conn.execute(text(sql), params or {})
+        return [tuple(row) for row in result] if result.returns_rows else []
+    except Exception as e:
+      print(f"❌ SQL 실행 중 에러 발생 ({path}): {e}")
+      return None
+
   def get_latest_date(self, table_name: str, date_column: str, default_start_date: str) -> str:
     """특정 테이블의 날짜 컬럼에서 가장 최근 날짜를 조회합니다.
 
@@ -202,6 +241,129 @@ class DBHandler:
       return default_start_date
 
 
+  def get_latest_dates_by_ticker(self, table_name: str, date_column: str) -> Dict[str, str]:
+    """특정 테이블의 종목(ticker)별 가장 최근 날짜를 조회합니다.
+
+    Args:
+      table_name (str): 조회할 테이블의 이름.
+      date_column (str): 날짜 정보가 들어있는 컬럼의 이름.
+
+    Returns:
+      Dict[str, str]: 종목코드 -> 가장 최근 날짜(YYYYMMDD). 테이블이 없거나 오류가 발생하면 빈 딕셔너리.
+    """
+    if self.engine is None:
+      return {}
+
+    try:
+      with self.engine.connect() as conn:
+        query_exists = text("SELECT EXISTS (SELECT FROM pg_tables WHERE schemaname = 'public' AND tablename = :table_name);")
+        if not conn.execute(query_exists, {"table_name": table_name}).scalar():
+          return {}
+
+        query = text(f'SELECT ticker, MAX("{date_column}") FROM {table_name} WHERE "{date_column}" IS NOT NULL GROUP BY ticker;')
+        return {ticker: str(latest) for ticker, latest in conn.execute(query)}
+
+    except Exception as e:
+      print(f"⚠️ 종목별 최근 날짜 조회 중 오류: {e}")
+      return {}
+
+  def get_watermarks(self, table_name: str) -> Dict[str, str]:
+    """etl_watermark 테이블에서 특정 테이블의 종목별 수집 완료 일자를 조회합니다.
+
+    Args:
+      table_name (str): 워터마크를 조회할 데이터 테이블의 이름.
+
+    Returns:
+      Dict[str, str]: 종목코드 -> 수집 완료 일자(YYYYMMDD). 조회할 수 없으면 빈 딕셔너리.
+    """
+    if self.engine is None:
+      return {}
+
+    try:
+      with self.engine.connect() as conn:
+        query = text("SELECT ticker, watermark_date FROM etl_watermark WHERE table_name = :table_name;")
+        return {ticker: watermark_date for ticker, watermark_date in conn.execute(query, {"table_name": table_name})}
+
+    except Exception as e:
+      print(f"⚠️ 워터마크 조회 중 오류: {e}")
+      return {}
+
+  def get_row_hashes(self, table_name: str) -> Dict[str, str]:
+    """etl_row_hash 테이블에서 특정 테이블의 키별 행 해시를 조회합니다.
+
+    Args:
+      table_name (str): 행 해시를 조회할 데이터 테이블의 이름.
+
+    Returns:
+      Dict[str, str]: 행 키 -> 행 해시. 조회할 수 없으면 빈 딕셔너리.
+    """
+    if self.engine is None:
+      return {}
+
+    try:
+      with self.engine.connect() as conn:
+        query = text("SELECT row_key, row_hash FROM etl_row_hash WHERE table_name = :table_name;")
+        return {row_key: row_hash for row_key, row_hash in conn.execute(query, {"table_name": table_name})}
+
+    except Exception as e:
+      print(f"⚠️ 행 해시 조회 중 오류: {e}")
+      return {}
+
+  def get_listing_dates(self, table_name: str = "kr_stock_basic_info") -> Dict[str, str]:
+    """종목 기본 정보 테이블에서 종목별 상장일자를 조회합니다.
+
+    유가증권시장/코스닥시장 상장일자 중 유효한(YYYYMMDD) 가장 이른 날짜를 상장일로 사용합니다.
+    (코스닥에서 유가증권시장으로 이전 상장한 종목은 최초 상장일 기준)
+
+    Args:
+      table_name (str): 상장일자 컬럼(scts_mket_lstg_dt, kosdaq_mket_lstg_dt)이 있는 테이블의 이름.
+
+    Returns:
+      Dict[str, str]: 종목코드 -> 상장일자(YYYYMMDD). 조회할 수 없으면 빈 딕셔너리.
+    """
+    if self.engine is None:
+      return {}
+
+    try:
+      with self.engine.connect() as conn:
+        query_exists = text("SELECT EXISTS (SELECT FROM pg_tables WHERE schemaname = 'public' AND tablename = :table_name);")
+        if not conn.execute(query_exists, {"table_name": table_name}).scalar():
+          return {}
+
+        query = text(f"SELECT ticker, scts_mket_lstg_dt, kosdaq_mket_lstg_dt FROM {table_name};")
+        listing_dates = {}
+        for ticker, *dates in conn.execute(query):
+          valid = [d for d in dates if d and len(d) == 8 and d.isdigit() and d != "00000000"]
+          if valid:
+            listing_dates[ticker] = min(valid)
+        return listing_dates
+
+    except Exception as e:
+      print(f"⚠️ 상장일자 조회 중 오류: {e}")
+      return {}
+
+  def get_checkpoints(self, table_name: str, run_id: str) -> Set[Tuple[str, str, str]]:
+    """etl_checkpoint 테이블에서 특정 실행의 완료된 작업을 조회합니다.
+
+    Args:
+      table_name (str): 완료 작업을 조회할 데이터 테이블의 이름.
+      run_id (str): 수집 실행 식별자.
+
+    Returns:
+      Set[Tuple[str, str, str]]: 완료된 (종목코드, 시작일, 종료일) 집합. 조회할 수 없으면 빈 집합.
+    """
+    if self.engine is None:
+      return set()
+
+    try:
+      with self.engine.connect() as conn:
+        query = text("SELECT ticker, start_date, end_date FROM etl_checkpoint WHERE run_id = :run_id AND table_name = :table_name;")
+        return {tuple(row) for row in conn.execute(query, {"run_id": run_id, "table_name": table_name})}
+
+    except Exception as e:
+      print(f"⚠️ 체크포인트 조회 중 오류: {e}")
+      return set()
+
   def save_df(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append'):
     """Pandas DataFrame을 PostgreSQL 테이블에 저장합니다.
 
@@ -162,19 +162,6 @@ class KrStockDividend:
   stk_kind: str    #주식종류
   high_divi_gb: str    #고배당종목여부
 
-@dataclass
-class KrStockEstimatePerform:
-  sht_cd: str    #ELW단축종목코드
-  item_kor_nm: str    #HTS한글종목명
-  name1: str    #ELW현재가
-  name2: str    #전일대비
-  estdate: str    #전일대비부호
-  rcmd_name: str    #전일대비율
-  capital: str    #누적거래량
-  forn_item_lmtrt: str    #행사가
-
-from dataclasses import dataclass
-
 @dataclass
 class KrStockEstimatePerform:
   # 기본 정보
@@ -606,4 +593,36 @@ class KrStockDailyItemchartprice:
   flng_cls_code: str    # 락 구분 코드
   prtt_rate: str    # 분할 비율
   mod_yn: str    # 변경 여부
-  revl_issu_reas: str    # 재평가사유코드
\ No newline at end of file
+  revl_issu_reas: str    # 재평가사유코드
+
+@dataclass
+class KrStockMultiPrice: # 국내 주식 관심종목(멀티종목) 시세
+  kospi_kosdaq_cls_name: str    # 코스피 코스닥 구분 명
+  mrkt_trtm_cls_name: str    # 시장 조치 구분 명
+  hour_cls_code: str    # 시간 구분 코드
+  inter_shrn_iscd: str    # 관심 단축 종목코드
+  inter_kor_isnm: str    # 관심 한글 종목명
+  inter2_prpr: str    # 관심2 현재가
+  inter2_prdy_vrss: str    # 관심2 전일 대비
+  prdy_vrss_sign: str    # 전일 대비 부호
+  prdy_ctrt: str    # 전일 대비율
+  acml_vol: str    # 누적 거래량
+  inter2_oprc: str    # 관심2 시가
+  inter2_hgpr: str    # 관심2 고가
+  inter2_lwpr: str    # 관심2 저가
+  inter2_llam: str    # 관심2 하한가
+  inter2_mxpr: str    # 관심2 상한가
+  inter2_askp: str    # 관심2 매도호가
+  inter2_bidp: str    # 관심2 매수호가
+  seln_rsqn: str    # 매도 잔량
+  shnu_rsqn: str    # 매수2 잔량
+  total_askp_rsqn: str    # 총 매도호가 잔량
+  total_bidp_rsqn: str    # 총 매수호가 잔량
+  acml_tr_pbmn: str    # 누적 거래 대금
+  inter2_prdy_clpr: str    # 관심2 전일 종가
+  oprc_vrss_hgpr_rate: str    # 시가 대비 최고가 비율
+  intr_antc_cntg_vrss: str    # 관심 예상 체결 대비
+  intr_antc_cntg_vrss_sign: str    # 관심 예상 체결 대비 부호
+  intr_antc_cntg_prdy_ctrt: str    # 관심 예상 체결 전일 대비율
+  intr_antc_vol: str    # 관심 예상 거래량
+  inter2_sdpr: str    # 관심2 기준가
@@ -0,0 +1,262 @@
+# src/data/schemas/schema_registry.py
+import ast
+import inspect
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, fields, is_dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import pandas as pd
+
+from src.data.schemas import KIS_schemas
+from src.errors.schema_errors import SchemaDriftError
+from src.utils.numeric_codec import decode_columns, decode_numeric
+
+_INSERT_PATTERN = re.compile(r"INSERT\s+INTO\s+[\w.\"]+\s*\(([^)]*)\)", re.IGNORECASE)
+_CONFLICT_PATTERN = re.compile(r"ON\s+CONFLICT\s*\(([^)]*)\)", re.IGNORECASE)
+_CREATE_PATTERN = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[\w.\"]+\s*\(", re.IGNORECASE)
+_COMMENT_PATTERN = re.compile(r"/\*.*?\*/|--[^\n]*", re.DOTALL)
+_CONSTRAINT_KEYWORDS = {"PRIMARY", "UNIQUE", "CONSTRAINT", "FOREIGN", "CHECK", "EXCLUDE"}
+
+# Python 타입 -> PostgreSQL 타입 (매핑에 없는 타입은 TEXT)
+SQL_TYPES: Dict[Type[Any], str] = {str: "TEXT", int: "INTEGER", float: "REAL"}
+
+# Python 타입 -> 컬럼(Series) 파서 (KIS 숫자 문자열 코덱 사용, 매핑에 없는 타입은 값을 그대로 사용)
+PARSERS: Dict[Type[Any], Callable[[pd.Series], pd.Series]] = {
+  int: lambda series: decode_numeric(series.to_frame(), integer=True)[0].iloc[:, 0],
+  float: lambda series: decode_numeric(series.to_frame())[0].iloc[:, 0],
+}
+
+def _split_columns(column_list: str) -> List[str]:
+  return [column.strip().strip('"') for column in column_list.split(",") if column.strip()]
+
+def parse_insert_columns(insert_sql: str) -> List[str]:
+  """INSERT INTO 테이블 (...) 절에서 컬럼 목록을 순서대로 추출합니다.
+
+  Raises:
+    ValueError: INSERT INTO (...) 절이 없는 경우 발생합니다.
+  """
+  match = _INSERT_PATTERN.search(insert_sql)
+  if not match:
+    raise ValueError("INSERT INTO 테이블 (...) 절을 찾을 수 없습니다.")
+  return _split_columns(match.group(1))
+
+def parse_conflict_columns(insert_sql: str) -> List[str]:
+  """INSERT 문의 ON CONFLICT (...) 절에서 키 컬럼 목록을 추출합니다.
+
+  Raises:
+    ValueError: ON CONFLICT 절이 없는 경우 발생합니다.
+  """
+  match = _CONFLICT_PATTERN.search(insert_sql)
+  if not match:
+    raise ValueError("INSERT 문에 ON CONFLICT (...) 절이 없어 행 키를 결정할 수 없습니다.")
+  return _split_columns(match.group(1))
+
+def parse_ddl_columns(create_sql: str) -> List[str]:
+  """CREATE TABLE 문에서 컬럼 이름을 순서대로 추출합니다. (주석과 테이블 제약 조건은 제외)
+
+  Raises:
+    ValueError: CREATE TABLE 문이 없는 경우 발생합니다.
+  """
+  create_sql = _COMMENT_PATTERN.sub("", create_sql)
+  match = _CREATE_PATTERN.search(create_sql)
+  if not match:
+    raise ValueError("CREATE TABLE 문을 찾을 수 없습니다.")
+
+  # 괄호 깊이를 따라가며 최상위 쉼표로 컬럼 정의를 나눕니다. (NUMERIC(10, 2) 같은 타입 인자 보호)
+  definitions, current, depth = [], [], 1
+  for char in create_sql[match.end():]:
+    if char == "(":
+      depth += 1
+    elif char == ")":
+      depth -= 1
+      if depth == 0:
+        break
+    if char == "," and depth == 1:
+      definitions.append("".join(current))
+      current = []
+    else:
+      current.append(char)
+  definitions.append("".join(current))
+
+  columns = []
+  for definition in definitions:
+    tokens = definition.split()
+    if tokens and tokens[0].upper() not in _CONSTRAINT_KEYWORDS:
+      columns.append(tokens[0].strip('"'))
+  return columns
+
+def to_table_name(schema_name: str) -> str:
+  """CamelCase 스키마 이름을 snake_case 테이블 이름으로 변환합니다. (예: KrStockPriceBasic -> kr_stock_price_basic)"""
+  s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', schema_name)
+  return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+@dataclass(frozen=True)
+class TableSchema:
+  """스키마(dataclass) 하나의 컴파일된 정보. 컬럼 순서, SQL 타입, 파서를 한 번만 계산해 둡니다."""
+  name: str
+  schema_class: type
+  table_name: str
+  columns: Tuple[str, ...]
+  sql_types: Dict[str, str]
+  parsers: Dict[str, Callable[[pd.Series], pd.Series]]
+  float_columns: Tuple[str, ...]
+  int_columns: Tuple[str, ...]
+  column_index: pd.Index
+
+  def reindex(self, df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame을 스키마 컬럼 순서로 정렬합니다. (없는 컬럼은 NaN)"""
+    return df.reindex(columns=self.column_index)
+
+  def parse(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """숫자형으로 선언된 컬럼을 타입별로 한 묶음씩 변환합니다. (src.utils.numeric_codec 참고)
+
+    Returns:
+      Tuple[pd.DataFrame, Dict[str, int]]: (변환된 DataFrame, 컬럼별 파싱 실패 수)
+    """
+    df, failures = decode_columns(df, self.float_columns)
+    df, int_failures = decode_columns(df, self.int_columns, integer=True)
+    return df, {**failures, **int_failures}
+
+@dataclass(frozen=True)
+class TableBinding:
+  """스키마와 INSERT/DDL SQL을 검증하여 묶은 정보. INSERT 문의 %s 순서대로 컬럼을 정렬합니다."""
+  schema: TableSchema
+  insert_sql_path: str
+  insert_columns: Tuple[str, ...]
+  key_columns: Tuple[str, ...]
+  column_index: pd.Index
+
+  def reindex(self, df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame을 INSERT 문의 컬럼 순서로 정렬합니다. (없는 컬럼은 NaN)"""
+    return df.reindex(columns=self.column_index)
+
+class SchemaRegistry:
+  """
+  스키마 모듈의 모든 dataclass를 처음 사용할 때 한 번만 분석하여 보관하는 레지스트리.
+
+  수집기, 변환기, SQL 생성기, 디버그 도구가 `fields(...)`를 매번 다시 계산하지 않고
+  이름 또는 클래스로 컴파일된 `TableSchema`를 바로 조회합니다. `bind`는 스키마와 INSERT/DDL SQL의
+  컬럼 구성을 비교하여, 어긋난 경우 데이터를 저장하기 전에 `SchemaDriftError`를 발생시킵니다.
+  """
+  def __init__(self, schemas_module: ModuleType = KIS_schemas):
+    """
+    Args:
+      schemas_module (ModuleType): @dataclass가 정의된 파이썬 모듈.
+    """
+    self.schemas_module = schemas_module
+    self._schemas: Dict[str, TableSchema] | None = None
+    self._bindings: Dict[Tuple[str, str, str | None], TableBinding] = {}
+    self._lock = threading.Lock()
+
+  def _build(self) -> Dict[str, TableSchema]:
+    """모듈의 dataclass를 분석합니다. 같은 이름의 클래스가 두 번 정의되어 있으면 SchemaDriftError가 발생합니다."""
+    tree = ast.parse(inspect.getsource(self.schemas_module))
+    duplicated = [name for name, count in Counter(node.name for node in tree.body if isinstance(node, ast.ClassDef)).items() if count > 1]
+    if duplicated:
+      raise SchemaDriftError(f"스키마 모듈에 같은 이름의 클래스가 중복 정의되어 있습니다: {duplicated}")
+
+    schemas = {}
+    for name, schema_class in inspect.getmembers(self.schemas_module, is_dataclass):
+      schema_fields = fields(schema_class)
+      columns = tuple(field.name for field in schema_fields)
+      schemas[name] = TableSchema(
+        name=name,
+        schema_class=schema_class,
+        table_name=to_table_name(name),
+        columns=columns,
+        sql_types={field.name: SQL_TYPES.get(field.type, "TEXT") for field in schema_fields},
+        parsers={field.name: PARSERS[field.type] for field in schema_fields if field.type in PARSERS},
+        float_columns=tuple(field.name for field in schema_fields if field.type is float),
+        int_columns=tuple(field.name for field in schema_fields if field.type is int),
+        column_index=pd.Index(columns),
+      )
+    return schemas
+
+  @property
+  def schemas(self) -> Dict[str, TableSchema]:
+    if self._schemas is None:
+      with self._lock:
+        if self._schemas is None:
+          self._schemas = self._build()
+    return self._schemas
+
+  def names(self) -> List[str]:
+    """등록된 모든 스키마의 이름을 반환합니다."""
+    return list(self.schemas)
+
+  def get(self, schema: type | str) -> TableSchema:
+    """스키마 이름 또는 dataclass로 컴파일된 스키마를 조회합니다.
+
+    Raises:
+      KeyError: 등록되지 않은 스키마인 경우 발생합니다.
+    """
+    name = schema if isinstance(schema, str) else schema.__name__
+    if name not in self.schemas:
+      raise KeyError(f"'{name}' 스키마를 찾을 수 없습니다.")
+    return self.schemas[name]
+
+  def bind(self, schema: type | str, insert_sql_path: str, create_sql_path: str | None = None) -> TableBinding:
+    """스키마를 INSERT(및 DDL) SQL과 묶고, 컬럼 구성이 어긋나지 않았는지 검증합니다. (경로별로 한 번만 검증)
+
+    - INSERT 문의 컬럼은 스키마 컬럼(과 'ticker')과 정확히 같아야 하고, %s 개수와도 일치해야 합니다.
+    - ON CONFLICT 키는 INSERT 컬럼에 포함되어야 합니다.
+    - DDL이 주어지면 INSERT 컬럼이 모두 테이블에 정의되어 있어야 합니다.
+
+    Args:
+      schema (type | str): 스키마 dataclass 또는 이름.
+      insert_sql_path (str): INSERT 문이 포함된 .sql 파일의 경로.
+      create_sql_path (str | None): CREATE TABLE 문이 포함된 .sql 파일의 경로.
+
+    Returns:
+      TableBinding: INSERT 컬럼 순서와 키 컬럼이 담긴 바인딩.
+
+    Raises:
+      SchemaDriftError: 스키마와 SQL의 컬럼 구성이 어긋난 경우 발생합니다.
+    """
+    table_schema = self.get(schema)
+    cache_key = (table_schema.name, insert_sql_path, create_sql_path)
+    if cache_key in self._bindings:
+      return self._bindings[cache_key]
+
+    with open(insert_sql_path, "r", encoding="utf-8") as file:
+      insert_sql = file.read()
+    insert_columns = parse_insert_columns(insert_sql)
+    key_columns = parse_conflict_columns(insert_sql) if _CONFLICT_PATTERN.search(insert_sql) else []
+
+    problems = []
+    expected = set(table_schema.columns) | {"ticker"}
+    if missing := sorted(expected - set(insert_columns)):
+      problems.append(f"INSERT 문에 없는 스키마 컬럼 {missing}")
+    if extra := sorted(set(insert_columns) - expected):
+      problems.append(f"스키마에 없는 INSERT 컬럼 {extra}")
+    if (placeholders := _COMMENT_PATTERN.sub("", insert_sql).count("%s")) != len(insert_columns):
+      problems.append(f"INSERT 컬럼 {len(insert_columns)}개와 %s {placeholders}개 불일치")
+    if missing_keys := sorted(set(key_columns) - set(insert_columns)):
+      problems.append(f"INSERT 컬럼에 없는 ON CONFLICT 키 {missing_keys}")
+    if create_sql_path:
+      with open(create_sql_path, "r", encoding="utf-8") as file:
+        ddl_columns = set(parse_ddl_columns(file.read()))
+      if missing_in_ddl := [col for col in insert_columns if col not in ddl_columns]:
+        problems.append(f"DDL에 정의되지 않은 INSERT 컬럼 {missing_in_ddl}")
+    if problems:
+      raise SchemaDriftError(f"[{table_schema.name}] 스키마와 SQL이 어긋났습니다 ({insert_sql_path}): " + "; ".join(problems))
+
+    binding = TableBinding(
+      schema=table_schema,
+      insert_sql_path=insert_sql_path,
+      insert_columns=tuple(insert_columns),
+      key_columns=tuple(key_columns),
+      column_index=pd.Index(insert_columns),
+    )
+    self._bindings[cache_key] = binding
+    return binding
+
+# 프로젝트 전역에서 공유하는 KIS 스키마 레지스트리
+SCHEMA_REGISTRY = SchemaRegistry()
+
+def get_schema(schema: type | str) -> TableSchema:
+  """KIS 스키마 레지스트리에서 컴파일된 스키마를 조회합니다. (SchemaRegistry.get 참고)"""
+  return SCHEMA_REGISTRY.get(schema)
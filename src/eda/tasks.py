@@ -1,9 +1,10 @@
 # src/tasks.py
 import warnings
 import pandas as pd
-import numpy as np
 from abc import ABC, abstractmethod
 
+from src.utils.numeric_codec import decode_columns, null_mask, report_failures
+
 class Task(ABC):
   """모든 전처리 작업의 기본이 되는 추상 클래스"""
   @abstractmethod
@@ -11,18 +12,16 @@ class Task(ABC):
     pass
 
 class MissingValueCleaner(Task):
-  """빈 문자열과 설정된 값들을 결측값(NaN)으로 변환하는 작업"""
+  """빈 문자열과 설정된 값들을 결측값(NaN)으로 변환하는 작업 (숫자 코덱의 결측 규칙 사용)"""
   def __init__(self, values_to_replace=None):
-    self.values_to_replace = values_to_replace if values_to_replace else [['0', 0]]
+    self.values_to_replace = values_to_replace if values_to_replace else ['0', 0]
 
   def execute(self, df: pd.DataFrame, verbose: bool) -> pd.DataFrame:
-    with warnings.catch_warnings():
-      warnings.simplefilter("ignore", FutureWarning)
-      
-      for col in df.select_dtypes(include='object').columns:
-        df[col] = df[col].replace(r'^\s*$', np.nan, regex=True).infer_objects(copy=False)
-        for val in self.values_to_replace:
-          df[col] = df[col].replace(val, np.nan).infer_objects(copy=False)
+    # 모든 문자열 컬럼의 결측 위치를 한 번에 계산합니다.
+    object_cols = df.select_dtypes(include='object').columns
+    if len(object_cols):
+      mask = null_mask(df[object_cols], self.values_to_replace)
+      df[object_cols] = df[object_cols].mask(mask).infer_objects()
           
     return df
 
@@ -167,20 +166,11 @@ class ManualTypeConverter(Task):
         # 숫자 타입 (int, float) 공통 전처리
         # dtype 문자열을 소문자로 변환하여 'int' 또는 'float' 포함 여부 확인
         if 'int' in dtype.lower() or 'float' in dtype.lower():
-          # 여러 컬럼에 대해 쉼표(,) 제거를 한 번에 수행
-          for col in valid_cols:
-            if df[col].dtype == 'object':
-              df[col] = df[col].str.replace(',', '', regex=False)
-          
-          # 실제 타입 변환
-          if 'int' in dtype.lower():
-            # NaN을 지원하는 Int64로 안전하게 변환
-            df[valid_cols] = df[valid_cols].apply(pd.to_numeric, errors='coerce')
-            for col in valid_cols: # .astype('Int64')는 Series 단위로 적용
-              if not df[col].isnull().all():
-                df[col] = df[col].astype('Int64')
-          else: # float
-            df[valid_cols] = df[valid_cols].apply(pd.to_numeric, errors='coerce')
+          # 숫자 코덱으로 쉼표 제거와 숫자 변환을 컬럼 묶음 전체에 한 번에 수행합니다.
+          # int는 NaN을 지원하는 Int64로 변환합니다.
+          df, failures = decode_columns(df, valid_cols, integer='int' in dtype.lower())
+          if verbose:
+            report_failures(failures, f"ManualTypeConverter: {dtype}")
 
         # 날짜 타입
         elif 'datetime' in dtype.lower():
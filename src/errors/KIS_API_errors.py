@@ -8,4 +8,12 @@ class KISAuthenticationError(KISAPIError):
 
 class KISDataError(KISAPIError):
   """KIS API 데이터 조회 실패 시 발생하는 예외."""
-  pass
\ No newline at end of file
+  pass
+
+class KISRateLimitError(KISDataError):
+  """KIS API 호출 한도 초과(throttle) 응답 시 발생하는 예외. 재시도 대상입니다."""
+  pass
+
+class KISTransportError(KISDataError):
+  """네트워크 오류, 타임아웃, 서버 5xx 등 일시적인 전송 실패 시 발생하는 예외. 재시도 대상입니다."""
+  pass
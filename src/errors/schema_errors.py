@@ -0,0 +1,3 @@
+class SchemaDriftError(ValueError):
+  """스키마(dataclass)와 INSERT/DDL SQL의 컬럼 구성이 어긋났을 때 발생하는 예외."""
+  pass
@@ -1,15 +1,26 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import time
+from typing import Dict, List
+import os
+import threading
 from dotenv import load_dotenv
-from dataclasses import fields
 from tqdm import tqdm
-import pandas as pd
 
 from src.hooks.KIS_API_hook import KISAPIHook
-from src.utils.get_asset_list import get_asset_list
-from src.data.schemas.KIS_schemas import KrStockBasicInfo, KrStockBalanceSheet, KrStockFinancialRatio, KrStockGrowthRatio, KrStockIncomeStatement, KrStockOtherMajorRatio, KrStockProfitRatio, KrStockStabilityRatio, KrStockDividend, KrStockEstimatePerform, KrStockInvestOpinion, KrStockInvestOpbysec, KrStockPriceBasic, KrStockPriceDetail, KrStockAskingPrice, KrStockInvestor, KrStockMember, KrStockDailyItemchartprice
+from src.hooks.KIS_endpoints import KISEndpoint, get_endpoint
+from src.utils.trading_calendar import KRXTradingCalendar
+from src.data.schemas.KIS_schemas import KrStockBasicInfo, KrStockBalanceSheet, KrStockFinancialRatio, KrStockGrowthRatio, KrStockIncomeStatement, KrStockOtherMajorRatio, KrStockProfitRatio, KrStockStabilityRatio, KrStockDividend, KrStockEstimatePerform, KrStockInvestOpinion, KrStockInvestOpbysec, KrStockPriceBasic, KrStockPriceDetail, KrStockAskingPrice, KrStockInvestor, KrStockMember, KrStockDailyItemchartprice, KrStockMultiPrice
 from src.data.db_handler import DBHandler
+from src.data.schemas.schema_registry import SCHEMA_REGISTRY
 from src.etl.transformer.KIS_transformer import KISTransformer
+from src.etl.micro_batch_sink import MicroBatchSink
+from src.etl.watermark_store import WatermarkStore
+from src.etl.checkpoint_ledger import CheckpointLedger
+from src.etl.row_hash_index import RowHashIndex
+from src.etl.universe import load_universe
+from src.etl.run_report import save_run_summary
+from src.utils.telemetry import RunMetrics, bind_metrics
 
 # ----- [국내 주식 정보] CONFIG 정의 -----
 KR_STOCK_BASIC_INFO_CONFIG = {
@@ -126,10 +137,15 @@ KR_STOCK_DAILY_ITEMCHARTPRICE = {
   "description": "한국 주식 기간별 시세", "schemas": KrStockDailyItemchartprice,
   "asset": "kr_stock", "path": "daily_itemchartprice", "table_type": "stock_price",
   "transformer_name": "daily_itemchartprice",
-  "date_column": "itewhol_loan_rmnd_ratem", "default_start_date": "19810101",
+  "date_column": "stck_bsop_date", "default_start_date": "19810101",
   "params": { "stock_code": "{ticker}" , "start_date": "{start_date}", "end_date": "{end_date}" }
 }
 
+KR_STOCK_MULTI_PRICE = {
+  "description": "한국 주식 관심종목(멀티종목) 시세", "schemas": KrStockMultiPrice,
+  "asset": "kr_stock", "path": "multi_price", "table_type": "stock_price",
+}
+
 
 load_dotenv()
 
@@ -166,101 +182,291 @@ def generate_date_ranges(start_date_str: str, end_date_str: str, days_per_chunk:
 
     return ranges
 
-def KIS_collector(config: dict):
+def plan_date_ranges(start_date: str, end_date: str, calendar: KRXTradingCalendar, listing_date: str | None = None,
+                     trading_days_per_chunk: int | None = None) -> List[tuple]:
+  """종목 하나의 수집 기간을 상장일과 KRX 영업일 기준으로 요청 구간들로 나눕니다.
+
+  - 상장일 이전은 데이터가 있을 수 없으므로 시작일을 상장일로 당깁니다.
+  - trading_days_per_chunk가 주어지면(영업일마다 한 행을 반환하는 기간 조회) 구간마다 영업일을
+    정확히 그 수만큼 담아 요청 수를 최소화하고, 영업일이 없는 기간(주말, 휴장일)은 요청하지 않습니다.
+  - 그 외에는 달력 기준 100일 단위로 나눕니다.
+
+  Args:
+    start_date (str): 수집 시작일 (YYYYMMDD).
+    end_date (str): 수집 종료일 (YYYYMMDD).
+    calendar (KRXTradingCalendar): 영업일 달력.
+    listing_date (str | None): 종목의 상장일자 (YYYYMMDD). 알 수 없으면 None.
+    trading_days_per_chunk (int | None): 한 구간에 담을 영업일 수.
+
+  Returns:
+    List[tuple]: (시작일, 종료일) 튜플의 리스트. 수집할 기간이 없으면 빈 리스트.
+  """
+  if listing_date and listing_date > start_date:
+    start_date = listing_date
+  if start_date > end_date:
+    return []
+  if trading_days_per_chunk:
+    return calendar.pack_ranges(start_date, end_date, trading_days_per_chunk)
+  return generate_date_ranges(start_date, end_date, days_per_chunk=100)
+
+def compile_params_template(params_template: dict):
+  """CONFIG의 파라미터 템플릿을 한 번만 해석하여 호출 인자를 생성하는 함수로 변환합니다.
+
+  템플릿 값이 '{ticker}', '{start_date}', '{end_date}' 중 하나이면 수집 루프의 값으로 치환되고,
+  그 외의 값은 그대로 전달됩니다.
+
+  Args:
+    params_template (dict): 엔드포인트 인자명 -> 템플릿 값 딕셔너리.
+
+  Returns:
+    Callable[[str, str | None, str | None], dict]: (ticker, start_date, end_date)를 받아 호출 인자를 반환하는 함수.
+  """
+  placeholders = {"{ticker}": 0, "{start_date}": 1, "{end_date}": 2}
+  compiled = [(key, placeholders.get(value), value) for key, value in params_template.items()]
+
+  def build_params(ticker: str, start_date: str | None, end_date: str | None) -> dict:
+    values = (ticker, start_date, end_date)
+    return {key: values[index] if index is not None else value for key, index, value in compiled}
+
+  return build_params
+
+def _fetch_work_item(kis_hook: KISAPIHook, endpoint: KISEndpoint, params: dict, ticker: str) -> List[dict]:
+  """종목 하나의 (기간) 조회 결과를 모든 페이지에 걸쳐 수집하고 ticker를 표시합니다."""
+  rows = []
+  for api_response in kis_hook.iter_endpoint(endpoint, **params):
+    if not api_response: continue
+
+    if isinstance(api_response, dict): api_response = [api_response]
+    for item in api_response:
+      item['ticker'] = ticker
+    rows.extend(api_response)
+  return rows
+
+def _fetch_batch(kis_hook: KISAPIHook, endpoint: KISEndpoint, batch: List[str]) -> List[dict]:
+  """종목 묶음을 배치 엔드포인트로 조회하고, 응답 행을 종목별로 되돌려 놓습니다."""
+  rows = kis_hook.call_endpoint_batch(endpoint, batch)
+  for item in rows:
+    item['ticker'] = item.get(endpoint.batch_key_field)
+  return rows
+
+def _bounded_ordered_map(executor: ThreadPoolExecutor, fn, items: list, window: int):
+  """executor.map과 같이 입력 순서대로 결과를 반환하되, 동시에 제출하는 작업을 window개로 제한합니다.
+
+  소비자(적재)가 느리더라도 끝난 작업의 결과가 무한히 쌓이지 않도록 메모리를 제한합니다.
+  """
+  in_flight = deque()
+  for item in items:
+    if len(in_flight) >= window:
+      yield in_flight.popleft().result()
+    in_flight.append(executor.submit(fn, item))
+  while in_flight:
+    yield in_flight.popleft().result()
+
+def KIS_collector(config: dict, max_workers: int | None = None, kis_hook: KISAPIHook | None = None,
+                  db_handler: DBHandler | None = None, transformer: KISTransformer | None = None,
+                  max_batch_rows: int | None = None, max_batch_bytes: int | None = None,
+                  run_id: str | None = None, tickers: List[str] | None = None,
+                  stop_event: threading.Event | None = None) -> Dict[str, int]:
+  """CONFIG에 정의된 API 데이터를 전 종목에 대해 수집하여 DB에 저장합니다.
+
+  Args:
+    config (dict): 수집 대상 CONFIG.
+    max_workers (int | None): 동시에 요청할 작업 수. 지정하지 않으면 KIS_COLLECTOR_WORKERS
+      환경 변수(기본값 8)를 사용하며, 1이면 순차 수집합니다.
+    kis_hook (KISAPIHook | None): 공유할 훅. 지정하지 않으면 새로 생성합니다.
+    db_handler (DBHandler | None): 공유할 DB 핸들러. 지정하지 않으면 새로 생성합니다.
+    transformer (KISTransformer | None): 공유할 변환기. 지정하지 않으면 새로 생성합니다.
+    max_batch_rows (int | None): 한 번에 변환/저장할 최대 원본 행 수.
+      지정하지 않으면 KIS_SINK_MAX_ROWS 환경 변수(기본값 20000)를 사용합니다.
+    max_batch_bytes (int | None): 변환/저장 전 버퍼의 메모리 상한(바이트).
+      지정하지 않으면 KIS_SINK_MAX_MB 환경 변수(기본값 256MB)를 사용합니다.
+    run_id (str | None): 체크포인트 원장의 실행 식별자. 같은 run_id로 재실행하면 완료된 작업을 건너뜁니다.
+      지정하지 않으면 KIS_RUN_ID 환경 변수, 없으면 새 식별자를 생성합니다. (이전 실행을 이어받지 않음)
+    tickers (List[str] | None): 수집할 종목 목록 (분산 수집의 샤드 등). 지정하지 않으면 종목 유니버스에서
+      CONFIG의 `universe` 필터(markets, kospi200, min_trading_value 등)에 맞는 상장 종목을 수집합니다.
+    stop_event (threading.Event | None): 중단 이벤트. 설정되면(샤드 임대 상실 등) 남은 작업을 요청하지 않고,
+      아직 저장하지 않은 결과도 커밋하지 않고 종료합니다.
+
+  Returns:
+    Dict[str, int]: 수집 결과 요약 (rows: 저장된 행 수, failed: 실패한 작업 수, skipped: 이전 실행에서 완료되어 건너뛴 작업 수,
+      unchanged: 내용이 바뀌지 않아 저장하지 않은 행 수, discarded: 중단되어 저장하지 않은 작업 수).
+  """
+  max_workers = max_workers or int(os.getenv("KIS_COLLECTOR_WORKERS", "8"))
   desc = config["description"]
   asset, path, table_type = config["asset"], config["path"], config["table_type"]
   params_template = config.get("params", {})
   table_name = f"{config['asset']}_{config['path']}"
 
-  kis_hook, db_handler, transformer = KISAPIHook(), DBHandler(db_name="data_lake"), KISTransformer()
+  kis_hook = kis_hook or KISAPIHook()
+  db_handler = db_handler or DBHandler(db_name="data_lake")
+  transformer = transformer or KISTransformer()
   create_sql_path = f"./sql/{asset}/data_lake/{table_type}/ddl/create_{table_name}.sql"
   insert_sql_path = f"./sql/{asset}/data_lake/{table_type}/dml/insert_{table_name}.sql"
+
+  # 스키마와 INSERT/DDL의 컬럼 구성을 API 호출 전에 검증합니다. (어긋나면 SchemaDriftError)
+  binding = SCHEMA_REGISTRY.bind(config["schemas"], insert_sql_path, create_sql_path) if config.get("schemas") else None
   
   # tickers = ["005930","091990","105560","035420","373220","016360","207940","247540","017670","139480","004020","352820"] # Test Tickers
-  tickers = get_asset_list(config["asset"])
+  tickers = tickers if tickers is not None else load_universe(config["asset"], db_handler=db_handler, **config.get("universe", {}))
   
   db_handler.create_table(create_sql_path)
 
-  date_ranges = [(None, None)] # 날짜 파라미터가 없는 API를 위한 기본값
-  if config.get("date_column"):
-    latest_date = db_handler.get_latest_date(
-      table_name=table_name, 
-      date_column=config["date_column"],
-      default_start_date=config["default_start_date"]
-    )
+  # 엔드포인트와 파라미터 템플릿은 루프 밖에서 한 번만 해석합니다.
+  endpoint = get_endpoint(table_name)
+  build_params = compile_params_template(params_template)
+
+  # 기간 조회 API는 (테이블, 종목)별 워터마크로 종목마다 누락된 기간만 수집합니다.
+  watermark_store = WatermarkStore(db_handler) if config.get("date_column") else None
+  date_ranges: Dict[str, list] = {}
+  if watermark_store:
+    watermarks = watermark_store.load(table_name=table_name, date_column=config["date_column"])
+    start_dates = WatermarkStore.start_dates(watermarks, tickers, config["default_start_date"])
+    listing_dates = db_handler.get_listing_dates()
+    calendar = KRXTradingCalendar()
     today_str = datetime.today().strftime('%Y%m%d')
 
-    if latest_date > today_str:
+    # 영업일마다 한 행을 반환하는 기간 조회는 응답 1회 최대 행 수만큼 영업일을 묶어 구간별로 동시에 요청합니다.
+    # (달력이 휴장일을 빠뜨려 구간이 가득 차더라도 훅의 기간 이어 붙이기가 나머지를 가져옵니다)
+    trading_days_per_chunk = endpoint.max_rows if endpoint.max_rows and endpoint.date_field else None
+    for ticker, start_date in start_dates.items():
+      ranges = plan_date_ranges(start_date, today_str, calendar, listing_dates.get(ticker), trading_days_per_chunk)
+      if ranges:
+        date_ranges[ticker] = ranges
+
+    if not date_ranges:
       print(f"✅ [{desc}] 모든 데이터가 최신 상태입니다. 수집을 종료합니다.")
-      return
-    
-    date_ranges = generate_date_ranges(latest_date, today_str, days_per_chunk=100)
+      return {"rows": 0, "failed": 0, "skipped": 0, "unchanged": 0, "discarded": 0}
+    tickers = [ticker for ticker in tickers if ticker in date_ranges]
+
+  # 같은 실행(run_id)에서 이미 완료된 작업은 원장을 보고 건너뜁니다.
+  ledger = CheckpointLedger(db_handler, run_id=run_id or os.getenv("KIS_RUN_ID"))
+  completed = ledger.load(table_name)
+  metrics = RunMetrics(ledger.run_id, table_name)
+  print(f"[{desc}] 실행 '{ledger.run_id}' (중단되면 같은 run_id로 다시 실행하여 이어서 수집할 수 있습니다)")
+
+  # 수집 단위(work item): 배치 엔드포인트는 종목 묶음, 그 외에는 (종목, 기간) 조합입니다.
+  if endpoint.batch_size:
+    pending = [ticker for ticker in tickers if CheckpointLedger.work_key(ticker, None, None) not in completed]
+    skipped = len(tickers) - len(pending)
+    work_items = [(pending[i:i + endpoint.batch_size], None, None) for i in range(0, len(pending), endpoint.batch_size)]
+    fetch = lambda batch, start_chunk, end_chunk: _fetch_batch(kis_hook, endpoint, batch)
+  else:
+    planned = [(ticker, start_chunk, end_chunk) for ticker in tickers for start_chunk, end_chunk in date_ranges.get(ticker, [(None, None)])]
+    work_items = [item for item in planned if CheckpointLedger.work_key(*item) not in completed]
+    skipped = len(planned) - len(work_items)
+    fetch = lambda ticker, start_chunk, end_chunk: _fetch_work_item(kis_hook, endpoint, build_params(ticker, start_chunk, end_chunk), ticker)
+
+  if skipped:
+    print(f"⏭️ [{desc}] 실행 '{ledger.run_id}'에서 이미 완료된 작업 {skipped}건을 건너뜁니다.")
 
-  all_raw_results = []
-  for ticker in tqdm(tickers, desc=desc):
-    for start_chunk, end_chunk in date_ranges:
+  def run(work_item):
+    # 작업 스레드에 실행 지표를 연결하여, 공유 훅의 API 호출 지표를 이 실행으로 집계합니다.
+    with bind_metrics(metrics), metrics.stage("fetch"):
       try:
-        api_function = getattr(kis_hook, f"get_{asset}_{path}")
-        dynamic_params = {}
-        for key, value in params_template.items():
-          temp_value = value
-          if "{ticker}" in temp_value: temp_value = temp_value.replace("{ticker}", ticker)
-          if "{start_date}" in temp_value and start_chunk: temp_value = temp_value.replace("{start_date}", start_chunk)
-          if "{end_date}" in temp_value and end_chunk: temp_value = temp_value.replace("{end_date}", end_chunk)
-          dynamic_params[key] = temp_value
-        
-        api_response = api_function(**dynamic_params)
-        if not api_response: continue
-
-        if isinstance(api_response, dict): api_response = [api_response]
-        for item in api_response:
-          item['ticker'] = ticker
-        all_raw_results.extend(api_response)
-      
+        return fetch(*work_item), None
       except Exception as e:
-        tqdm.write(f"⚠️ '{ticker}' 처리 중 오류: {e}")
-      time.sleep(0.2)
-  
-  if not all_raw_results:
-    print("수집된 데이터가 없습니다."); return
+        return [], e
 
-  raw_df = pd.DataFrame(all_raw_results)
-  transformer_name = config.get("transformer_name")
-  
-  if transformer_name:
-    final_df = transformer.transform(transformer_name=transformer_name, raw_df=raw_df)
+  # 작업은 스레드 풀로 동시에 요청하되(호출 속도는 훅의 속도 제한기가 제어), 결과는 작업 순서대로
+  # 마이크로 배치 적재기로 흘려보내 상한을 넘을 때마다 변환/저장합니다. (전체 이력을 메모리에 모으지 않음)
+  # 스냅샷은 매 실행 같은 행을 다시 받으므로, 내용이 바뀐 행만 UPSERT하여 튜플 재작성을 줄입니다.
+  # 저장 전 컬럼 정렬은 INSERT 문의 %s 순서를 따릅니다. (스키마 필드 순서와 다를 수 있음)
+  if config.get("date_column"):
+    change_detector = None
+  elif binding is not None and binding.key_columns:
+    change_detector = RowHashIndex(db_handler, table_name, list(binding.key_columns))
   else:
-    final_df = raw_df
+    change_detector = RowHashIndex.from_insert_sql(db_handler, table_name, insert_sql_path)
+  sink = MicroBatchSink(
+    db_handler, insert_sql_path, transformer=transformer, transformer_name=config.get("transformer_name"),
+    columns=binding.column_index if binding is not None else None,
+    max_rows=max_batch_rows or int(os.getenv("KIS_SINK_MAX_ROWS", "20000")),
+    max_bytes=max_batch_bytes or int(float(os.getenv("KIS_SINK_MAX_MB", "256")) * 1024 * 1024),
+    change_detector=change_detector,
+    metrics=metrics,
+    schema=binding.schema if binding is not None else None,
+    stop_event=stop_event,
+  )
+
+  failed_items = []
+  failed_tickers = set()
+  with ThreadPoolExecutor(max_workers=max_workers) as executor, sink:
+    results = tqdm(_bounded_ordered_map(executor, run, work_items, window=max_workers * 2), total=len(work_items), desc=desc)
+    for index, (work_item, (rows, error)) in enumerate(zip(work_items, results)):
+      if stop_event is not None and stop_event.is_set():
+        tqdm.write(f"⚠️ [{desc}] 중단되어 남은 작업 {len(work_items) - index}건을 수집하지 않고 종료합니다.")
+        break
+      key, start_chunk, end_chunk = work_item
+      if error is None:
+        metrics.add("rows_fetched", len(rows))
+        # 워터마크는 앞선 기간이 모두 성공한 종목만 전진시켜, 실패한 구간을 다음 실행에서 다시 수집합니다.
+        failed_tickers.update(item[0] for item in sink.failed_work_items)
+        companion_rows = ledger.companion_rows(table_name, key if isinstance(key, list) else [key], start_chunk, end_chunk)
+        # 워터마크는 응답에 실제로 있는 마지막 기준일자까지만 전진시킵니다. (빈 응답의 기간은 다음 실행에서 다시 요청)
+        latest_date = WatermarkStore.latest_date(rows, config["date_column"]) if watermark_store else None
+        if latest_date and key not in failed_tickers:
+          companion_rows.append(WatermarkStore.companion_row(table_name, key, latest_date))
+        sink.add((tuple(key) if isinstance(key, list) else key, start_chunk, end_chunk), rows, companion_rows)
+        continue
+      metrics.add("failed_work_items")
+      for ticker in (key if isinstance(key, list) else [key]):
+        failed_tickers.add(ticker)
+        failed_items.append((ticker, start_chunk, end_chunk, type(error).__name__))
+      tqdm.write(f"⚠️ '{key}' 처리 중 오류: {error}")
+
+  # 저장에 실패한 묶음의 작업들도 실패로 기록합니다.
+  for key, start_chunk, end_chunk in sink.failed_work_items:
+    for ticker in (key if isinstance(key, tuple) else [key]):
+      failed_items.append((ticker, start_chunk, end_chunk, "InsertError"))
+
+  if failed_items:
+    print(f"⚠️ [{desc}] 재시도 후에도 실패한 요청 {len(failed_items)}건: {failed_items}")
   
-  if not final_df.empty and config.get("schemas"):
-    schema_columns = [field.name for field in fields(config["schemas"])]
-
-    sql_column_order = ['ticker'] + [col for col in schema_columns if col != 'ticker']
-
-    final_df = final_df.reindex(columns=sql_column_order)
-      
-  db_handler.insert_data(final_df, insert_sql_path)
-
+  if sink.rows_unchanged:
+    print(f"[{desc}] 변경되지 않은 {sink.rows_unchanged}개 행은 저장을 건너뛰었습니다.")
+  if sink.rows_written == 0:
+    print("수집된 데이터가 없습니다.")
+
+  # 실행 지표를 지표 테이블과 JSON 요약(KIS_METRICS_DIR)으로 남깁니다.
+  metrics.add("work_items", len(work_items))
+  metrics.add("skipped_work_items", skipped)
+  metrics.add("rows_unchanged", sink.rows_unchanged)
+  metrics.add("discarded_work_items", len(sink.discarded_work_items))
+  summary = metrics.summary()
+  save_run_summary(db_handler, summary)
+  print(f"📊 [{desc}] 호출 {summary['calls']}회 (재시도 {sum(summary['retries'].values())}회), "
+        f"p95 {summary['latency_ms']['p95']}ms, {summary['rows_per_second']} rows/s, 단계별 {summary['stage_seconds']}")
+  return {"rows": sink.rows_written, "failed": len(failed_items), "skipped": skipped, "unchanged": sink.rows_unchanged,
+          "discarded": len(sink.discarded_work_items)}
+
+
+# 일일 수집 대상 CONFIG 목록 (우선순위가 같으면 이 순서대로 시작합니다)
+KIS_COLLECTOR_CONFIGS = [
+  # ----- [국내 주식 정보] -----
+  KR_STOCK_BASIC_INFO_CONFIG,
+  KR_STOCK_BALANCE_SHEET_CONFIG,
+  KR_STOCK_INCOME_STATEMENT_CONFIG,
+  KR_STOCK_FINANCIAL_RATIO_CONFIG,
+  KR_STOCK_PROFIT_RATIO_CONFIG,
+  KR_STOCK_OTHER_MAJOR_RATIO_CONFIG,
+  KR_STOCK_STABILITY_RATIO_CONFIG,
+  KR_STOCK_GROWTH_RATIO_CONFIG,
+  KR_STOCK_DIVIDEND_CONFIG,
+  KR_STOCK_ESTIMATE_PERFORM_CONFIG,
+  KR_STOCK_INVEST_OPINION_CONFIG,
+  KR_STOCK_INVEST_OPBYSEC_CONFIG,
+  # ----- [국내 주식 시세] -----
+  KR_STOCK_PRICE_BASIC,
+  KR_STOCK_PRICE_DETAIL,
+  KR_STOCK_ASKING_PRICE,
+  KR_STOCK_INVESTOR,
+  KR_STOCK_MEMBER,
+  KR_STOCK_DAILY_ITEMCHARTPRICE,
+  KR_STOCK_MULTI_PRICE,
+]
 
 if __name__ == "__main__":
-  # ----- [국내 주식 정보] Collector -----
-  KIS_collector(KR_STOCK_BASIC_INFO_CONFIG)
-  KIS_collector(KR_STOCK_BALANCE_SHEET_CONFIG)
-  KIS_collector(KR_STOCK_INCOME_STATEMENT_CONFIG)
-  KIS_collector(KR_STOCK_FINANCIAL_RATIO_CONFIG)
-  KIS_collector(KR_STOCK_PROFIT_RATIO_CONFIG)
-  KIS_collector(KR_STOCK_OTHER_MAJOR_RATIO_CONFIG)
-  KIS_collector(KR_STOCK_STABILITY_RATIO_CONFIG)
-  KIS_collector(KR_STOCK_GROWTH_RATIO_CONFIG)
-  KIS_collector(KR_STOCK_DIVIDEND_CONFIG)
-  KIS_collector(KR_STOCK_ESTIMATE_PERFORM_CONFIG)
-  KIS_collector(KR_STOCK_INVEST_OPINION_CONFIG)
-  KIS_collector(KR_STOCK_INVEST_OPBYSEC_CONFIG)
-
-  # ----- [국내 주식 시세] Collector -----
-  KIS_collector(KR_STOCK_PRICE_BASIC)
-  KIS_collector(KR_STOCK_PRICE_DETAIL)
-  KIS_collector(KR_STOCK_ASKING_PRICE)
-  KIS_collector(KR_STOCK_INVESTOR)
-  KIS_collector(KR_STOCK_MEMBER)
-  KIS_collector(KR_STOCK_DAILY_ITEMCHARTPRICE)
\ No newline at end of file
+  # 모든 CONFIG를 하나의 훅/DB 엔진/호출 한도를 공유하는 실행기로 동시에 수집합니다.
+  from src.etl.collection_runner import CollectionRunner
+
+  CollectionRunner(KIS_COLLECTOR_CONFIGS).run()
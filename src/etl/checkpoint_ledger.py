@@ -0,0 +1,55 @@
+# src/etl/checkpoint_ledger.py
+import uuid
+from datetime import datetime
+from typing import List, Set, Tuple
+
+from src.data.db_handler import DBHandler
+
+WorkKey = Tuple[str, str, str]
+
+def new_run_id() -> str:
+  """새 수집 실행 식별자를 생성합니다. (예: '20240102-153012-1a2b3c4d')"""
+  return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+class CheckpointLedger:
+  """
+  수집 실행(run) 단위의 완료 작업 원장.
+
+  작업(종목, 기간)이 완료되면 데이터 INSERT와 같은 트랜잭션에서 원장에 기록되므로(`companion_rows`),
+  원장에 있는 작업은 데이터도 반드시 저장되어 있습니다. 같은 run_id로 다시 실행하면
+  완료된 작업을 건너뛰어, 중단된 대량 수집을 처음부터 다시 요청하지 않고 이어서 진행합니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_checkpoint.sql"
+  DML_PATH = "./sql/etl_meta/dml/insert_etl_checkpoint.sql"
+
+  def __init__(self, db_handler: DBHandler, run_id: str | None = None):
+    """
+    Args:
+      db_handler (DBHandler): 원장 테이블이 위치한 DB의 핸들러.
+      run_id (str | None): 수집 실행 식별자. 중단된 실행을 이어서 진행하려면 그 실행의 run_id를 다시 지정합니다.
+        지정하지 않으면 새 식별자를 생성하므로, 같은 날 다시 실행해도(장중 갱신, 데이터 수정 후 재수집 등)
+        이전 실행의 완료 작업을 건너뛰지 않고 모두 다시 수집합니다.
+    """
+    self.db_handler = db_handler
+    self.run_id = run_id or new_run_id()
+    db_handler.create_table(self.DDL_PATH)
+
+  @staticmethod
+  def work_key(ticker: str, start_date: str | None, end_date: str | None) -> WorkKey:
+    """작업을 원장의 키 (종목, 시작일, 종료일)로 변환합니다. 기간이 없으면 빈 문자열을 사용합니다."""
+    return ticker, start_date or "", end_date or ""
+
+  def load(self, table_name: str) -> Set[WorkKey]:
+    """현재 실행에서 이미 완료된 작업 키를 조회합니다.
+
+    Args:
+      table_name (str): 데이터 테이블명.
+
+    Returns:
+      Set[WorkKey]: 완료된 (종목, 시작일, 종료일) 집합.
+    """
+    return self.db_handler.get_checkpoints(table_name, self.run_id)
+
+  def companion_rows(self, table_name: str, tickers: List[str], start_date: str | None, end_date: str | None) -> List[Tuple[str, tuple]]:
+    """데이터 INSERT와 같은 트랜잭션에서 실행할 완료 기록 (SQL 경로, 파라미터) 목록을 반환합니다."""
+    return [(self.DML_PATH, (self.run_id, table_name, *self.work_key(ticker, start_date, end_date))) for ticker in tickers]
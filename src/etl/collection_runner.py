@@ -0,0 +1,152 @@
+# src/etl/collection_runner.py
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List
+
+from src.hooks.KIS_API_hook import KISAPIHook
+from src.data.db_handler import DBHandler
+from src.etl.transformer.KIS_transformer import KISTransformer
+from src.etl.KIS_collector import KIS_collector
+from src.etl.checkpoint_ledger import new_run_id
+from src.etl.shard_lease import collect_sharded
+
+class CollectionRunner:
+  """
+  여러 수집 CONFIG를 작업 그래프로 보고 동시에 실행하는 실행기.
+
+  모든 작업은 하나의 훅(커넥션 풀, 속도 제한기, 서킷 브레이커), 하나의 DB 엔진,
+  하나의 변환기를 공유하므로, 동시에 실행하더라도 전체 호출 속도는 앱 키의 한도를 넘지 않습니다.
+  전체 실행 시간은 각 단계의 합이 아니라 한도가 허용하는 최소 시간에 가까워집니다.
+
+  - 작업 이름은 `{asset}_{path}`(테이블명)이며, CONFIG의 `depends_on`(작업 이름 목록)으로 선행 작업을 지정합니다.
+  - 실행 가능한 작업 중에서는 스냅샷(`date_column`이 없는 CONFIG)을 기간 수집(backfill)보다 먼저 시작합니다.
+    CONFIG의 `priority`(작을수록 먼저)로 직접 지정할 수도 있습니다.
+  - 선행 작업이 실패하면 후행 작업은 실행하지 않고 실패로 기록합니다.
+  """
+  def __init__(self, configs: List[dict], max_parallel_jobs: int = 4, max_workers_per_job: int | None = None,
+               kis_hook: KISAPIHook | None = None, db_handler: DBHandler | None = None,
+               transformer: KISTransformer | None = None, run_id: str | None = None, shard_count: int | None = None):
+    """
+    Args:
+      configs (List[dict]): 실행할 수집 CONFIG 목록. 선언 순서는 우선순위가 같을 때의 실행 순서입니다.
+      max_parallel_jobs (int): 동시에 실행할 CONFIG 수.
+      max_workers_per_job (int | None): CONFIG 하나가 동시에 요청할 작업 수.
+        지정하지 않으면 KIS_COLLECTOR_WORKERS 환경 변수(기본값 8)를 사용합니다.
+      kis_hook (KISAPIHook | None): 공유할 훅. 지정하지 않으면 동시 요청 수에 맞는 커넥션 풀로 생성합니다.
+      db_handler (DBHandler | None): 공유할 DB 핸들러.
+      transformer (KISTransformer | None): 공유할 변환기.
+      run_id (str | None): 모든 작업이 공유할 체크포인트 실행 식별자. 지정하지 않으면 KIS_RUN_ID 환경 변수,
+        없으면 새 식별자를 생성합니다. 중단된 실행을 이어서 진행하려면 그 실행의 run_id를 다시 지정합니다.
+        샤드 수집에서는 모든 노드가 같은 값을 써야 하므로 반드시 지정해야 합니다.
+      shard_count (int | None): 지정하면 각 작업을 종목 샤드로 나누고 DB 임대로 샤드를 가져가며 수집합니다.
+        여러 노드에서 같은 run_id와 shard_count로 실행하면 작업을 중복 없이 나눠 처리합니다.
+        지정하지 않으면 KIS_SHARD_COUNT 환경 변수를 사용하며, 없으면 샤드 없이 전체 종목을 수집합니다.
+
+    Raises:
+      ValueError: 작업 이름이 중복되거나, 존재하지 않는 작업에 의존하거나, 의존 관계에 순환이 있는 경우,
+        또는 샤드 수집인데 run_id가 없는 경우 발생합니다.
+    """
+    self.jobs: Dict[str, dict] = {}
+    for config in configs:
+      name = f"{config['asset']}_{config['path']}"
+      if name in self.jobs:
+        raise ValueError(f"중복된 수집 작업입니다: '{name}'")
+      self.jobs[name] = config
+    self._order = {name: index for index, name in enumerate(self.jobs)}
+    self._validate_graph()
+
+    self.max_parallel_jobs = max_parallel_jobs
+    self.max_workers_per_job = max_workers_per_job or int(os.getenv("KIS_COLLECTOR_WORKERS", "8"))
+    self.kis_hook = kis_hook or KISAPIHook(pool_maxsize=max_parallel_jobs * self.max_workers_per_job)
+    self.db_handler = db_handler or DBHandler(db_name="data_lake")
+    self.transformer = transformer or KISTransformer()
+    self.shard_count = shard_count or int(os.getenv("KIS_SHARD_COUNT", "0")) or None
+    # 모든 작업이 같은 원장을 사용하도록 시작 시점에 고정합니다.
+    run_id = run_id or os.getenv("KIS_RUN_ID")
+    if self.shard_count and not run_id:
+      raise ValueError("샤드 수집은 모든 노드가 공유할 run_id(또는 KIS_RUN_ID 환경 변수)가 필요합니다.")
+    self.run_id = run_id or new_run_id()
+
+  def _validate_graph(self):
+    """의존 대상이 모두 존재하고 순환이 없는지 검사합니다."""
+    for name, config in self.jobs.items():
+      for dependency in config.get("depends_on", []):
+        if dependency not in self.jobs:
+          raise ValueError(f"'{name}'이(가) 존재하지 않는 작업 '{dependency}'에 의존합니다.")
+
+    visiting, visited = set(), set()
+    def visit(name: str):
+      if name in visited:
+        return
+      if name in visiting:
+        raise ValueError(f"수집 작업의 의존 관계에 순환이 있습니다: '{name}'")
+      visiting.add(name)
+      for dependency in self.jobs[name].get("depends_on", []):
+        visit(dependency)
+      visiting.discard(name)
+      visited.add(name)
+    for name in self.jobs:
+      visit(name)
+
+  def _priority(self, name: str):
+    """실행 우선순위 키. (명시적 priority, 스냅샷 우선, 선언 순서)"""
+    config = self.jobs[name]
+    default_priority = 1 if config.get("date_column") else 0
+    return (config.get("priority", default_priority), self._order[name])
+
+  def _run_job(self, name: str) -> Dict[str, int]:
+    kwargs = dict(
+      max_workers=self.max_workers_per_job, kis_hook=self.kis_hook,
+      db_handler=self.db_handler, transformer=self.transformer, run_id=self.run_id,
+    )
+    if self.shard_count:
+      return collect_sharded(self.jobs[name], shard_count=self.shard_count, **kwargs)
+    return KIS_collector(self.jobs[name], **kwargs)
+
+  def run(self) -> Dict[str, dict]:
+    """모든 작업을 의존 관계와 우선순위에 따라 동시에 실행합니다.
+
+    Returns:
+      Dict[str, dict]: 작업 이름별 결과. 각 결과는 status('success' | 'failed' | 'skipped'),
+        elapsed(초) 및 성공 시 수집 요약(rows, failed), 실패 시 error를 담습니다.
+    """
+    pending, results = set(self.jobs), {}
+    running: Dict[Future, tuple] = {}
+    started_at = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=self.max_parallel_jobs, thread_name_prefix="collection-job") as executor:
+      while pending or running:
+        # [1] 선행 작업이 실패한 작업은 건너뜁니다.
+        for name in sorted(pending, key=self._priority):
+          failed_dependencies = [d for d in self.jobs[name].get("depends_on", []) if d in results and results[d]["status"] != "success"]
+          if failed_dependencies:
+            pending.discard(name)
+            results[name] = {"status": "skipped", "error": f"선행 작업 실패: {failed_dependencies}", "elapsed": 0.0}
+
+        # [2] 선행 작업이 모두 성공한 작업을 우선순위 순서로 빈 슬롯만큼 시작합니다.
+        ready = [
+          name for name in sorted(pending, key=self._priority)
+          if all(results.get(d, {}).get("status") == "success" for d in self.jobs[name].get("depends_on", []))
+        ]
+        for name in ready[:self.max_parallel_jobs - len(running)]:
+          pending.discard(name)
+          running[executor.submit(self._run_job, name)] = (name, time.monotonic())
+
+        if not running:
+          continue
+
+        # [3] 하나 이상의 작업이 끝날 때까지 기다린 뒤 결과를 기록합니다.
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+          name, job_started_at = running.pop(future)
+          elapsed = time.monotonic() - job_started_at
+          try:
+            results[name] = {"status": "success", "elapsed": elapsed, **(future.result() or {})}
+          except Exception as e:
+            print(f"❌ [{name}] 수집 작업 실패: {e}")
+            results[name] = {"status": "failed", "error": str(e), "elapsed": elapsed}
+
+    succeeded = sum(result["status"] == "success" for result in results.values())
+    print(f"✅ 수집 작업 {succeeded}/{len(results)}건 완료 ({time.monotonic() - started_at:.1f}초)")
+    return results
@@ -0,0 +1,181 @@
+# src/etl/micro_batch_sink.py
+import sys
+import threading
+from contextlib import nullcontext
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.data.db_handler import DBHandler
+from src.etl.transformer.KIS_transformer import KISTransformer
+from src.data.schemas.schema_registry import TableSchema
+from src.etl.row_hash_index import RowHashIndex
+from src.utils.numeric_codec import report_failures
+from src.utils.telemetry import RunMetrics
+
+def estimate_row_bytes(row: Dict[str, Any]) -> int:
+  """API 응답 행(dict) 하나가 차지하는 메모리를 대략적으로 추정합니다."""
+  return sys.getsizeof(row) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in row.items())
+
+class MicroBatchSink:
+  """
+  수집된 API 행을 작은 묶음(micro-batch) 단위로 변환하고 DB에 저장하는 스트리밍 적재기.
+
+  작업(work item) 하나의 결과를 통째로 받아 버퍼에 쌓고, 버퍼의 행 수나 추정 메모리가
+  상한을 넘으면 즉시 컬럼 정렬 -> INSERT를 수행합니다. 변환 전략이 지정되면 결과를 받는 즉시
+  증분 변환 스트림(TransformStream)에 넣어 종목 단위로 변환하므로, 변환이 네트워크 I/O와 겹쳐 진행되고
+  버퍼에는 원본 대신 변환된 조각이 쌓입니다.
+  전체 이력을 한 번에 메모리에 올리지 않으며, 중간에 실패하더라도 이미 저장된 묶음은 보존됩니다.
+  작업과 함께 전달된 동반 행(워터마크 등)은 데이터와 같은 트랜잭션으로 저장됩니다.
+  변경 감지기(`change_detector`)가 주어지면 내용이 바뀌지 않은 행은 저장하지 않습니다.
+  중단 이벤트(`stop_event`)가 설정된 뒤에는 버퍼를 저장하지 않고 버립니다. (샤드 임대를 잃은 경우 등)
+  """
+  def __init__(self, db_handler: DBHandler, insert_sql_path: str, transformer: KISTransformer | None = None,
+               transformer_name: Optional[str] = None, columns: Optional[Sequence[str]] = None,
+               max_rows: int | None = 20000, max_bytes: int | None = 256 * 1024 * 1024,
+               change_detector: RowHashIndex | None = None, metrics: RunMetrics | None = None,
+               schema: TableSchema | None = None, stop_event: threading.Event | None = None):
+    """
+    Args:
+      db_handler (DBHandler): 저장에 사용할 DB 핸들러.
+      insert_sql_path (str): INSERT 문이 포함된 .sql 파일의 경로.
+      transformer (KISTransformer | None): 변환기. transformer_name이 있을 때만 사용합니다.
+      transformer_name (str | None): 적용할 변환 전략 이름. None이면 원본 행을 그대로 저장합니다.
+      columns (Sequence[str] | None): INSERT 문의 컬럼 순서. 지정하면 저장 전에 이 순서로 정렬합니다.
+      max_rows (int | None): 한 묶음에 받을 최대 원본 행 수. None이면 제한하지 않습니다.
+      max_bytes (int | None): 한 묶음에 받을 원본 행의 최대 추정 메모리(바이트). None이면 제한하지 않습니다.
+      change_detector (RowHashIndex | None): 행 해시 인덱스. 지정하면 새로 생겼거나 바뀐 행만 저장합니다.
+      metrics (RunMetrics | None): 실행 지표. 지정하면 변환/변경 감지/저장 단계의 소요 시간과 저장 행 수를 기록합니다.
+      schema (TableSchema | None): 저장 대상 스키마. 지정하면 숫자형 컬럼을 숫자 코덱으로 변환하고 파싱 실패 수를 기록합니다.
+      stop_event (threading.Event | None): 중단 이벤트. 설정되면 이후의 저장은 커밋하지 않고 버퍼의 작업을
+        `discarded_work_items`에 기록합니다.
+    """
+    self.db_handler = db_handler
+    self.insert_sql_path = insert_sql_path
+    self.transformer = transformer
+    self.transformer_name = transformer_name
+    self.columns = columns
+    self.max_rows = max_rows
+    self.max_bytes = max_bytes
+    self.change_detector = change_detector
+    self.metrics = metrics
+    self.schema = schema
+    self.stop_event = stop_event
+
+    self._stream = transformer.stream(transformer_name) if transformer_name else None
+    self._rows: List[Dict[str, Any]] = []
+    self._frames: List[pd.DataFrame] = []
+    self._row_count = 0
+    self._work_items: List[Hashable] = []
+    self._companion_rows: Dict[str, List[tuple]] = {}
+    self._bytes = 0
+    self.rows_written = 0
+    self.rows_unchanged = 0
+    self.flush_count = 0
+    self.failed_work_items: List[Hashable] = []
+    self.discarded_work_items: List[Hashable] = []
+
+  def add(self, work_item: Hashable, rows: List[Dict[str, Any]], companion_rows: Iterable[Tuple[str, tuple]] = ()):
+    """작업 하나의 수집 결과를 버퍼에 추가하고, 상한을 넘으면 저장합니다.
+
+    Args:
+      work_item (Hashable): 결과를 만든 작업의 식별자 (예: (ticker, start_date, end_date)).
+      rows (List[Dict[str, Any]]): 작업에서 수집한 원본 행 목록. 비어 있어도 작업은 기록됩니다.
+      companion_rows (Iterable[Tuple[str, tuple]]): 데이터와 같은 트랜잭션에서 실행할 (SQL 경로, 파라미터) 목록.
+    """
+    self._work_items.append(work_item)
+    for sql_path, params in companion_rows:
+      self._companion_rows.setdefault(sql_path, []).append(params)
+    if self._stream is not None:
+      # 작업 식별자의 첫 요소(종목코드)를 기준으로 종목이 바뀔 때마다 변환된 조각을 받습니다.
+      ticker = work_item[0] if isinstance(work_item, tuple) else work_item
+      with self._stage("transform"):
+        self._collect(self._stream.feed(ticker, rows))
+    else:
+      self._rows.extend(rows)
+    self._row_count += len(rows)
+    row_bytes = sum(estimate_row_bytes(row) for row in rows)
+    self._bytes += row_bytes
+    if self.metrics is not None:
+      self.metrics.add("buffered_bytes", row_bytes)
+    if (self.max_rows is not None and self._row_count >= self.max_rows) or \
+       (self.max_bytes is not None and self._bytes >= self.max_bytes):
+      self.flush()
+
+  def _collect(self, frame: pd.DataFrame):
+    if not frame.empty:
+      self._frames.append(frame)
+
+  def _build_frame(self, rows: List[Dict[str, Any]], frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """변환된 조각(또는 원본 행)을 하나로 합치고 INSERT 문의 컬럼 순서로 정렬합니다."""
+    if self._stream is not None:
+      df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    else:
+      df = pd.DataFrame(rows)
+    if not df.empty and self.columns is not None:
+      df = df.reindex(columns=self.columns)
+    if not df.empty and self.schema is not None:
+      df, failures = self.schema.parse(df)
+      parse_failures = report_failures(failures, self.schema.table_name)
+      if parse_failures and self.metrics is not None:
+        self.metrics.add("parse_failures", parse_failures)
+      # DB 드라이버가 결측(NaN, pd.NA)을 NULL로 저장하도록 Python 값과 None으로 바꿉니다.
+      df = df.astype(object).where(df.notna(), None)
+    return df
+
+  def _stage(self, name: str):
+    return self.metrics.stage(name) if self.metrics is not None else nullcontext()
+
+  def flush(self) -> bool:
+    """버퍼의 행을 변환하여 저장하고 버퍼를 비웁니다.
+
+    Returns:
+      bool: 저장에 성공했거나 저장할 행이 없으면 True. 실패하면 해당 묶음의 작업들을
+        `failed_work_items`에 기록하고 False를 반환합니다. 중단 이벤트가 설정되어 있으면
+        저장하지 않고 작업들을 `discarded_work_items`에 기록한 뒤 False를 반환합니다.
+    """
+    if self._stream is not None:
+      # 스트림에 남은 종목의 응답도 이번 묶음의 작업이므로 함께 변환하여 저장합니다.
+      with self._stage("transform"):
+        self._collect(self._stream.flush())
+    rows, frames, work_items, companion_rows = self._rows, self._frames, self._work_items, self._companion_rows
+    self._rows, self._frames, self._work_items, self._companion_rows, self._bytes, self._row_count = [], [], [], {}, 0, 0
+    if not work_items:
+      return True
+    if self.stop_event is not None and self.stop_event.is_set():
+      # 중단된 뒤에는 데이터와 동반 행(체크포인트, 워터마크)을 커밋하지 않습니다.
+      self.discarded_work_items.extend(work_items)
+      return False
+
+    with self._stage("transform"):
+      df = self._build_frame(rows, frames) if rows or frames else pd.DataFrame()
+    hash_rows = []
+    if self.change_detector is not None and not df.empty:
+      with self._stage("change_detect"):
+        changed = self.change_detector.filter_changed(df)
+      self.rows_unchanged += len(df) - len(changed[0])
+      df, hash_rows = changed
+      for sql_path, params in hash_rows:
+        companion_rows.setdefault(sql_path, []).append(params)
+    if df.empty and not companion_rows:
+      return True
+
+    self.flush_count += 1
+    with self._stage("insert"):
+      inserted = self.db_handler.insert_data(df, self.insert_sql_path, companion_rows=companion_rows)
+    if inserted:
+      self.rows_written += len(df)
+      if self.metrics is not None:
+        self.metrics.add("rows_written", len(df))
+      if hash_rows:
+        self.change_detector.commit(hash_rows)
+      return True
+    self.failed_work_items.extend(work_items)
+    return False
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    # 예외로 종료되더라도 이미 수집된 작업은 저장하여 재실행 비용을 줄입니다.
+    self.flush()
@@ -0,0 +1,72 @@
+# src/etl/row_hash_index.py
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+from src.data.db_handler import DBHandler
+from src.data.schemas.schema_registry import parse_conflict_columns
+
+_KEY_SEPARATOR = "\x1f"
+
+def hash_rows(df: pd.DataFrame) -> pd.Series:
+  """행마다 정규화한 전체 값의 64비트 해시를 16진수 문자열로 계산합니다.
+
+  결측값(None/NaN)은 같은 값으로 보고, 모든 값을 문자열로 정규화하므로
+  변환 결과의 dtype이 실행마다 달라지더라도 내용이 같으면 해시도 같습니다.
+  """
+  normalized = df.astype(object).where(df.notna(), None).astype(str)
+  return pd.util.hash_pandas_object(normalized, index=False).map("{:016x}".format)
+
+class RowHashIndex:
+  """
+  스냅샷 테이블의 (테이블, 키)별 행 해시 인덱스.
+
+  저장 직전의 행을 해시하여 마지막으로 저장된 해시와 비교하고, 새로 생겼거나 바뀐 행만 남깁니다.
+  해시 갱신은 데이터 INSERT와 같은 트랜잭션에서 실행되므로(`companion_rows`),
+  저장에 실패한 행의 해시가 앞서 기록되어 변경이 누락되는 일이 없습니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_row_hash.sql"
+  DML_PATH = "./sql/etl_meta/dml/upsert_etl_row_hash.sql"
+
+  def __init__(self, db_handler: DBHandler, table_name: str, key_columns: List[str]):
+    """
+    Args:
+      db_handler (DBHandler): 해시 인덱스 테이블이 위치한 DB의 핸들러.
+      table_name (str): 데이터 테이블명.
+      key_columns (List[str]): 행을 식별하는 키 컬럼 목록.
+    """
+    self.db_handler = db_handler
+    self.table_name = table_name
+    self.key_columns = key_columns
+    db_handler.create_table(self.DDL_PATH)
+    self._hashes: Dict[str, str] = db_handler.get_row_hashes(table_name)
+
+  @classmethod
+  def from_insert_sql(cls, db_handler: DBHandler, table_name: str, insert_sql_path: str) -> "RowHashIndex":
+    """INSERT 문의 ON CONFLICT 키를 행 키로 사용하는 인덱스를 생성합니다."""
+    with open(insert_sql_path, "r", encoding="utf-8") as file:
+      return cls(db_handler, table_name, parse_conflict_columns(file.read()))
+
+  def filter_changed(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[Tuple[str, tuple]]]:
+    """저장된 해시와 다른(새로 생겼거나 바뀐) 행만 남깁니다.
+
+    Args:
+      df (pd.DataFrame): 저장할 행. 키 컬럼을 모두 포함해야 합니다.
+
+    Returns:
+      Tuple[pd.DataFrame, List[Tuple[str, tuple]]]: (변경된 행, 데이터와 함께 실행할 해시 갱신 (SQL 경로, 파라미터) 목록)
+    """
+    if df.empty:
+      return df, []
+
+    row_hashes = hash_rows(df)
+    row_keys = df[self.key_columns].astype(object).where(df[self.key_columns].notna(), "").astype(str).agg(_KEY_SEPARATOR.join, axis=1)
+    changed = row_hashes.ne(row_keys.map(self._hashes))
+
+    companion_rows = [(self.DML_PATH, (self.table_name, key, row_hash)) for key, row_hash in zip(row_keys[changed], row_hashes[changed])]
+    return df[changed], companion_rows
+
+  def commit(self, companion_rows: List[Tuple[str, tuple]]):
+    """저장에 성공한 해시를 메모리 인덱스에 반영합니다. (같은 실행에서 같은 키가 다시 들어오는 경우 대비)"""
+    for _, (_, row_key, row_hash) in companion_rows:
+      self._hashes[row_key] = row_hash
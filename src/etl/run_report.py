@@ -0,0 +1,47 @@
+# src/etl/run_report.py
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pandas as pd
+
+from src.data.db_handler import DBHandler
+
+DDL_PATH = "./sql/etl_meta/ddl/create_etl_run_metrics.sql"
+DML_PATH = "./sql/etl_meta/dml/insert_etl_run_metrics.sql"
+
+def summary_to_row(summary: Dict[str, Any]) -> list:
+  """실행 요약을 etl_run_metrics INSERT 문의 컬럼 순서에 맞춘 값 목록으로 변환합니다."""
+  stages, latency = summary.get("stage_seconds", {}), summary.get("latency_ms", {})
+  return [
+    summary["run_id"], summary["table_name"], summary["started_at"], summary["elapsed_seconds"],
+    summary["calls"], sum(summary["retries"].values()), sum(summary["errors"].values()),
+    latency.get("p50"), latency.get("p95"), latency.get("p99"), summary["response_bytes"],
+    summary.get("rows_fetched", 0), summary.get("rows_written", 0), summary["rows_per_second"],
+    stages.get("fetch"), stages.get("transform"), stages.get("insert"),
+    json.dumps(summary, ensure_ascii=False),
+  ]
+
+def save_run_summary(db_handler: DBHandler, summary: Dict[str, Any], summary_dir: str | Path | None = None) -> Path | None:
+  """실행 요약을 etl_run_metrics 테이블과 JSON 파일(선택)에 저장합니다.
+
+  Args:
+    db_handler (DBHandler): 지표 테이블이 위치한 DB의 핸들러.
+    summary (Dict[str, Any]): RunMetrics.summary()의 결과.
+    summary_dir (str | Path | None): JSON 요약을 저장할 디렉터리. 지정하지 않으면 KIS_METRICS_DIR
+      환경 변수를 사용하며, 둘 다 없으면 파일로 저장하지 않습니다.
+
+  Returns:
+    Path | None: 저장한 JSON 파일 경로.
+  """
+  db_handler.create_table(DDL_PATH)
+  db_handler.insert_data(pd.DataFrame([summary_to_row(summary)], dtype=object), DML_PATH)
+
+  summary_dir = summary_dir or os.getenv("KIS_METRICS_DIR")
+  if not summary_dir:
+    return None
+  path = Path(summary_dir) / summary["run_id"] / f"{summary['table_name']}.json"
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+  return path
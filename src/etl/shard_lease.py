@@ -0,0 +1,178 @@
+# src/etl/shard_lease.py
+import os
+import socket
+import threading
+import uuid
+import zlib
+from typing import Dict, List
+
+from src.data.db_handler import DBHandler
+from src.etl.KIS_collector import KIS_collector
+from src.etl.universe import load_universe
+
+def shard_of(ticker: str, shard_count: int) -> int:
+  """종목코드를 샤드 번호로 배정합니다. (프로세스/노드와 무관하게 항상 같은 결과)"""
+  return zlib.crc32(ticker.encode("utf-8")) % shard_count
+
+class ShardLeaseManager:
+  """
+  여러 워커(Airflow Celery 워커 등)가 하나의 수집 작업을 종목 샤드 단위로 나눠 처리하기 위한 임대 관리자.
+
+  - 샤드 임대 행은 실행(run_id)과 테이블마다 미리 만들어 두고, 워커는 `FOR UPDATE SKIP LOCKED`로
+    대기 중인 샤드를 하나씩 가져갑니다. 같은 샤드를 두 워커가 동시에 수집하지 않습니다.
+  - 임대 중에는 백그라운드 하트비트가 만료 시간을 연장합니다. 워커가 죽어 하트비트가 끊기면
+    임대가 만료되고, 다른 워커가 그 샤드를 다시 가져갑니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_shard_lease.sql"
+  SEED_PATH = "./sql/etl_meta/dml/seed_etl_shard_lease.sql"
+  CLAIM_PATH = "./sql/etl_meta/dml/claim_etl_shard_lease.sql"
+  HEARTBEAT_PATH = "./sql/etl_meta/dml/heartbeat_etl_shard_lease.sql"
+  FINISH_PATH = "./sql/etl_meta/dml/finish_etl_shard_lease.sql"
+
+  def __init__(self, db_handler: DBHandler, table_name: str, run_id: str, shard_count: int,
+               worker_id: str | None = None, lease_seconds: float = 300.0):
+    """
+    Args:
+      db_handler (DBHandler): 임대 테이블이 위치한 DB의 핸들러.
+      table_name (str): 수집 대상 테이블명.
+      run_id (str): 수집 실행 식별자. 같은 run_id의 워커들이 샤드를 나눠 가집니다.
+      shard_count (int): 종목 샤드 수.
+      worker_id (str | None): 워커 식별자. 지정하지 않으면 호스트명, PID, 임의 값으로 생성합니다.
+      lease_seconds (float): 임대 유지 시간(초). 하트비트는 이 시간의 1/3마다 보냅니다.
+
+    Raises:
+      ValueError: shard_count가 1 미만이거나 DB 엔진이 없는 경우 발생합니다.
+    """
+    if shard_count < 1:
+      raise ValueError("shard_count는 1 이상이어야 합니다.")
+    if db_handler.engine is None:
+      raise ValueError("DB 엔진이 없어 샤드 임대를 사용할 수 없습니다.")
+    self.db_handler = db_handler
+    self.table_name = table_name
+    self.run_id = run_id
+    self.shard_count = shard_count
+    self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    self.lease_seconds = lease_seconds
+
+    db_handler.create_table(self.DDL_PATH)
+    db_handler.execute_sql(self.SEED_PATH, {"run_id": run_id, "table_name": table_name, "shard_count": shard_count})
+
+  def _params(self, **extra) -> dict:
+    return {"run_id": self.run_id, "table_name": self.table_name, "owner": self.worker_id, "lease_seconds": self.lease_seconds, **extra}
+
+  def claim(self) -> int | None:
+    """대기 중이거나 임대가 만료된 샤드 하나를 임대합니다.
+
+    Returns:
+      int | None: 임대한 샤드 번호. 가져갈 샤드가 없으면 None.
+    """
+    rows = self.db_handler.execute_sql(self.CLAIM_PATH, self._params())
+    return rows[0][0] if rows else None
+
+  def heartbeat(self, shard_id: int) -> bool:
+    """임대 만료 시간을 연장합니다. 임대를 이미 잃었으면 False를 반환합니다."""
+    rows = self.db_handler.execute_sql(self.HEARTBEAT_PATH, self._params(shard_id=shard_id))
+    return rows is None or bool(rows) # DB 오류는 임대 상실로 보지 않고 다음 하트비트에서 다시 시도
+
+  def complete(self, shard_id: int) -> bool:
+    """샤드를 완료로 표시합니다. 임대를 이미 잃었으면 False를 반환합니다."""
+    return bool(self.db_handler.execute_sql(self.FINISH_PATH, self._params(shard_id=shard_id, status="done")))
+
+  def release(self, shard_id: int) -> bool:
+    """샤드를 반납하여 다른 워커가 바로 가져갈 수 있도록 합니다."""
+    return bool(self.db_handler.execute_sql(self.FINISH_PATH, self._params(shard_id=shard_id, status="pending")))
+
+  def hold(self, shard_id: int) -> "_LeaseHeartbeat":
+    """샤드를 처리하는 동안 백그라운드에서 하트비트를 보내는 컨텍스트 매니저를 반환합니다."""
+    return _LeaseHeartbeat(self, shard_id)
+
+class _LeaseHeartbeat:
+  """임대 중인 샤드의 하트비트를 주기적으로 보내는 백그라운드 스레드.
+
+  임대를 잃으면 `lost_event`를 설정합니다. 수집기에 중단 이벤트로 넘기면 남은 작업을 요청하지 않고
+  아직 저장하지 않은 결과(데이터, 체크포인트, 워터마크)도 커밋하지 않습니다.
+  """
+  def __init__(self, manager: ShardLeaseManager, shard_id: int):
+    self.manager = manager
+    self.shard_id = shard_id
+    self.lost_event = threading.Event()
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._run, name=f"lease-heartbeat-{shard_id}", daemon=True)
+
+  def _run(self):
+    while not self._stop.wait(self.manager.lease_seconds / 3):
+      if not self.manager.heartbeat(self.shard_id):
+        self.lost_event.set()
+        print(f"⚠️ [{self.manager.table_name}] 샤드 {self.shard_id}의 임대를 잃었습니다. (다른 워커가 회수)")
+        return
+
+  @property
+  def lost(self) -> bool:
+    """임대를 잃었는지 여부."""
+    return self.lost_event.is_set()
+
+  def __enter__(self):
+    self._thread.start()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self._stop.set()
+    self._thread.join()
+
+def collect_sharded(config: dict, shard_count: int, run_id: str | None = None, worker_id: str | None = None,
+                    lease_seconds: float = 300.0, db_handler: DBHandler | None = None, **collector_kwargs) -> Dict[str, int]:
+  """종목 샤드를 임대하며 가져갈 샤드가 없을 때까지 수집합니다.
+
+  같은 CONFIG와 run_id로 여러 노드에서 동시에 실행하면, 각 워커는 서로 다른 샤드를 수집하므로
+  API를 중복 호출하지 않고 수평 확장됩니다. 샤드 수집 중 예외가 발생하면 샤드를 반납한 뒤 예외를 전달합니다.
+  수집 중 임대를 잃으면 그 샤드의 수집을 멈추고, 완료로 표시하지 않은 채 다음 샤드로 넘어갑니다.
+
+  Args:
+    config (dict): 수집 대상 CONFIG.
+    shard_count (int): 종목 샤드 수. 같은 실행의 모든 워커가 같은 값을 사용해야 합니다.
+    run_id (str | None): 수집 실행 식별자. 지정하지 않으면 KIS_RUN_ID 환경 변수를 사용합니다.
+      모든 워커가 같은 값을 써야 하므로 둘 다 없으면 예외가 발생합니다.
+    worker_id (str | None): 워커 식별자.
+    lease_seconds (float): 임대 유지 시간(초).
+    db_handler (DBHandler | None): 공유할 DB 핸들러.
+    **collector_kwargs: KIS_collector에 전달할 추가 인자 (max_workers, kis_hook, transformer 등).
+
+  Returns:
+    Dict[str, int]: 이 워커가 수집한 샤드들의 결과 합계와 처리한 샤드 수(shards).
+
+  Raises:
+    ValueError: run_id와 KIS_RUN_ID 환경 변수가 모두 없는 경우 발생합니다.
+  """
+  # 날짜 같은 암묵적 기본값을 쓰면 같은 날 다시 실행한 수집이 완료된 샤드를 보고 아무것도 하지 않으므로,
+  # 워커들이 공유할 실행 식별자는 명시적으로 받습니다.
+  run_id = run_id or os.getenv("KIS_RUN_ID")
+  if not run_id:
+    raise ValueError("샤드 수집은 모든 워커가 공유할 run_id(또는 KIS_RUN_ID 환경 변수)가 필요합니다.")
+  db_handler = db_handler or DBHandler(db_name="data_lake")
+  table_name = f"{config['asset']}_{config['path']}"
+  manager = ShardLeaseManager(db_handler, table_name, run_id, shard_count, worker_id=worker_id, lease_seconds=lease_seconds)
+
+  shards: Dict[int, List[str]] = {}
+  for ticker in load_universe(config["asset"], db_handler=db_handler, **config.get("universe", {})):
+    shards.setdefault(shard_of(ticker, shard_count), []).append(ticker)
+
+  totals = {"shards": 0}
+  while (shard_id := manager.claim()) is not None:
+    print(f"🔒 [{config['description']}] 워커 '{manager.worker_id}'가 샤드 {shard_id}/{shard_count}를 수집합니다.")
+    try:
+      with manager.hold(shard_id) as lease:
+        result = KIS_collector(config, db_handler=db_handler, run_id=run_id, tickers=shards.get(shard_id, []),
+                               stop_event=lease.lost_event, **collector_kwargs)
+    except BaseException:
+      manager.release(shard_id)
+      raise
+
+    if lease.lost:
+      # 샤드를 회수한 워커가 이어서 수집하므로 완료로 표시하지 않습니다.
+      print(f"⚠️ [{config['description']}] 샤드 {shard_id}의 임대를 잃어 수집을 중단했습니다.")
+    else:
+      manager.complete(shard_id)
+      totals["shards"] += 1
+    for key, value in result.items():
+      totals[key] = totals.get(key, 0) + value
+  return totals
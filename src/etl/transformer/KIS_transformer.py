@@ -2,7 +2,7 @@
 import pandas as pd
 from typing import Dict
 
-from .interfaces import TransformerStrategy
+from .interfaces import TransformerStrategy, TransformStream
 from .strategies.estimate_perform_strategy import EstimatePerformStrategy
 from .strategies.asking_price_strategy import AskingPriceStrategy
 from .strategies.daily_itermchartprice_strategy import DailyItemchartPriceStrategy
@@ -19,9 +19,15 @@ class KISTransformer:
       "daily_itemchartprice": DailyItemchartPriceStrategy(),
       }
 
-  def transform(self, transformer_name: str, raw_df: pd.DataFrame) -> pd.DataFrame:
+  def _get_strategy(self, transformer_name: str) -> TransformerStrategy:
     strategy = self._strategies.get(transformer_name)
     if not strategy:
       raise ValueError(f"Unsupported transformer_name: '{transformer_name}'")
-    
-    return strategy.transform(raw_df)
\ No newline at end of file
+    return strategy
+
+  def transform(self, transformer_name: str, raw_df: pd.DataFrame) -> pd.DataFrame:
+    return self._get_strategy(transformer_name).transform(raw_df)
+
+  def stream(self, transformer_name: str) -> TransformStream:
+    """종목별 응답을 도착하는 대로 변환하는 증분 변환 스트림을 만듭니다. (TransformStream 참고)"""
+    return self._get_strategy(transformer_name).stream()
\ No newline at end of file
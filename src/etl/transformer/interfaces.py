@@ -1,7 +1,7 @@
 # transformer/interfaces.py
 import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 class DataFrameBuilder(ABC):
   """DataFrame 생성을 위한 빌더 인터페이스"""
@@ -9,8 +9,47 @@ class DataFrameBuilder(ABC):
   def build(self, ticker: str, group: pd.DataFrame) -> Optional[pd.DataFrame]:
     pass
 
+class TransformStream(ABC):
+  """종목별 API 응답을 도착하는 대로 받아 변환하는 증분 변환 인터페이스"""
+  @abstractmethod
+  def feed(self, ticker: Hashable, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """한 종목의 API 응답 행을 넣고, 변환이 끝난 조각을 반환합니다. (아직 없으면 빈 DataFrame)"""
+    pass
+
+  @abstractmethod
+  def flush(self) -> pd.DataFrame:
+    """남아 있는 상태를 모두 변환하여 반환하고 비웁니다. (없으면 빈 DataFrame)"""
+    pass
+
 class TransformerStrategy(ABC):
   """데이터 변환 전략에 대한 인터페이스"""
   @abstractmethod
   def transform(self, raw_df: pd.DataFrame) -> pd.DataFrame:
-    pass
\ No newline at end of file
+    pass
+
+  def stream(self) -> TransformStream:
+    """증분 변환 스트림을 새로 만듭니다. 스트림은 상태를 가지므로 소비자(적재기)마다 하나씩 사용합니다."""
+    return TickerTransformStream(self)
+
+class TickerTransformStream(TransformStream):
+  """
+  종목 단위로 `transform`을 적용하는 기본 증분 변환 스트림.
+
+  같은 종목의 응답(날짜 구간, 연속 조회 페이지 등)은 모아 두었다가, 다른 종목의 응답이
+  들어오거나 `flush`가 호출되면 그 종목만 변환합니다. 종목 단위로 결합하는 전략(output1/output2 결합 등)의
+  결과가 전체 변환과 같고, 메모리는 한 종목의 응답 크기로 제한됩니다.
+  """
+  def __init__(self, strategy: TransformerStrategy):
+    self._strategy = strategy
+    self._ticker: Hashable = None
+    self._rows: List[Dict[str, Any]] = []
+
+  def feed(self, ticker: Hashable, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    ready = self.flush() if self._rows and ticker != self._ticker else pd.DataFrame()
+    self._ticker = ticker
+    self._rows.extend(rows)
+    return ready
+
+  def flush(self) -> pd.DataFrame:
+    rows, self._rows, self._ticker = self._rows, [], None
+    return self._strategy.transform(pd.DataFrame(rows)) if rows else pd.DataFrame()
@@ -1,8 +1,9 @@
 # transformer/strategies/asking_price_strategy.py
+import numpy as np
 import pandas as pd
 from typing import Optional
-from dataclasses import fields
 from src.data.schemas.KIS_schemas import KrStockAskingPrice
+from src.data.schemas.schema_registry import get_schema
 from ..interfaces import TransformerStrategy, DataFrameBuilder
 
 class AskingPriceBuilder(DataFrameBuilder):
@@ -38,6 +39,8 @@ class AskingPriceBuilder(DataFrameBuilder):
     # [4] 중복 컬럼 제거:
     # output1의 컬럼을 기준으로, output2에 중복된 컬럼이 있다면 제거합니다.
     # 이를 통해 데이터 병합 시 발생할 수 있는 'duplicate labels' 오류를 방지합니다.
+    # 두 Series는 같은 원본에서 나뉘어 인덱스가 같으므로, 값이 있는 컬럼을 기준으로 판단합니다.
+    output1_series = output1_series.dropna()
     output2_unique_series = output2_series.drop(
         labels=output1_series.index, 
         errors='ignore' # output2에 output1 컬럼이 없는 경우 오류를 무시합니다.
@@ -62,16 +65,28 @@ class AskingPriceStrategy(TransformerStrategy):
   '주식호가' 데이터 변환을 위한 구체적인 전략 클래스.
   Builder를 사용하여 실제 변환 작업을 조율하는 Director의 역할을 수행합니다.
   """
-  def __init__(self):
-    """AskingPriceStrategy의 인스턴스를 초기화합니다."""
+  def __init__(self, vectorized: bool = True):
+    """AskingPriceStrategy의 인스턴스를 초기화합니다.
+
+    Args:
+      vectorized (bool): True이면 종목별 groupby/concat 없이 전체 종목을 한 번에 변환합니다.
+                         False이면 종목별로 Builder를 호출하는 기존 방식을 사용합니다.
+    """
     self._builder = AskingPriceBuilder()
-    self._schema_columns = [field.name for field in fields(KrStockAskingPrice)]
+    self._schema_columns = get_schema(KrStockAskingPrice).column_index
+    self.vectorized = vectorized
   
   def transform(self, raw_df: pd.DataFrame) -> pd.DataFrame:
     """'주식호가' 원본 DataFrame을 DB 스키마에 맞는 최종 형태로 변환합니다."""
     if raw_df.empty:
       return pd.DataFrame()
 
+    if self.vectorized:
+      return self._transform_vectorized(raw_df)
+    return self._transform_by_ticker(raw_df)
+
+  def _transform_by_ticker(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """종목별로 Builder를 호출하여 변환합니다."""
     processed_records = []
 
     for ticker, group in raw_df.groupby('ticker'):
@@ -88,4 +103,28 @@ class AskingPriceStrategy(TransformerStrategy):
       if col not in final_df.columns:
         final_df[col] = None
 
-    return final_df[self._schema_columns]
\ No newline at end of file
+    return final_df[self._schema_columns]
+
+  def _transform_vectorized(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """전체 종목을 한 번에 변환합니다. (`_transform_by_ticker`와 같은 결과)"""
+    # [1] 데이터 분리: 종목별 첫 output1/output2 행을 종목코드 인덱스로 뽑습니다. (ticker가 없는 행은 제외)
+    raw_df = raw_df[raw_df['ticker'].notna()]
+    output1_df = raw_df[raw_df['data_source'] == 'output1'].drop_duplicates('ticker').set_index('ticker', drop=False)
+    output2_df = raw_df[raw_df['data_source'] == 'output2'].drop_duplicates('ticker').set_index('ticker', drop=False)
+
+    # [2] 필수 데이터 검증: 두 데이터 소스가 모두 있는 종목만 종목코드 순으로 남깁니다.
+    tickers = output1_df.index.intersection(output2_df.index).sort_values()
+    if tickers.empty:
+      return pd.DataFrame()
+    output1_df, output2_df = output1_df.reindex(tickers), output2_df.reindex(tickers)
+
+    # [3] 데이터 결합: output1 값을 우선하고, output1에 값이 없는 컬럼은 output2 값으로 채웁니다.
+    row_count = len(tickers)
+    columns = {
+      col: (
+        output1_df[col].where(output1_df[col].notna(), output2_df[col]).to_numpy(dtype=object)
+        if col in raw_df.columns else np.full(row_count, None, dtype=object)
+      )
+      for col in self._schema_columns
+    }
+    return pd.DataFrame(columns)
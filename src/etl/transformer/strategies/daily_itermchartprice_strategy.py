@@ -1,8 +1,9 @@
 # transformer/strategies/daily_itemchart_strategy.py
+import numpy as np
 import pandas as pd
-from typing import Optional
-from dataclasses import fields
+from typing import List, Optional
 from src.data.schemas.KIS_schemas import KrStockDailyItemchartprice  # 스키마 위치는 실제 프로젝트에 맞게 조정해주세요.
+from src.data.schemas.schema_registry import get_schema
 from ..interfaces import TransformerStrategy, DataFrameBuilder
 
 class DailyItemchartPriceBuilder(DataFrameBuilder):
@@ -37,7 +38,9 @@ class DailyItemchartPriceBuilder(DataFrameBuilder):
     # output1은 모든 날짜에 동일하게 적용될 메타데이터입니다.
     # 단, 일별 시세(output2)에 이미 존재하는 컬럼('stck_oprc' 등)은 제외하여
     # output2의 데이터가 우선권을 갖도록 합니다.
-    output1_cols_to_use = [col for col in output1_df.columns if col not in output2_df.columns]
+    # 두 DataFrame은 같은 원본에서 나뉘어 컬럼 구성이 같으므로, 값이 있는 컬럼을 기준으로 판단합니다.
+    output2_cols = output2_df.columns[output2_df.notna().any()]
+    output1_cols_to_use = [col for col in output1_df.columns if col not in output2_cols]
     output1_data = output1_df.iloc[0][output1_cols_to_use].to_dict()
 
     # [4] 데이터 결합:
@@ -56,10 +59,22 @@ class DailyItemchartPriceStrategy(TransformerStrategy):
 
   Builder를 사용하여 실제 변환 작업을 조율하는 Director의 역할을 수행합니다.
   """
-  def __init__(self):
-    """DailyItemchartPriceStrategy의 인스턴스를 초기화합니다."""
+  def __init__(self, vectorized: bool = True):
+    """DailyItemchartPriceStrategy의 인스턴스를 초기화합니다.
+
+    Args:
+      vectorized (bool): True이면 종목별 groupby/concat 없이 전체 데이터를 한 번에 변환합니다.
+                         False이면 종목별로 Builder를 호출하는 기존 방식을 사용합니다.
+    """
     self._builder = DailyItemchartPriceBuilder()
-  
+    self.vectorized = vectorized
+
+    # 최종 스키마(KrStockDailyItemchartprice) 컬럼 순서 ('ticker' 포함)
+    schema_columns = list(get_schema(KrStockDailyItemchartprice).columns)
+    if 'ticker' not in schema_columns:
+      schema_columns.insert(0, 'ticker')
+    self._schema_columns: List[str] = schema_columns
+
   def transform(self, raw_df: pd.DataFrame) -> pd.DataFrame:
     """'주식일봉차트' 원본 DataFrame을 DB 스키마에 맞는 최종 형태로 변환합니다.
 
@@ -72,6 +87,12 @@ class DailyItemchartPriceStrategy(TransformerStrategy):
     if raw_df.empty:
       return pd.DataFrame()
 
+    if self.vectorized:
+      return self._transform_vectorized(raw_df)
+    return self._transform_by_ticker(raw_df)
+
+  def _transform_by_ticker(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """종목별로 Builder를 호출하여 변환합니다."""
     processed_records = []
 
     # [1] 전체 종목에 대한 빌드 작업 지시(Direct):
@@ -91,15 +112,41 @@ class DailyItemchartPriceStrategy(TransformerStrategy):
     # [3] 최종 스키마 정렬:
     #     요청하신 dataclass(KrStockDailyItemchartPriceprice) 스키마와 완전히 일치하도록
     #     컬럼 순서를 조정하고, 누락된 컬럼은 None으로 채웁니다.
-    schema_columns = [field.name for field in fields(KrStockDailyItemchartprice)]
-    
-    # 참고: DB 저장을 위해 'ticker' 컬럼도 최종 스키마에 포함하는 것을 권장합니다.
-    # 필요하다면 아래와 같이 처리할 수 있습니다.
-    if 'ticker' not in schema_columns:
-      schema_columns.insert(0, 'ticker')
-
+    schema_columns = self._schema_columns
     for col in schema_columns:
       if col not in final_df.columns:
         final_df[col] = None
             
-    return final_df[schema_columns]
\ No newline at end of file
+    return final_df[schema_columns]
+
+  def _transform_vectorized(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """종목별 중간 DataFrame 없이 전체 데이터를 한 번에 변환합니다. (`_transform_by_ticker`와 같은 결과)"""
+    # [1] 데이터 분리: data_source 기준으로 한 번만 나눕니다. (groupby와 같이 ticker가 없는 행은 제외)
+    raw_df = raw_df[raw_df['ticker'].notna()]
+    output1_df = raw_df[raw_df['data_source'] == 'output1']
+    output2_df = raw_df[raw_df['data_source'] == 'output2']
+
+    # [2] 필수 데이터 검증: output1과 output2가 모두 있는 종목만 남기고,
+    #     종목코드 순으로 정렬합니다. (종목 안에서는 원본 순서 유지)
+    output2_df = output2_df[output2_df['ticker'].isin(output1_df['ticker'])]
+    if output2_df.empty:
+      return pd.DataFrame()
+    output2_df = output2_df.sort_values('ticker', kind='stable')
+    tickers = output2_df['ticker']
+
+    # [3] 기준 정보 결합: 종목별 첫 output1 행을 종목코드 키로 조인하여 output2 행마다 펼칩니다.
+    metadata = output1_df.drop_duplicates('ticker').set_index('ticker', drop=False).reindex(tickers)
+
+    # [4] 종목별로 output2에 값이 있는 컬럼은 output2가 우선하고, 나머지는 output1 값으로 채웁니다.
+    has_output2 = output2_df.notna().groupby(tickers).transform('any')
+
+    # [5] 최종 스키마 순서의 DataFrame을 한 번에 생성합니다. 누락된 컬럼은 None으로 채웁니다.
+    row_count = len(output2_df)
+    columns = {
+      col: (
+        output2_df[col].where(has_output2[col], metadata[col].to_numpy()).to_numpy()
+        if col in output2_df.columns else np.full(row_count, None, dtype=object)
+      )
+      for col in self._schema_columns
+    }
+    return pd.DataFrame(columns)
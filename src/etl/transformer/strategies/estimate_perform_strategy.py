@@ -1,10 +1,21 @@
 # transformer/strategies/estimate_perform_strategy.py
+import numpy as np
 import pandas as pd
 from typing import Optional
-from dataclasses import fields
 from src.data.schemas.KIS_schemas import KrStockEstimatePerform
+from src.data.schemas.schema_registry import get_schema
+from src.utils.numeric_codec import decode_numeric, report_failures
 from ..interfaces import TransformerStrategy, DataFrameBuilder
 
+# output2 + output3 데이터 행의 이름 (KIS API 응답 순서와 정확히 일치해야 합니다.)
+INDEX_NAMES = [
+  'revenue', 'revenue_yoy', 'operating_profit', 'operating_profit_yoy', 
+  'net_income', 'net_income_yoy', 'eps', 'per', 'bps', 'pbr', 
+  'roe', 'ev_ebitda', 'sps', 'psr' 
+]
+# 데이터 행마다 기간별 값이 담기는 컬럼 (최대 5개 기간)
+DATA_COLUMNS = [f'data{i+1}' for i in range(5)]
+
 class EstimatePerformBuilder(DataFrameBuilder):
   """'종목추정실적' 데이터 변환을 위한 구체적인 빌더 클래스.
 
@@ -43,11 +54,7 @@ class EstimatePerformBuilder(DataFrameBuilder):
     columns = [item['dt'] for item in output4]
     
     # KIS API 응답 순서와 정확히 일치해야 하는 행(index) 이름을 명시적으로 선언합니다.
-    index_names = [
-      'revenue', 'revenue_yoy', 'operating_profit', 'operating_profit_yoy', 
-      'net_income', 'net_income_yoy', 'eps', 'per', 'bps', 'pbr', 
-      'roe', 'ev_ebitda', 'sps', 'psr' 
-    ]
+    index_names = INDEX_NAMES
     
     # [4] 데이터 정합성 검증: API로부터 받은 데이터 행의 개수와 우리가 정의한
     #     행 이름의 개수가 일치하는지 확인합니다.
@@ -57,15 +64,15 @@ class EstimatePerformBuilder(DataFrameBuilder):
 
     # [5] DataFrame 생성 및 가공:
     # 먼저 데이터 부분만으로 DataFrame을 만들고, 실제 기간 개수만큼 컬럼을 선택합니다.
-    df = pd.DataFrame(data_rows, columns=[f'data{i+1}' for i in range(5)])
+    df = pd.DataFrame(data_rows, columns=DATA_COLUMNS)
     df = df.iloc[:, :len(columns)]
     # 위에서 정의한 컬럼명과 인덱스명을 DataFrame에 적용합니다.
     df.columns = columns
     df.index = index_names
     
-    # [6] 최종 형태 변환: 모든 재무 데이터를 숫자(float) 타입으로 변환하고,
+    # [6] 최종 형태 변환: 모든 재무 데이터를 숫자 코덱으로 한 번에 숫자(float) 타입으로 변환하고,
     #     분석이 용이하도록 행과 열을 전환(Transpose)합니다.
-    df = df.astype(float).transpose()
+    df = decode_numeric(df)[0].transpose()
     
     # [7] 공통 메타데이터 추가: output1에 있던 티커, 애널리스트, 투자의견 등
     #     공통 정보를 모든 행에 추가합니다.
@@ -82,9 +89,15 @@ class EstimatePerformStrategy(TransformerStrategy):
   역할을 수행합니다. 여러 종목의 데이터를 반복 처리하고 최종 결과물을
   DB 스키마에 맞게 정리하는 책임을 가집니다.
   """
-  def __init__(self):
-    """EstimatePerformStrategy의 인스턴스를 초기화합니다."""
+  def __init__(self, vectorized: bool = True):
+    """EstimatePerformStrategy의 인스턴스를 초기화합니다.
+
+    Args:
+      vectorized (bool): True이면 종목별 groupby/concat 없이 전체 종목을 한 번에 변환합니다.
+                         False이면 종목별로 Builder를 호출하는 기존 방식을 사용합니다.
+    """
     self._builder = EstimatePerformBuilder()
+    self.vectorized = vectorized
   
   def transform(self, raw_df: pd.DataFrame) -> pd.DataFrame:
     """'종목추정실적' 원본 DataFrame을 DB 스키마에 맞는 최종 형태로 변환합니다.
@@ -99,6 +112,12 @@ class EstimatePerformStrategy(TransformerStrategy):
     if raw_df.empty:
       return pd.DataFrame()
 
+    if self.vectorized:
+      return self._transform_vectorized(raw_df)
+    return self._transform_by_ticker(raw_df)
+
+  def _transform_by_ticker(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """종목별로 Builder를 호출하여 변환합니다."""
     processed_records = []
 
     # [1] 전체 종목에 대한 빌드 작업 지시(Direct):
@@ -116,14 +135,68 @@ class EstimatePerformStrategy(TransformerStrategy):
     #     Builder가 생성한 모든 종목의 DataFrame 조각들을 하나로 합칩니다.
     #     기존 인덱스(기간 정보)는 'period'라는 새로운 컬럼으로 변경합니다.
     final_df = pd.concat(processed_records).reset_index().rename(columns={'index': 'period'})
-    
-    # [3] 최종 스키마 정렬:
-    #     dataclass(KrStockEstimatePerform)로부터 최종 DB 테이블의 컬럼 순서를 가져옵니다.
-    #     누락된 컬럼이 있다면 None으로 채우고, 최종적으로 스키마와 동일한 순서로
-    #     컬럼을 정렬하여 반환합니다. 이는 DB 적재 시 오류를 방지합니다.
-    schema_columns = [field.name for field in fields(KrStockEstimatePerform)]
+    return self._align_schema(final_df)
+
+  def _transform_vectorized(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+    """전체 종목을 NumPy 배열 재구성으로 한 번에 변환합니다. (`_transform_by_ticker`와 같은 결과)
+
+    종목별 검증 규칙은 Builder와 같으며, 조건에 맞지 않는 종목은 건너뜁니다.
+    """
+    # [1] 종목별 output 블록 행 수 집계 (ticker가 없는 행은 제외)
+    raw_df = raw_df[raw_df['ticker'].notna()]
+    counts = pd.crosstab(raw_df['ticker'], raw_df['data_source']).reindex(
+      columns=['output1', 'output2', 'output3', 'output4'], fill_value=0
+    )
+
+    # [2] 필수 데이터/정합성 검증: 모든 output 블록이 있고, 데이터 행(output2 + output3) 수가
+    #     행 이름 수와 같으며, 기간 수가 데이터 컬럼 수 이하인 종목만 남깁니다.
+    valid = (
+      (counts > 0).all(axis=1)
+      & (counts['output2'] + counts['output3'] == len(INDEX_NAMES))
+      & (counts['output4'] <= len(DATA_COLUMNS))
+    )
+    tickers = counts.index[valid.to_numpy()] # crosstab 결과는 종목코드 순으로 정렬되어 있음
+    if tickers.empty:
+      return pd.DataFrame()
+    raw_df = raw_df[raw_df['ticker'].isin(tickers)]
+
+    # [3] 데이터 행 재구성: 종목 -> output2 -> output3 순으로 정렬한 값을
+    #     (종목, 행 이름, 기간) 3차원 배열로 바꾼 뒤 (종목, 기간, 행 이름) 순으로 전치합니다.
+    data_rows = raw_df[raw_df['data_source'].isin(['output2', 'output3'])].sort_values(['ticker', 'data_source'], kind='stable')
+    values, failures = decode_numeric(data_rows.reindex(columns=DATA_COLUMNS))
+    report_failures(failures, "종목추정실적")
+    values = values.to_numpy()
+    values = values.reshape(len(tickers), len(INDEX_NAMES), len(DATA_COLUMNS)).transpose(0, 2, 1)
+
+    # [4] 종목별 실제 기간 수만큼만 선택: 기간 마스크로 (전체 기간 수, 행 이름) 2차원 배열을 얻습니다.
+    period_counts = counts.loc[tickers, 'output4'].to_numpy()
+    period_mask = np.arange(len(DATA_COLUMNS)) < period_counts[:, None]
+    periods = raw_df[raw_df['data_source'] == 'output4'].sort_values('ticker', kind='stable')
+
+    # [5] 공통 메타데이터: 종목별 첫 output1 행의 애널리스트, 투자의견을 기간 수만큼 펼칩니다.
+    output1_df = raw_df[raw_df['data_source'] == 'output1'].drop_duplicates('ticker').set_index('ticker').reindex(tickers)
+    metadata = {
+      name: np.repeat(output1_df[col].to_numpy(), period_counts) if col in output1_df.columns else None
+      for name, col in (('analyst', 'name1'), ('opinion', 'rcmd_name'))
+    }
+
+    final_df = pd.DataFrame(values[period_mask], columns=INDEX_NAMES)
+    final_df.insert(0, 'period', periods['dt'].to_numpy() if 'dt' in periods.columns else np.nan)
+    final_df['ticker'] = np.repeat(tickers.to_numpy(), period_counts)
+    final_df['analyst'] = metadata['analyst']
+    final_df['opinion'] = metadata['opinion']
+    return self._align_schema(final_df)
+
+  @staticmethod
+  def _align_schema(final_df: pd.DataFrame) -> pd.DataFrame:
+    """최종 스키마 정렬:
+    dataclass(KrStockEstimatePerform)로부터 최종 DB 테이블의 컬럼 순서를 가져옵니다.
+    누락된 컬럼이 있다면 None으로 채우고, 최종적으로 스키마와 동일한 순서로
+    컬럼을 정렬하여 반환합니다. 이는 DB 적재 시 오류를 방지합니다.
+    """
+    schema_columns = get_schema(KrStockEstimatePerform).column_index
     for col in schema_columns:
       if col not in final_df.columns:
         final_df[col] = None
             
-    return final_df[schema_columns]
\ No newline at end of file
+    return final_df[schema_columns]
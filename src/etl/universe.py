@@ -0,0 +1,167 @@
+# src/etl/universe.py
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+import pandas as pd
+
+from src.data.db_handler import DBHandler
+from src.utils.cache_dir import cache_dir
+from src.utils.get_asset_list import get_asset_list
+
+# 자산별 종목코드 형식 (국내: 6자리 영숫자 '005930', '00104K' / 해외: 1~5자리 영문 + 클래스 'BRK.B')
+TICKER_PATTERNS = {
+  "kr_stock": re.compile(r"^[0-9][0-9A-Z]{5}$"),
+  "us_stock": re.compile(r"^[A-Z]{1,5}([.-][A-Z])?$"),
+}
+
+def normalize_tickers(asset: str, tickers: Iterable[str]) -> List[str]:
+  """종목코드를 정규화(공백 제거, 대문자)하고 형식 검증과 중복 제거를 거쳐 순서대로 반환합니다.
+
+  Args:
+    asset (str): 자산 구분.
+    tickers (Iterable[str]): 원본 종목코드 목록.
+
+  Returns:
+    List[str]: 유효하고 중복 없는 종목코드 목록.
+  """
+  pattern = TICKER_PATTERNS.get(asset)
+  normalized, invalid, duplicated = {}, [], []
+  for ticker in tickers:
+    code = str(ticker).strip().upper()
+    if pattern and not pattern.match(code):
+      invalid.append(ticker)
+    elif code in normalized:
+      duplicated.append(code)
+    else:
+      normalized[code] = None
+
+  if invalid:
+    print(f"⚠️ [{asset}] 형식이 올바르지 않은 종목코드 {len(invalid)}개를 제외합니다: {invalid}")
+  if duplicated:
+    print(f"⚠️ [{asset}] 중복된 종목코드 {len(duplicated)}개를 제외합니다: {sorted(set(duplicated))}")
+  return list(normalized)
+
+class UniverseService:
+  """
+  DB(etl_universe) 기반 수집 대상 종목 유니버스.
+
+  - `seed`: 종목코드 목록을 정규화/중복 제거하여 등록합니다.
+  - `refresh`: 종목 기본 정보와 시세로 상장 상태, 시장, 지수 편입, 거래 대금을 값이 바뀐 종목만 갱신합니다.
+  - `tickers`: 시장, 지수 편입, 유동성 조건으로 필터링한 종목 목록을 반환합니다. 유니버스는 로컬 스냅샷(JSON)에
+    캐시하므로 여러 CONFIG가 반복 조회해도 DB를 매번 읽지 않습니다.
+  DB를 사용할 수 없으면 정규화된 `get_asset_list` 목록으로 대체합니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_universe.sql"
+  SEED_PATH = "./sql/etl_meta/dml/seed_etl_universe.sql"
+  SELECT_PATH = "./sql/etl_meta/dml/select_etl_universe.sql"
+  REFRESH_PATHS = {"kr_stock": "./sql/etl_meta/dml/refresh_etl_universe_kr_stock.sql"}
+
+  def __init__(self, db_handler: DBHandler | None = None, snapshot_dir: str | Path | None = None, snapshot_ttl: float = 12 * 60 * 60):
+    """
+    Args:
+      db_handler (DBHandler | None): 유니버스 테이블이 위치한 DB의 핸들러.
+      snapshot_dir (str | Path | None): 스냅샷 파일을 저장할 디렉터리. 지정하지 않으면 KIS_UNIVERSE_SNAPSHOT_DIR
+        환경 변수를, 그것도 없으면 캐시 디렉터리(`cache_dir`)를 사용합니다.
+      snapshot_ttl (float): 스냅샷 유효 시간(초). 지나면 DB에서 다시 읽습니다.
+    """
+    self.db_handler = db_handler or DBHandler(db_name="data_lake")
+    self.snapshot_dir = Path(snapshot_dir or os.getenv("KIS_UNIVERSE_SNAPSHOT_DIR") or cache_dir())
+    self.snapshot_ttl = snapshot_ttl
+    self.db_handler.create_table(self.DDL_PATH)
+
+  def _snapshot_path(self, asset: str) -> Path:
+    return self.snapshot_dir / f"universe_{asset}.json"
+
+  def seed(self, asset: str, tickers: Iterable[str] | None = None) -> List[str]:
+    """종목코드를 유니버스에 등록합니다. (이미 등록된 종목은 유지)
+
+    Args:
+      asset (str): 자산 구분.
+      tickers (Iterable[str] | None): 등록할 종목코드. 지정하지 않으면 `get_asset_list`를 사용합니다.
+
+    Returns:
+      List[str]: 정규화된 등록 대상 종목코드.
+    """
+    normalized = normalize_tickers(asset, tickers if tickers is not None else get_asset_list(asset))
+    self.db_handler.insert_data(pd.DataFrame({"asset": asset, "ticker": normalized}), self.SEED_PATH)
+    self._snapshot_path(asset).unlink(missing_ok=True)
+    return normalized
+
+  def refresh(self, asset: str = "kr_stock") -> int:
+    """종목 기본 정보/시세 테이블로 유니버스의 상장 상태와 속성을 갱신합니다.
+
+    Returns:
+      int: 값이 바뀌어 갱신된 종목 수.
+    """
+    path = self.REFRESH_PATHS.get(asset)
+    if path is None:
+      raise ValueError(f"'{asset}' 유니버스의 갱신 규칙이 정의되지 않았습니다.")
+    updated = self.db_handler.execute_sql(path) or []
+    if updated:
+      self._snapshot_path(asset).unlink(missing_ok=True)
+    print(f"✅ [{asset}] 유니버스 {len(updated)}개 종목 갱신")
+    return len(updated)
+
+  def _load(self, asset: str) -> List[Dict[str, Any]]:
+    """유니버스 행을 스냅샷에서 읽고, 없거나 만료되었으면 DB에서 읽어 스냅샷을 갱신합니다."""
+    snapshot_path = self._snapshot_path(asset)
+    try:
+      if time.time() - snapshot_path.stat().st_mtime < self.snapshot_ttl:
+        return json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+      pass
+
+    rows = self.db_handler.execute_sql(self.SELECT_PATH, {"asset": asset})
+    if not rows:
+      return []
+    columns = ["ticker", "status", "market", "kospi200", "listing_date", "delisting_date", "trading_value"]
+    universe = [dict(zip(columns, row)) for row in rows]
+
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = snapshot_path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(universe, ensure_ascii=False), encoding="utf-8")
+    temp_path.replace(snapshot_path)
+    return universe
+
+  def tickers(self, asset: str, markets: Iterable[str] | None = None, kospi200: bool | None = None,
+              min_trading_value: float | None = None, include_suspended: bool = True) -> List[str]:
+    """조건에 맞는 상장 종목 목록을 반환합니다. (상장폐지 종목은 항상 제외)
+
+    Args:
+      asset (str): 자산 구분.
+      markets (Iterable[str] | None): 포함할 시장ID코드 (예: ['STK', 'KSQ']). None이면 전체.
+      kospi200 (bool | None): True/False이면 코스피200 편입/미편입 종목만. None이면 전체.
+      min_trading_value (float | None): 최소 누적 거래 대금. 거래 대금을 모르는 종목은 제외됩니다.
+      include_suspended (bool): 거래정지 종목 포함 여부.
+
+    Returns:
+      List[str]: 종목코드 목록.
+    """
+    universe = self._load(asset)
+    if not universe:
+      return normalize_tickers(asset, get_asset_list(asset))
+
+    allowed = {"active", "suspended"} if include_suspended else {"active"}
+    markets = set(markets) if markets is not None else None
+    return [
+      row["ticker"] for row in universe
+      if row["status"] in allowed
+      and (markets is None or row["market"] in markets)
+      and (kospi200 is None or bool(row["kospi200"]) == kospi200)
+      and (min_trading_value is None or (row["trading_value"] is not None and row["trading_value"] >= min_trading_value))
+    ]
+
+def load_universe(asset: str, db_handler: DBHandler | None = None, **filters) -> List[str]:
+  """CONFIG의 `universe` 필터로 수집 대상 종목 목록을 반환합니다. (UniverseService.tickers 참고)"""
+  return UniverseService(db_handler).tickers(asset, **filters)
+
+if __name__ == "__main__":
+  # 종목코드 목록을 유니버스에 등록하고, 종목 기본 정보/시세 수집 이후의 상태로 갱신합니다.
+  service = UniverseService()
+  for asset in ("kr_stock", "us_stock"):
+    service.seed(asset)
+  service.refresh("kr_stock")
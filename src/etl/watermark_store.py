@@ -0,0 +1,69 @@
+# src/etl/watermark_store.py
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Tuple
+
+from src.data.db_handler import DBHandler
+
+class WatermarkStore:
+  """
+  기간 조회 수집기의 (테이블, 종목)별 수집 완료 일자(워터마크) 저장소.
+
+  워터마크는 데이터 INSERT와 같은 트랜잭션에서 갱신되므로(`companion_row`), 데이터가
+  저장되지 않았는데 워터마크만 앞서 나가는 일이 없습니다. 워터마크는 요청한 기간의 종료일이 아니라
+  응답에 실제로 있는 마지막 기준일자까지만 전진하므로(`latest_date`), 당일 데이터가 게시되기 전의 실행이나
+  빈 응답이 돌아온 기간은 다음 실행에서 다시 요청합니다. 테이블 전체의 MAX(date)가 아니라
+  종목마다 시작일을 계산하므로, 새로 추가되었거나 이전 실행에서 실패한 종목도
+  정확히 누락된 기간만 다시 수집합니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_watermark.sql"
+  DML_PATH = "./sql/etl_meta/dml/upsert_etl_watermark.sql"
+
+  def __init__(self, db_handler: DBHandler):
+    """
+    Args:
+      db_handler (DBHandler): 워터마크 테이블이 위치한 DB의 핸들러.
+    """
+    self.db_handler = db_handler
+    db_handler.create_table(self.DDL_PATH)
+
+  def load(self, table_name: str, date_column: str) -> Dict[str, str]:
+    """종목별 마지막 수집 완료 일자를 조회합니다.
+
+    워터마크가 없는 종목은 데이터 테이블의 종목별 MAX(date_column)로 보완하므로,
+    워터마크 도입 이전에 적재된 데이터도 다시 수집하지 않습니다.
+
+    Args:
+      table_name (str): 데이터 테이블명.
+      date_column (str): 데이터 테이블의 기준일자 컬럼명.
+
+    Returns:
+      Dict[str, str]: 종목코드 -> 마지막 수집 완료 일자(YYYYMMDD).
+    """
+    watermarks = self.db_handler.get_latest_dates_by_ticker(table_name, date_column)
+    stored = self.db_handler.get_watermarks(table_name)
+    for ticker, watermark_date in stored.items():
+      watermarks[ticker] = max(watermark_date, watermarks.get(ticker, watermark_date))
+    return watermarks
+
+  @staticmethod
+  def start_dates(watermarks: Dict[str, str], tickers: Iterable[str], default_start_date: str) -> Dict[str, str]:
+    """종목별 수집 시작일(워터마크 다음 날, 없으면 기본 시작일)을 계산합니다."""
+    start_dates = {}
+    for ticker in tickers:
+      watermark_date = watermarks.get(ticker)
+      if watermark_date:
+        start_dates[ticker] = (datetime.strptime(watermark_date, "%Y%m%d") + timedelta(days=1)).strftime("%Y%m%d")
+      else:
+        start_dates[ticker] = default_start_date
+    return start_dates
+
+  @staticmethod
+  def latest_date(rows: Iterable[Dict[str, Any]], date_column: str) -> str | None:
+    """응답 행들에 실제로 있는 가장 늦은 기준일자(YYYYMMDD)를 반환합니다. 없으면 None."""
+    dates = [str(row.get(date_column) or "").strip() for row in rows]
+    return max((date for date in dates if len(date) == 8 and date.isdigit()), default=None)
+
+  @classmethod
+  def companion_row(cls, table_name: str, ticker: str, watermark_date: str) -> Tuple[str, tuple]:
+    """데이터 INSERT와 같은 트랜잭션에서 실행할 워터마크 갱신 (SQL 경로, 파라미터)를 반환합니다."""
+    return cls.DML_PATH, (table_name, ticker, watermark_date)
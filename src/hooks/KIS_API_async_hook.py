@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권(KIS) API 연동을 위한 비동기(asyncio) 훅(Hook) 모듈.
+
+`KISAPIHook`의 모든 `get_*` 엔드포인트를 코루틴으로 노출합니다.
+실제 요청은 내부의 `KISAPIHook._send_request`가 전담하므로 재시도, `rt_cd` 오류 처리,
+output 블록 병합 규칙은 동기 훅과 완전히 동일하며, 이 모듈은 동시 실행 개수만 제어합니다.
+
+사용 예시:
+  async with AsyncKISAPIHook(max_concurrency=8) as hook:
+    results = await asyncio.gather(*(hook.get_kr_stock_price_basic(t) for t in tickers))
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Callable, Coroutine, Dict, List
+
+from src.hooks.KIS_API_hook import KISAPIHook
+
+class AsyncKISAPIHook:
+  """KIS REST API를 코루틴으로 호출하는 비동기 훅 클래스.
+
+  세마포어로 동시에 진행 중인 요청 수를 제한하고, 요청 자체는 전용 스레드 풀에서
+  커넥션 풀 세션을 공유하는 동기 훅으로 실행합니다.
+
+  Attributes:
+    hook (KISAPIHook): 실제 요청을 수행하는 동기 훅 인스턴스.
+    max_concurrency (int): 동시에 진행할 수 있는 최대 요청 수.
+  """
+
+  def __init__(self, max_concurrency: int = 8, hook: KISAPIHook | None = None):
+    """AsyncKISAPIHook 인스턴스를 초기화합니다.
+
+    Args:
+      max_concurrency (int): 동시에 진행할 수 있는 최대 요청 수.
+      hook (KISAPIHook | None): 재사용할 동기 훅. 지정하지 않으면 동시 실행 수만큼
+        커넥션을 유지하는 새 훅을 생성합니다.
+    """
+    if max_concurrency < 1:
+      raise ValueError("max_concurrency는 1 이상이어야 합니다.")
+
+    self.max_concurrency = max_concurrency
+    self._owns_hook = hook is None
+    self.hook = hook or KISAPIHook(pool_maxsize=max_concurrency)
+    self._semaphore = asyncio.Semaphore(max_concurrency)
+    self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="kis-async")
+
+  async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """세마포어 한도 내에서 동기 함수를 전용 스레드 풀에 위임해 실행합니다."""
+    async with self._semaphore:
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+  async def get_access_token(self) -> str:
+    """유효한 접근 토큰을 반환합니다. (동기 훅의 캐싱 전략을 그대로 사용)"""
+    return await self._run(self.hook.get_access_token)
+
+  async def _send_request(self, path: str, tr_id: str, params: Dict[str, Any], error_prefix: str) -> List[Dict]:
+    """`KISAPIHook._send_request`의 코루틴 버전입니다.
+
+    Raises:
+      KISDataError: 동기 훅과 동일한 조건에서 발생합니다.
+    """
+    return await self._run(self.hook._send_request, path, tr_id, params, error_prefix)
+
+  def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, List[Dict[str, Any]]]]:
+    """동기 훅의 `get_*` 엔드포인트 메서드를 같은 이름의 코루틴 함수로 노출합니다."""
+    if not name.startswith("get_"):
+      raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    sync_method = getattr(self.hook, name)
+
+    @wraps(sync_method)
+    async def endpoint(*args, **kwargs) -> List[Dict[str, Any]]:
+      return await self._run(sync_method, *args, **kwargs)
+
+    return endpoint
+
+  def close(self):
+    """스레드 풀을 정리하고, 직접 생성한 동기 훅이라면 커넥션 풀도 정리합니다.
+
+    진행 중인 요청이 끝날 때까지 블로킹하므로 이벤트 루프 안에서는 `aclose`를 사용합니다.
+    """
+    self._executor.shutdown(wait=True)
+    if self._owns_hook:
+      self.hook.close()
+
+  async def aclose(self):
+    """`close`의 코루틴 버전. 진행 중인 요청을 기다리는 동안 이벤트 루프를 막지 않도록 별도 스레드에서 정리합니다."""
+    await asyncio.to_thread(self.close)
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exc_type, exc_value, traceback):
+    await self.aclose()
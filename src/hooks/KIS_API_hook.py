@@ -5,20 +5,36 @@
 주요 기능은 다음과 같습니다:
   - API 인증 토큰의 발급 및 캐싱(메모리, 파일)을 통한 효율적인 관리
   - API 요청을 위한 공통 인터페이스 제공 및 재시도 로직 내장
+  - keep-alive 커넥션 풀(requests.Session)을 통한 TLS 핸드셰이크 비용 절감
+  - 토큰 버킷 속도 제한기를 통한 초당 호출 한도 준수 (프로세스 간 공유 가능)
+  - 변경 주기가 긴 엔드포인트(재무제표, 재무비율, 기본 정보)의 디스크 TTL 응답 캐시 (명시적으로 켠 경우)
+  - 연속 조회(tr_cont) 및 기간 이어 붙이기를 따라가는 페이지 스트리밍 제너레이터
+  - 선언적 엔드포인트 테이블(KIS_endpoints)로부터 `get_*` 조회 메서드를 자동 생성
   - API의 다양한 응답 형태(output, output1, output2 등)를 동적으로 파싱하여
     일관된 형식의 데이터로 변환
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
+import hashlib
 import os
 from pathlib import Path
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Mapping, Sequence, Tuple
+import inspect
 
 # 프로젝트의 중앙 에러 관리 패키지에서 커스텀 예외 클래스들을 가져옵니다.
-from src.errors.KIS_API_errors import KISAPIError, KISAuthenticationError, KISDataError
+from src.errors.KIS_API_errors import KISAPIError, KISAuthenticationError, KISDataError, KISRateLimitError, KISTransportError
+from src.utils.rate_limiter import RateLimiter, build_rate_limiter_from_env
+from src.utils.cache_dir import cache_path
+from src.utils.retry_policy import CircuitBreaker, RetryPolicy
+from src.utils.response_cache import SQLiteResponseCache
+from src.utils.process_lock import FileLock, PostgresAdvisoryLock
+from src.utils.telemetry import RunMetrics, current_metrics
+from src.hooks.KIS_endpoints import KIS_ENDPOINTS, KISEndpoint, get_endpoint
 
 class KISAPIHook:
   """한국투자증권(KIS) REST API와의 상호작용을 관리하는 훅(Hook) 클래스.
@@ -31,20 +47,61 @@ class KISAPIHook:
     app_secret (str): KIS API의 앱 시크릿.
     base_url (str): KIS API의 기본 URL (실전 투자 환경).
     token_filepath (Path): API 접근 토큰을 저장하는 로컬 파일 경로.
+    session (requests.Session): keep-alive 커넥션을 재사용하는 HTTP 세션.
+    rate_limiter (RateLimiter): 모든 조회 요청 직전에 토큰을 확보하는 속도 제한기.
+    retry_policy (RetryPolicy): 재시도 가능한 오류의 재시도 횟수 및 백오프 규칙.
+    circuit_breaker (CircuitBreaker): 오류 비율 급증 시 호출을 일시 정지시키는 서킷 브레이커.
+    response_cache (SQLiteResponseCache | None): 응답 캐시. None이면 캐시를 사용하지 않습니다.
+    cache_ttls (Dict[str, float]): 엔드포인트 이름별 캐시 유효 시간(초). 목록에 없는 엔드포인트는 캐시하지 않습니다.
     _access_token (str | None): 발급받은 접근 토큰을 저장하는 내부 변수 (메모리 캐시).
   """
 
-  def __init__(self):
+  # KIS가 초당 거래건수 초과 시 반환하는 메시지 코드
+  THROTTLE_MSG_CODES = frozenset({"EGW00201"})
+
+  # 엔드포인트 선언에 지정된 엔드포인트 이름별 기본 캐시 유효 시간(초)
+  # tr_id는 여러 엔드포인트가 공유할 수 있으므로(예: kr_stock_inquire_price_basic) 이름을 키로 사용합니다.
+  DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    endpoint.name: endpoint.cache_ttl for endpoint in KIS_ENDPOINTS.values() if endpoint.cache_ttl
+  }
+
+  def __init__(self, pool_connections: int = 4, pool_maxsize: int = 10, pool_block: bool = True,
+               rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+               circuit_breaker: CircuitBreaker | None = None, use_cache: bool | None = None,
+               cache_ttls: Dict[str, float] | None = None, token_refresh_margin: timedelta = timedelta(minutes=10),
+               token_lock=None):
     """KISHook 인스턴스를 초기화합니다.
 
-    .env 파일에 저장된 환경 변수로부터 API 키를 로드하며, 키가 없을 경우
+    .env 파일에 저장된 환경 변수로부터 API 키(와 선택적으로 KIS_BASE_URL)를 로드하며, 키가 없을 경우
     프로그램이 즉시 종료되도록 예외를 발생시킵니다.
+
+    Args:
+      pool_connections (int): 세션이 유지할 호스트별 커넥션 풀의 개수.
+      pool_maxsize (int): 호스트 하나당 동시에 유지할 최대 커넥션 수.
+      pool_block (bool): True이면 풀이 가득 찼을 때 새 커넥션을 만들지 않고
+        기존 커넥션이 반환될 때까지 대기합니다. (호스트별 동시 접속 수 제한)
+      rate_limiter (RateLimiter | None): 사용할 속도 제한기. 지정하지 않으면 환경 변수
+        설정에 따라 앱 키 단위로 공유되는 제한기를 사용합니다.
+      retry_policy (RetryPolicy | None): 재시도 규칙. 지정하지 않으면 기본 규칙을 사용합니다.
+      circuit_breaker (CircuitBreaker | None): 서킷 브레이커. 지정하지 않으면 훅 전용으로 생성합니다.
+      use_cache (bool | None): 응답 캐시 사용 여부. 지정하지 않으면 KIS_RESPONSE_CACHE 환경 변수가
+        '1'/'true'인 경우에만 사용합니다. (기본값: 사용 안 함) 캐시 파일 경로는 KIS_RESPONSE_CACHE_PATH
+        환경 변수로 지정합니다. (기본값: 캐시 디렉터리의 'kis_response_cache.sqlite', `cache_dir` 참고)
+      cache_ttls (Dict[str, float] | None): 엔드포인트 이름별 캐시 유효 시간(초). 기본값을 덮어씁니다.
+      token_refresh_margin (timedelta): 만료 시각보다 이만큼 앞서 토큰을 미리 갱신합니다.
+      token_lock (FileLock | PostgresAdvisoryLock | None): 토큰 발급 구간의 프로세스 간 잠금.
+        지정하지 않으면 KIS_TOKEN_LOCK_BACKEND 환경 변수('file' | 'postgres')에 따라 생성합니다.
     """
     # 환경 변수로부터 API 키를 불러옵니다.
     self.app_key = os.getenv("KIS_APP_KEY")
     self.app_secret = os.getenv("KIS_APP_SECRET")
-    self.base_url = "https://openapi.koreainvestment.com:9443"
+    # KIS_BASE_URL로 로컬 스텁 서버 등 다른 주소를 지정할 수 있습니다. (기본값: 실전 투자 환경)
+    self.base_url = os.getenv("KIS_BASE_URL", "https://openapi.koreainvestment.com:9443").rstrip("/")
     self._access_token = None
+    self._token_expired_at: datetime | None = None
+    self.token_refresh_margin = token_refresh_margin
+    self.token_lock = token_lock
+    self._token_thread_lock = threading.Lock()
 
     # 토큰을 저장할 파일 경로를 지정합니다. (프로젝트 루트 기준)
     self.token_filepath = Path("kis_token.json")
@@ -53,12 +110,71 @@ class KISAPIHook:
     if not self.app_key or not self.app_secret:
       raise KISAPIError("환경변수 KIS_APP_KEY와 KIS_APP_SECRET가 설정되지 않았습니다.")
 
+    # 모든 조회 요청이 재사용할 keep-alive 세션을 구성합니다.
+    # 재시도는 _send_request가 직접 관리하므로 어댑터 수준의 재시도는 비활성화합니다.
+    self.session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0, pool_block=pool_block)
+    self.session.mount("https://", adapter)
+    self.session.mount("http://", adapter)
+    self._static_headers: Dict[str, str] | None = None
+
+    # 같은 앱 키를 쓰는 모든 훅이 하나의 호출 한도를 공유하도록 앱 키 해시를 버킷 키로 사용합니다.
+    bucket_key = hashlib.sha256(self.app_key.encode()).hexdigest()[:16]
+    self.rate_limiter = rate_limiter or build_rate_limiter_from_env(bucket_key)
+    self.retry_policy = retry_policy or RetryPolicy()
+    self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    # 캐시는 명시적으로 켠 경우에만 사용합니다.
+    # 캐시 파일은 첫 조회 시점에 생성되므로, 캐시 대상이 아닌 엔드포인트만 쓰면 파일이 만들어지지 않습니다.
+    if use_cache is None:
+      use_cache = os.getenv("KIS_RESPONSE_CACHE", "").strip().lower() in ("1", "true", "yes")
+    if use_cache:
+      self.response_cache = SQLiteResponseCache(os.getenv("KIS_RESPONSE_CACHE_PATH") or cache_path("kis_response_cache.sqlite"))
+    else:
+      self.response_cache = None
+    self.cache_ttls = {**self.DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+
+  def close(self):
+    """세션이 보유한 커넥션 풀과 응답 캐시 연결을 정리합니다."""
+    self.session.close()
+    if self.response_cache is not None:
+      self.response_cache.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  def _build_headers(self, tr_id: str) -> Dict[str, str]:
+    """요청 헤더를 생성합니다.
+
+    요청마다 바뀌지 않는 인증 헤더는 한 번만 만들어 재사용하고, 호출마다
+    달라지는 `tr_id`만 덧붙입니다. 토큰이 갱신되면 정적 헤더도 다시 만듭니다.
+
+    Args:
+      tr_id (str): API별 고유 거래 ID.
+
+    Returns:
+      Dict[str, str]: 요청에 사용할 헤더 딕셔너리.
+    """
+    token = self.get_access_token()
+    if self._static_headers is None or self._static_headers["authorization"] != token:
+      self._static_headers = {
+        "Content-Type": "application/json",
+        "authorization": token,
+        "appKey": self.app_key,
+        "appSecret": self.app_secret,
+      }
+    return {**self._static_headers, "tr_id": tr_id}
+
   def _get_new_access_token(self) -> str:
     """KIS API 서버로부터 새로운 접근 토큰을 발급받고 파일에 저장합니다.
 
     이 메서드는 외부에서 직접 호출하기보다는 get_access_token을 통해 호출됩니다.
     발급 성공 시, 토큰 값과 만료 시각을 JSON 파일에 저장하여 다른 프로세스나
-    다음 실행에서 재사용할 수 있도록 합니다.
+    다음 실행에서 재사용할 수 있도록 합니다. 파일은 임시 파일에 먼저 기록한 뒤
+    rename하므로, 다른 프로세스가 기록 중인 파일을 읽는 일이 없습니다.
 
     Returns:
       str: 새로 발급받은 접근 토큰 문자열 (예: "Bearer ...").
@@ -79,6 +195,7 @@ class KISAPIHook:
 
       # 발급받은 토큰을 Bearer 형식으로 가공하여 self 변수에 저장 (메모리 캐시)
       self._access_token = f"Bearer {token_data['access_token']}"
+      self._token_expired_at = datetime.strptime(token_data['access_token_token_expired'], '%Y-%m-%d %H:%M:%S')
 
       # 파일에 저장할 정보(토큰 값, 만료 시각)를 딕셔너리로 구성
       token_info = {
@@ -86,15 +203,57 @@ class KISAPIHook:
         "expired_at": token_data['access_token_token_expired']
       }
       
-      # JSON 파일에 토큰 정보를 기록하여 영속성을 부여합니다.
-      with open(self.token_filepath, 'w') as f:
+      # JSON 파일에 토큰 정보를 원자적으로 기록하여 영속성을 부여합니다. (write-then-rename)
+      tmp_filepath = self.token_filepath.with_name(f"{self.token_filepath.name}.{os.getpid()}.tmp")
+      with open(tmp_filepath, 'w') as f:
         json.dump(token_info, f)
+      os.replace(tmp_filepath, self.token_filepath)
 
       return self._access_token
 
     except requests.exceptions.RequestException as e:
       raise KISAuthenticationError(f"API 서버 접속 실패: 접근 토큰을 발급받을 수 없습니다. 원인: {e}")
 
+  def _is_token_fresh(self, expired_at: datetime | None) -> bool:
+    """만료 시각까지 갱신 여유 시간(token_refresh_margin) 이상 남았는지 확인합니다."""
+    return expired_at is not None and datetime.now() < expired_at - self.token_refresh_margin
+
+  def _load_token_from_file(self) -> str | None:
+    """토큰 파일에서 충분히 유효한 토큰을 읽어 메모리에 캐싱합니다. 없으면 None을 반환합니다."""
+    try:
+      if self.token_filepath.exists():
+        with open(self.token_filepath, 'r') as f:
+          token_info = json.load(f)
+        
+        # 저장된 만료 시각을 datetime 객체로 변환
+        expired_at = datetime.strptime(token_info['expired_at'], '%Y-%m-%d %H:%M:%S')
+
+        # 토큰이 곧 만료되지 않고, 값이 존재한다면 이를 사용합니다.
+        if self._is_token_fresh(expired_at) and token_info.get('access_token'):
+          self._access_token = token_info['access_token'] # 메모리에 캐싱
+          self._token_expired_at = expired_at
+          return self._access_token
+    except (json.JSONDecodeError, KeyError, ValueError):
+      # 파일 내용이 손상되었거나(JSON 형식 오류), 필요한 키가 없는 경우,
+      # 오류를 무시하고 새로 발급받도록 로직을 진행시킵니다.
+      pass
+    return None
+
+  def _token_process_lock(self):
+    """토큰 발급 구간을 보호할 프로세스 간 잠금 객체를 반환합니다.
+
+    KIS_TOKEN_LOCK_BACKEND가 'postgres'이면 advisory lock을, 그 외에는
+    캐시 디렉터리에 앱 키별로 만든 잠금 파일(flock)을 사용합니다. (`cache_dir` 참고)
+    """
+    if self.token_lock is not None:
+      return self.token_lock
+    if os.getenv("KIS_TOKEN_LOCK_BACKEND", "file").lower() == "postgres":
+      from src.data.db_handler import DBHandler
+      self.token_lock = PostgresAdvisoryLock(DBHandler(db_name="data_lake"), name=f"kis_token:{self.app_key}")
+      return self.token_lock
+    app_key_hash = hashlib.sha256(self.app_key.encode()).hexdigest()[:16]
+    return FileLock(cache_path(f"kis_token_{app_key_hash}.lock"))
+
   def get_access_token(self) -> str:
     """유효한 접근 토큰을 반환합니다.
 
@@ -103,41 +262,94 @@ class KISAPIHook:
     2. 파일 캐시: 스크립트가 재시작되어도 유효기간 내의 토큰을 재사용합니다.
     3. 신규 발급: 위 두 캐시가 모두 유효하지 않을 때만 새로 토큰을 발급받습니다.
 
+    만료 시각 token_refresh_margin 이전부터는 곧 만료될 토큰으로 보고 미리 갱신합니다.
+    신규 발급은 프로세스 간 잠금 안에서 수행하며, 잠금을 얻은 뒤 파일을 다시 확인하므로
+    여러 워커가 동시에 시작하더라도 /oauth2/tokenP는 한 번만 호출됩니다. (single-flight)
+
     Returns:
       str: "Bearer ..." 형식의 유효한 접근 토큰 문자열.
     """
     # 1. 메모리 캐시 확인: 가장 먼저 확인하여 불필요한 I/O를 줄입니다.
-    if self._access_token:
+    #    (만료 시각을 모르는 토큰은 외부에서 직접 주입된 것으로 보고 그대로 사용합니다.)
+    if self._access_token and (self._token_expired_at is None or self._is_token_fresh(self._token_expired_at)):
       return self._access_token
 
-    # 2. 로컬 파일 캐시 확인: 토큰 파일이 존재하고, 내용이 유효하며, 만료되지 않았는지 검사합니다.
-    try:
-      if self.token_filepath.exists():
-        with open(self.token_filepath, 'r') as f:
-          token_info = json.load(f)
-        
-        # 저장된 만료 시각을 datetime 객체로 변환
-        expired_at = datetime.strptime(token_info['expired_at'], '%Y-%m-%d %H:%M:%S')
+    # 2. 로컬 파일 캐시 확인: 토큰 파일이 존재하고, 내용이 유효하며, 곧 만료되지 않는지 검사합니다.
+    token = self._load_token_from_file()
+    if token:
+      return token
 
-        # 토큰이 만료되지 않았고, 값이 존재한다면 이를 사용합니다.
-        if datetime.now() < expired_at and token_info.get('access_token'):
-          self._access_token = token_info['access_token'] # 메모리에 캐싱
-          return self._access_token
-    except (json.JSONDecodeError, KeyError):
-      # 파일 내용이 손상되었거나(JSON 형식 오류), 필요한 키가 없는 경우,
-      # 오류를 무시하고 새로 발급받도록 로직을 진행시킵니다.
-      pass
-    
-    # 3. 모든 캐시가 유효하지 않으면 새로 발급 받습니다.
-    return self._get_new_access_token()
+    # 3. 잠금을 획득한 뒤 다른 프로세스가 먼저 갱신했는지 다시 확인하고, 아니라면 새로 발급 받습니다.
+    with self._token_thread_lock, self._token_process_lock():
+      return self._load_token_from_file() or self._get_new_access_token()
   
+  def _parse_response(self, response: requests.Response, error_prefix: str) -> Dict[str, Any]:
+    """HTTP 응답을 검사하여 JSON 본문을 반환하고, 실패 원인을 재시도 가능 여부에 따라 분류합니다.
+
+    - 호출 한도 초과 (HTTP 429 또는 msg_cd가 THROTTLE_MSG_CODES에 포함): KISRateLimitError
+    - 서버 오류 (HTTP 5xx): KISTransportError
+    - 그 외 HTTP 오류 및 비즈니스 오류 (`rt_cd` != '0'): KISDataError (재시도하지 않음)
+
+    Args:
+      response (requests.Response): 세션이 반환한 HTTP 응답 객체.
+      error_prefix (str): 예외 메시지에 사용할 작업 식별 접두사.
+
+    Returns:
+      Dict[str, Any]: 정상 응답의 JSON 본문.
+    """
+    try:
+      response.raise_for_status() # HTTP 오류 발생 시 예외 throw
+    except requests.exceptions.HTTPError as e:
+      status = response.status_code
+      try:
+        body = response.json()
+      except ValueError:
+        body = {}
+      if status == 429 or body.get('msg_cd') in self.THROTTLE_MSG_CODES:
+        raise KISRateLimitError(f"{error_prefix} 실패: 호출 한도 초과 ({body.get('msg1', status)})") from e
+      if status >= 500:
+        raise KISTransportError(f"{error_prefix} 실패: 서버 오류 (HTTP {status})") from e
+      raise KISDataError(f"{error_prefix} 실패: HTTP {status} {body.get('msg1', '')}".rstrip()) from e
+
+    data = response.json()
+
+    # KIS API 비즈니스 로직 상의 오류 처리 (호출 한도 초과는 재시도 대상으로 분류)
+    if data.get('msg_cd') in self.THROTTLE_MSG_CODES:
+      raise KISRateLimitError(f"{error_prefix} 실패: 호출 한도 초과 ({data.get('msg1')})")
+    if data['rt_cd'] != "0":
+      raise KISDataError(f"{error_prefix} 실패: {data['msg1']}")
+    return data
+
+  @staticmethod
+  def _merge_outputs(data: Dict[str, Any]) -> List[Dict]:
+    """응답 본문의 모든 output 블록을 'data_source'가 표시된 하나의 리스트로 통합합니다."""
+    # 모든 'output' 블록을 담을 빈 리스트 생성
+    merged_list = []
+
+    # API 응답의 모든 키를 순회하며 'output'으로 시작하는 키를 동적으로 찾습니다.
+    for key, value in data.items():
+      if key.startswith('output') and value:
+        # API 응답에서 value는 대부분 리스트 형태([{}, {}])이지만,
+        # 간혹 단일 딕셔너리 형태({})일 수 있어 처리를 통일하기 위해 리스트로 감쌉니다.
+        item_list = value if isinstance(value, list) else [value]
+
+        for item in item_list:
+          # 각 항목(딕셔너리)에 데이터 출처(원본 키 이름)를 기록하여 추적성을 높입니다.
+          item['data_source'] = key
+          merged_list.append(item)
+
+    return merged_list
+
   def _send_request(self, path: str, tr_id: str, params: Dict[str, Any], error_prefix: str) -> List[Dict]:
     """KIS API에 GET 요청을 보내고 응답을 처리하는 공통 메서드.
 
     이 메서드는 API 요청의 전 과정을 추상화하며, 다음과 같은 기능을 내장합니다.
     - 유효한 토큰을 자동으로 헤더에 포함
-    - 요청 실패 시 지정된 횟수만큼 재시도
-    - API 응답의 `rt_cd`를 확인하여 비즈니스 레벨 오류 처리
+    - 커넥션 풀 세션을 통해 keep-alive 커넥션 재사용
+    - 매 시도 직전 속도 제한기에서 토큰을 확보하여 초당 호출 한도 준수
+    - 오류를 호출 한도 초과 / 전송 오류 / 비즈니스 오류로 분류하고,
+      재시도 가능한 오류만 지수 백오프(jitter)로 재시도
+    - 재시도 대상 오류 비율이 급증하면 서킷 브레이커로 모든 호출자를 일시 정지
     - `output`, `output1` 등 다양한 형태의 응답을 하나의 리스트로 통합 및 정규화
 
     Args:
@@ -150,448 +362,245 @@ class KISAPIHook:
     Returns:
       List[Dict]: API 응답의 output 블록들을 통합한 딕셔너리의 리스트.
                    각 딕셔너리에는 'data_source' 키를 통해 원본 output 블록 이름이 추가됩니다.
-                   최종 실패 시 빈 리스트를 반환합니다.
     Raises:
-      KISDataError: API가 비즈니스 오류(`rt_cd` != '0')를 반환하거나,
-                    모든 재시도 후에도 서버 접속에 실패한 경우 발생합니다.
+      KISRateLimitError: 재시도 후에도 호출 한도 초과 응답이 계속되는 경우 발생합니다.
+      KISTransportError: 모든 재시도 후에도 서버 접속에 실패한 경우 발생합니다.
+      KISDataError: API가 비즈니스 오류(`rt_cd` != '0')를 반환한 경우 즉시 발생합니다.
     """
-    token = self.get_access_token()
-    headers = {
-      "Content-Type": "application/json",
-      "authorization": token,
-      "appKey": self.app_key,
-      "appSecret": self.app_secret,
-      "tr_id": tr_id,
-    }
-    url = f"{self.base_url}{path}"
-    
-    max_retries = 3 # 최대 재시도 횟수
-    for attempt in range(max_retries):
-      try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        response.raise_for_status() # HTTP 오류 발생 시 예외 throw
-        data = response.json()
+    data, _ = self._request_page(f"{self.base_url}{path}", self._build_headers(tr_id), params, error_prefix)
+    return self._merge_outputs(data)
 
-        # KIS API 비즈니스 로직 상의 오류 처리
-        if data['rt_cd'] != "0":
-          raise KISDataError(f"{error_prefix} 실패: {data['msg1']}")
-        
-        # 모든 'output' 블록을 담을 빈 리스트 생성
-        merged_list = []
-        
-        # API 응답의 모든 키를 순회하며 'output'으로 시작하는 키를 동적으로 찾습니다.
-        for key, value in data.items():
-          if key.startswith('output') and value:
-            # API 응답에서 value는 대부분 리스트 형태([{}, {}])이지만,
-            # 간혹 단일 딕셔너리 형태({})일 수 있어 처리를 통일하기 위해 리스트로 감쌉니다.
-            item_list = value if isinstance(value, list) else [value]
-            
-            for item in item_list:
-              # 각 항목(딕셔너리)에 데이터 출처(원본 키 이름)를 기록하여 추적성을 높입니다.
-              item['data_source'] = key
-              merged_list.append(item)
-              
-        return merged_list
-
-      except requests.exceptions.RequestException as e:
-        # 요청 실패 시, 마지막 시도라면 예외를 발생시키고, 아니라면 잠시 대기 후 재시도합니다.
-        if attempt == max_retries - 1:
-          raise KISDataError(f"API 서버 접속 실패 (재시도 {max_retries}회 모두 실패): {e}")
-        time.sleep(attempt + 1) # 1, 2초 간격으로 대기
-
-    return [] # 모든 재시도 실패 시, 빈 리스트를 반환하여 후속 처리의 안정성을 높입니다.
-  
-  def get_kr_stock_basic_info(self, stock_code: str) -> Dict[str, Any]:
-    """[국내 주식 정보] 국내 주식 기본 정보를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드 (예: "005930").
+  def _request_page(self, url: str, headers: Dict[str, str], params: Dict[str, Any], error_prefix: str) -> Tuple[Dict[str, Any], str]:
+    """응답 한 페이지를 요청하고, 재시도 가능한 오류는 재시도 정책에 따라 재시도합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 주식 기본 정보 딕셔너리를 담은 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/search-stock-info",
-      tr_id="CTPF1002R",
-      params={
-        "PDNO": stock_code,   # 상품번호 (종목코드)
-        "PRDT_TYPE_CD": "300" # 상품타입코드 (300: 주식)
-      },
-      error_prefix="주식 기본 정보 조회"
-    )
-
-  def get_kr_stock_balance_sheet(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 대차대조표를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 대차대조표 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/balance-sheet",
-      tr_id="FHKST66430100",
-      params={
-        "FID_DIV_CLS_CODE": "1",       # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J", # 조건 시장 분류 코드 (J: 주식)
-        "fid_input_iscd": stock_code   # 입력 종목코드
-      },
-      error_prefix="주식 대차대조표 조회"
-    )
-
-  def get_kr_stock_income_statement(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 손익계산서를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 손익계산서 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/income-statement",
-      tr_id="FHKST66430200",
-      params={
-        "FID_DIV_CLS_CODE": "1",       # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J", # 조건 시장 분류 코드 (J: 주식)
-        "fid_input_iscd": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 손익계산서 조회"
-    )
-  
-  def get_kr_stock_financial_ratio(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 재무비율을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 재무비율 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/financial-ratio",
-      tr_id="FHKST66430300",
-      params={
-        "FID_DIV_CLS_CODE": "1",       # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J", # 조건 시장 분류 코드 (J:주식)
-        "fid_input_iscd": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 재무비율 조회"
-    )
-  
-  def get_kr_stock_profit_ratio(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 수익성비율을 조회합니다.
-    
     Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+      url (str): 요청 URL.
+      headers (Dict[str, str]): 요청 헤더.
+      params (Dict[str, Any]): 쿼리 파라미터.
+      error_prefix (str): 오류 메시지 접두사.
 
     Returns:
-      List[Dict[str, Any]]: 조회된 분기별 수익성비율 딕셔너리의 리스트.
+      Tuple[Dict[str, Any], str]: (파싱된 응답 본문, 응답 헤더의 연속 조회 여부 `tr_cont`)
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/profit-ratio",
-      tr_id="FHKST66430400",
-      params={
-        "fid_input_iscd": stock_code, # 입력 종목코드
-        "FID_DIV_CLS_CODE": "1",      # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J" # 조건 시장 분류 코드 (J:주식)
-      },
-      error_prefix="국내 주식 수익성비율 조회"
-    )
-
-  def get_kr_stock_other_major_ratio(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 기타주요비율을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 기타주요비율 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/other-major-ratios",
-      tr_id="FHKST66430500",
-      params={
-        "fid_input_iscd": stock_code, # 입력 종목코드
-        "fid_div_cls_code": "1",      # 분류 구분 코드(0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J" # 조건 시장 분류 코드 (J:주식)
-      },
-      error_prefix="국내 주식 기타주요비율 조회"
-    )
-
-  def get_kr_stock_stability_ratio(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 안정성비율을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    policy = self.retry_policy
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 안정성비율 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/stability-ratio",
-      tr_id="FHKST66430600",
-      params={
-        "fid_input_iscd": stock_code, # 입력 종목코드
-        "fid_div_cls_code": "1",      # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J" # 조건 시장 분류 코드 (J:주식)
-      },
-      error_prefix="국내 주식 안정성비율 조회"
-    )
-
-  def get_kr_stock_growth_ratio(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 성장성비율을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    # 실행 지표가 연결된 스레드에서는 시도별 지연 시간, 응답 바이트, 오류, 재시도를 기록합니다.
+    metrics = current_metrics()
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 분기별 성장성비율 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/growth-ratio",
-      tr_id="FHKST66430800",
-      params={
-        "fid_input_iscd": stock_code, # 입력 종목코드
-        "fid_div_cls_code": "1",      # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J" # 조건 시장 분류 코드 (J:주식)
-      },
-      error_prefix="국내 주식 성장성비율 조회"
-    )
-  
-  def get_kr_stock_inquire_price_basic(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 현재가] 국내 주식 현재가를 조회합니다.
-    
-    Note:
-        현재 이 함수의 `path`와 `tr_id`가 '성장성비율' 조회와 동일하게
-        설정되어 있습니다. 올바른 현재가 조회(예: FHKST01010100)로 수정이 필요합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    transport_failures, throttle_failures = 0, 0
+    while True:
+      self.circuit_breaker.before_call()
+      started, response = None, None
+      try:
+        self.rate_limiter.acquire()
+        started = time.perf_counter()
+        response = self.session.get(url, headers=headers, params=params, timeout=10)
+        data = self._parse_response(response, error_prefix)
+
+      except KISRateLimitError as e:
+        # 호출 한도 초과: 더 긴 기준 대기 시간으로 재시도합니다.
+        self._record_attempt(metrics, started, response, e)
+        self.circuit_breaker.record_failure()
+        throttle_failures += 1
+        if throttle_failures >= policy.max_throttle_attempts:
+          raise
+        if metrics: metrics.record_retry("throttle")
+        time.sleep(policy.backoff(throttle_failures - 1, throttled=True))
+
+      except (requests.exceptions.RequestException, KISTransportError) as e:
+        # 전송 오류: 마지막 시도라면 예외를 발생시키고, 아니라면 백오프 후 재시도합니다.
+        self._record_attempt(metrics, started, response, e)
+        self.circuit_breaker.record_failure()
+        transport_failures += 1
+        if transport_failures >= policy.max_attempts:
+          raise KISTransportError(f"API 서버 접속 실패 (재시도 {policy.max_attempts}회 모두 실패): {e}") from e
+        if metrics: metrics.record_retry("transport")
+        time.sleep(policy.backoff(transport_failures - 1))
+
+      except KISDataError as e:
+        # 비즈니스 오류는 서버 상태와 무관하므로 서킷 판단에는 성공으로 기록하고 즉시 전파합니다.
+        self._record_attempt(metrics, started, response, e)
+        self.circuit_breaker.record_success()
+        raise
+
+      else:
+        self._record_attempt(metrics, started, response)
+        self.circuit_breaker.record_success()
+        tr_cont = response.headers.get("tr_cont", "") if isinstance(response.headers, Mapping) else ""
+        return data, tr_cont
+
+  @staticmethod
+  def _record_attempt(metrics: RunMetrics | None, started: float | None, response: requests.Response | None, error: Exception | None = None):
+    """요청 시도 한 번의 지연 시간과 응답 크기를 실행 지표에 기록합니다. (요청 전에 실패한 시도는 제외)"""
+    if metrics is None or started is None:
+      return
+    content = getattr(response, "content", None)
+    response_bytes = len(content) if isinstance(content, (bytes, bytearray)) else 0
+    metrics.record_call(time.perf_counter() - started, response_bytes, type(error).__name__ if error else None)
+
+  def iter_pages(self, path: str, tr_id: str, params: Dict[str, Any], error_prefix: str,
+                 max_pages: int | None = None) -> Iterator[List[Dict]]:
+    """연속 조회(`tr_cont`)를 따라가며 응답 페이지를 하나씩 생성하는 제너레이터.
+
+    응답 헤더의 `tr_cont`가 'F' 또는 'M'이면 다음 페이지가 있다는 뜻이므로,
+    요청 헤더에 `tr_cont: N`을 붙이고 응답 본문의 연속 조회 키(`ctx_area_fk100`,
+    `ctx_area_nk100`, `CTS` 등 요청 파라미터와 이름이 같은 값)를 다음 요청에 실어 보냅니다.
+    페이지를 요청 즉시 반환하므로, 호출자는 전체 이력을 메모리에 모으지 않고 스트리밍할 수 있습니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 현재가 정보 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/finance/growth-ratio",
-      tr_id="FHKST66430800",
-      params={
-        "fid_input_iscd": stock_code, # 입력 종목코드
-        "fid_div_cls_code": "1",      # 분류 구분 코드 (0:년, 1:분기)
-        "fid_cond_mrkt_div_code": "J" # 조건 시장 분류 코드 (J:주식)
-      },
-      error_prefix="국내 주식 성장성비율 조회"
-    )
-  
-  def get_kr_stock_dividend(self, stock_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 기간별 배당금 정보를 조회합니다.
-    
     Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-      start_date (str): 조회 시작일 (YYYYMMDD 형식).
-      end_date (str): 조회 종료일 (YYYYMMDD 형식).
+      path (str): 요청할 API의 세부 경로.
+      tr_id (str): API별 고유 거래 ID.
+      params (Dict[str, Any]): 첫 페이지의 쿼리 파라미터. (원본은 수정하지 않습니다)
+      error_prefix (str): 오류 메시지 접두사.
+      max_pages (int | None): 최대 페이지 수. None이면 마지막 페이지까지 조회합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 기간 내 배당금 정보 딕셔너리의 리스트.
+    Yields:
+      List[Dict]: 페이지별로 output 블록들을 통합한 딕셔너리의 리스트.
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/ksdinfo/dividend",
-      tr_id="HHKDB669102C0",
-      params={
-        "CTS": "",            # 연속 조회 검증값 (첫 조회 시 빈칸)
-        "GB1": "0",           # 조회구분 (0:배당전체, 1:결산배당, 2:중간배당)
-        "F_DT": start_date,   # 시작일
-        "T_DT": end_date,     # 종료일
-        "SHT_CD": stock_code, # 입력 종목코드
-        "HIGH_GB": "",        # 고배당여부 (빈칸)
-      },
-      error_prefix="국내 주식 예탁원 정보(배당일정) 조회"
-    )
-  
-  def get_kr_stock_estimate_perform(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 국내 주식 종목추정실적을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    url, params = f"{self.base_url}{path}", dict(params)
+    continued, page_count = False, 0
+    while True:
+      headers = self._build_headers(tr_id)
+      if continued:
+        headers["tr_cont"] = "N"
+      data, tr_cont = self._request_page(url, headers, params, error_prefix)
+      yield self._merge_outputs(data)
+
+      page_count += 1
+      if tr_cont not in ("F", "M") or (max_pages is not None and page_count >= max_pages):
+        return
+
+      # 응답 본문의 연속 조회 키를 대소문자 구분 없이 같은 이름의 요청 파라미터에 반영합니다.
+      cursors = {key.lower(): value for key, value in data.items() if isinstance(value, str)}
+      for key in params:
+        if key.lower() in cursors:
+          params[key] = cursors[key.lower()]
+      continued = True
+
+  def iter_endpoint(self, endpoint: KISEndpoint | str, max_pages: int | None = None, **kwargs: Any) -> Iterator[List[Dict[str, Any]]]:
+    """엔드포인트 선언에 따라 전체 조회 결과를 페이지 단위로 생성하는 제너레이터.
+
+    - 페이지 크기(`max_rows`)가 없는 엔드포인트는 `call_endpoint`로 한 번 조회합니다. (응답 캐시 적용)
+    - `tr_cont` 연속 조회를 지원하는 엔드포인트는 `iter_pages`로 끝까지 따라갑니다.
+    - 기간 조회 엔드포인트(`date_params`, `date_field` 지정)는 한 번에 `max_rows`행까지만 반환하므로,
+      페이지가 가득 차면 종료일을 가장 오래된 행의 전날로 옮겨 시작일에 도달할 때까지 이어서 조회합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 종목추정실적 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/estimate-perform",
-      tr_id="HHKST668300C0",
-      params={
-        "SHT_CD": stock_code # 종목코드
-      },
-      error_prefix="국내 주식 종목추정실적 조회"
-    )
-  
-  def get_kr_stock_invest_opinion(self, stock_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 기간별 종목 투자 의견을 조회합니다.
-    
     Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-      start_date (str): 조회 시작일 (YYYYMMDD 형식).
-      end_date (str): 조회 종료일 (YYYYMMDD 형식).
+      endpoint (KISEndpoint | str): 엔드포인트 선언 또는 등록된 엔드포인트 이름.
+      max_pages (int | None): 연속 조회 1회당 최대 페이지 수.
+      **kwargs: 파라미터 템플릿의 자리표시자 값.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 기간 내 투자 의견 딕셔너리의 리스트.
+    Yields:
+      List[Dict[str, Any]]: 페이지별 조회 결과 리스트.
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/invest-opinion",
-      tr_id="FHKST663300C0",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J",    # 조건 시장 분류 코드(J:주식)
-        "FID_COND_SCR_DIV_CODE": "16633", # 조건 화면 분류 코드 (Primary Key)
-        "FID_INPUT_ISCD": stock_code,     # 입력 종목코드
-        "FID_INPUT_DATE_1": start_date,   # 시작일
-        "FID_INPUT_DATE_2": end_date,     # 종료일
-      },
-      error_prefix="국내 주식 종목투자의견 조회"
-    )
-  
-  def get_kr_stock_invest_opbysec(self, stock_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-    """[국내 주식 정보] 기간별 증권사별 투자의견을 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-      start_date (str): 조회 시작일 (YYYYMMDD 형식).
-      end_date (str): 조회 종료일 (YYYYMMDD 형식).
+    if isinstance(endpoint, str):
+      endpoint = get_endpoint(endpoint)
+    if endpoint.max_rows is None:
+      yield self.call_endpoint(endpoint, **kwargs)
+      return
+
+    params = endpoint.build_params(**kwargs)
+    while True:
+      dates = []
+      for page in self.iter_pages(endpoint.path, endpoint.tr_id, params, endpoint.error_prefix, max_pages=max_pages):
+        if endpoint.date_field:
+          dates.extend(row[endpoint.date_field] for row in page if row.get(endpoint.date_field))
+        yield page
+
+      if not (endpoint.date_field and endpoint.date_params) or len(dates) < endpoint.max_rows:
+        return
+      start_key, end_key = endpoint.date_params
+      next_end = (datetime.strptime(min(dates), "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+      if next_end < params[start_key]:
+        return
+      params = {**params, end_key: next_end}
+
+  def call_endpoint(self, endpoint: KISEndpoint | str, **kwargs: Any) -> List[Dict[str, Any]]:
+    """엔드포인트 선언에 따라 요청 파라미터를 채워 조회 API를 호출합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 기간 내 증권사별 투자의견 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/invest-opbysec",
-      tr_id="FHKST663400C0",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J",    # 조건 시장 분류 코드(J:주식)
-        "FID_COND_SCR_DIV_CODE": "16633", # 조건 화면 분류 코드 (Primary Key)
-        "FID_INPUT_ISCD": stock_code,     # 입력 종목코드
-        "FID_DIV_CLS_CODE": "0",          # 분류구분코드 (0: 전체, 1: 매수, 2: 중립, 3: 매도)
-        "FID_INPUT_DATE_1": start_date,   # 시작일
-        "FID_INPUT_DATE_2": end_date,     # 종료일
-      },
-      error_prefix="국내 주식 증권사별 투자의견 조회"
-    )
-  
-  def get_kr_stock_price_basic(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 기본 시세를 조회합니다.
-    
     Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+      endpoint (KISEndpoint | str): 엔드포인트 선언 또는 등록된 엔드포인트 이름.
+      **kwargs: 파라미터 템플릿의 자리표시자 값 (예: stock_code, start_date, end_date).
 
     Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 기본 시세 딕셔너리의 리스트.
+      List[Dict[str, Any]]: API 응답의 output 데이터를 병합한 리스트.
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-price",
-      tr_id="FHKST01010100",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J", # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 현재가 기본 시세 조회"
-    )
-  
-  def get_kr_stock_price_detail(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 세부 시세를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    if isinstance(endpoint, str):
+      endpoint = get_endpoint(endpoint)
+    return self._send_endpoint_request(endpoint, endpoint.build_params(**kwargs))
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 세부 시세 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-price-2",
-      tr_id="FHPST01010000",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J", # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 현재가 세부 시세 조회"
-    )
-  
-  def get_kr_stock_asking_price(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 호가/예상체결 정보를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+  def call_endpoint_batch(self, endpoint: KISEndpoint | str, stock_codes: Sequence[str]) -> List[Dict[str, Any]]:
+    """여러 종목을 한 번의 요청으로 조회하는 배치 엔드포인트를 호출합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 세부 시세 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn",
-      tr_id="FHKST01010200",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J", # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 호가/예상체결 정보 조회"
-    )
-  
-  def get_kr_stock_investor(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 투자자 정보를 조회합니다.
-    
     Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+      endpoint (KISEndpoint | str): 배치 엔드포인트 선언 또는 등록된 엔드포인트 이름.
+      stock_codes (Sequence[str]): 조회할 종목코드 목록 (최대 `endpoint.batch_size`개).
 
     Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 세부 시세 딕셔너리의 리스트.
+      List[Dict[str, Any]]: 종목별 조회 결과 리스트. 종목코드는 `endpoint.batch_key_field`에 담겨 있습니다.
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-investor",
-      tr_id="FHKST01010900",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J", # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 투자자 정보 조회"
-    )
-  
-  def get_kr_stock_member(self, stock_code: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 회원사 정보를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
+    if isinstance(endpoint, str):
+      endpoint = get_endpoint(endpoint)
+    return self._send_endpoint_request(endpoint, endpoint.build_batch_params(stock_codes))
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 세부 시세 딕셔너리의 리스트.
-    """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-member",
-      tr_id="FHKST01010600",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J", # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code   # 입력 종목코드
-      },
-      error_prefix="국내 주식 회원사 정보 조회"
-    )
-  
-  def get_kr_stock_daily_itemchartprice(self, stock_code: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-    """[국내 주식 시세] 국내 주식의 기간별 시세를 조회합니다.
-    
-    Args:
-      stock_code (str): 조회할 종목의 표준 코드.
-      start_date (str): 조회 시작일 (YYYYMMDD 형식).
-      end_date (str): 조회 종료일 (YYYYMMDD 형식).
+  def _send_endpoint_request(self, endpoint: KISEndpoint, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """엔드포인트 요청을 보내고, 캐시 대상 엔드포인트라면 응답을 캐시합니다.
 
-    Returns:
-      List[Dict[str, Any]]: 조회된 국내 주식 세부 시세 딕셔너리의 리스트.
+    캐시 유효 시간은 `cache_ttls`에서 엔드포인트 이름으로 찾습니다. 캐시 키는 (path, tr_id, params)입니다.
     """
-    return self._send_request(
-      path="/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
-      tr_id="FHKST03010100",
-      params={
-        "FID_COND_MRKT_DIV_CODE": "J",  # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
-        "FID_INPUT_ISCD": stock_code,   # 입력 종목코드
-        "FID_INPUT_DATE_1": start_date, # 시작일
-        "FID_INPUT_DATE_2": end_date,   # 종료일
-        "FID_PERIOD_DIV_CODE": "D",     # 기간분류코드 (D:일봉, W:주봉, M:월봉, Y:년봉)
-        "FID_ORG_ADJ_PRC": "0"          # 수정주가 원주가 가격 여부 (0:수정주가, 1:원주가)
-      },
-      error_prefix="국내 주식 기간별 시세 조회"
-    )
\ No newline at end of file
+    # 캐시 대상 엔드포인트라면 API 호출(및 호출 한도 소비) 없이 캐시된 응답을 반환합니다.
+    cache_ttl = self.cache_ttls.get(endpoint.name) if self.response_cache is not None else None
+    if cache_ttl:
+      cached = self.response_cache.get(endpoint.path, endpoint.tr_id, params)
+      if cached is not None:
+        if (metrics := current_metrics()) is not None:
+          metrics.add("cache_hits")
+        return cached
+
+    merged_list = self._send_request(path=endpoint.path, tr_id=endpoint.tr_id, params=params, error_prefix=endpoint.error_prefix)
+    if cache_ttl:
+      self.response_cache.set(endpoint.path, endpoint.tr_id, params, merged_list, ttl=cache_ttl)
+    return merged_list
+
+def _make_batch_endpoint_method(endpoint: KISEndpoint):
+  """배치 엔드포인트 선언으로부터 `get_{name}(stock_codes)` 조회 메서드를 생성합니다."""
+  def method(self, stock_codes: Sequence[str]) -> List[Dict[str, Any]]:
+    return self.call_endpoint_batch(endpoint, stock_codes)
+
+  method.__name__ = f"get_{endpoint.name}"
+  method.__qualname__ = f"KISAPIHook.get_{endpoint.name}"
+  method.__doc__ = (
+    f"{endpoint.description}\n\n"
+    f"  path: {endpoint.path}\n  tr_id: {endpoint.tr_id}\n\n"
+    f"Args:\n  stock_codes (Sequence[str]): 조회할 종목코드 목록 (최대 {endpoint.batch_size}개).\n"
+    "\nReturns:\n  List[Dict[str, Any]]: 종목별 조회 결과 리스트.\n"
+  )
+  return method
+
+def _make_endpoint_method(endpoint: KISEndpoint):
+  """엔드포인트 선언으로부터 `get_{name}` 조회 메서드를 생성합니다."""
+  signature = inspect.Signature(
+    [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    + [inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str) for arg in endpoint.arguments],
+    return_annotation=List[Dict[str, Any]],
+  )
+
+  def method(self, *args, **kwargs):
+    bound = signature.bind(self, *args, **kwargs)
+    bound.arguments.pop("self")
+    return self.call_endpoint(endpoint, **bound.arguments)
+
+  method.__name__ = f"get_{endpoint.name}"
+  method.__qualname__ = f"KISAPIHook.get_{endpoint.name}"
+  method.__signature__ = signature
+  method.__doc__ = (
+    f"{endpoint.description}\n\n"
+    f"  path: {endpoint.path}\n  tr_id: {endpoint.tr_id}\n\n"
+    f"Args:\n" + "".join(f"  {arg} (str): 파라미터 템플릿의 '{{{arg}}}' 값.\n" for arg in endpoint.arguments)
+    + "\nReturns:\n  List[Dict[str, Any]]: 조회된 데이터 딕셔너리의 리스트.\n"
+  )
+  return method
+
+for _endpoint in KIS_ENDPOINTS.values():
+  _factory = _make_batch_endpoint_method if _endpoint.batch_size else _make_endpoint_method
+  setattr(KISAPIHook, f"get_{_endpoint.name}", _factory(_endpoint))
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권(KIS) REST API 엔드포인트 선언 모듈.
+
+모든 조회 API를 (path, tr_id, 파라미터 템플릿, 날짜 파라미터, 페이지당 최대 행 수, 캐시 TTL)의
+선언적 테이블로 관리합니다. `KISAPIHook`의 `get_*` 메서드는 이 테이블로부터 자동 생성되므로,
+배치/캐시/페이지네이션/동시성 같은 공통 기능은 한 곳만 수정하면 모든 엔드포인트에 적용됩니다.
+
+파라미터 템플릿의 값은 고정 문자열이거나 `{인자명}` 형태의 자리표시자이며,
+자리표시자는 모듈 로드 시 한 번만 컴파일되어 호출마다 재사용됩니다.
+"""
+
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+_DAY = 24 * 3600
+
+# 생성되는 메서드의 위치 인자 순서. 목록에 없는 인자는 템플릿 선언 순서대로 뒤에 붙습니다.
+_ARGUMENT_ORDER = ("stock_code", "start_date", "end_date")
+
+@dataclass(frozen=True)
+class KISEndpoint:
+  """KIS 조회 API 하나에 대한 선언.
+
+  Attributes:
+    name (str): 엔드포인트 이름. 훅 메서드는 `get_{name}`으로 생성됩니다.
+    description (str): 메서드 docstring에 사용할 설명.
+    path (str): API 세부 경로.
+    tr_id (str): API별 고유 거래 ID.
+    error_prefix (str): 오류 메시지 접두사.
+    params (Dict[str, str]): 요청 파라미터 템플릿. 값이 `{인자명}`이면 호출 인자로 치환됩니다.
+    date_params (Tuple[str, str] | None): 조회 기간을 지정하는 (시작일, 종료일) 요청 파라미터 이름.
+    max_rows (int | None): 한 번의 응답(페이지)에 담기는 최대 행 수. 지정된 엔드포인트는 연속 조회 대상입니다.
+    date_field (str | None): 응답 행의 기준일자 필드. 기간 조회를 종료일 이동으로 이어 붙일 때 사용합니다.
+    cache_ttl (float | None): 응답 캐시 유효 시간(초). None이면 캐시하지 않습니다.
+    batch_size (int | None): 한 번에 여러 종목을 조회하는 엔드포인트의 최대 종목 수.
+      지정된 경우 params의 키에 포함된 `{n}`은 1부터 시작하는 종목 순번으로 치환됩니다.
+    batch_key_field (str | None): 배치 응답 행에서 종목코드를 담고 있는 필드.
+    arguments (Tuple[str, ...]): 템플릿에서 추출한 호출 인자 이름 (stock_code, start_date, end_date 순).
+  """
+  name: str
+  description: str
+  path: str
+  tr_id: str
+  error_prefix: str
+  params: Dict[str, str]
+  date_params: Optional[Tuple[str, str]] = None
+  max_rows: Optional[int] = None
+  date_field: Optional[str] = None
+  cache_ttl: Optional[float] = None
+  batch_size: Optional[int] = None
+  batch_key_field: Optional[str] = None
+  arguments: Tuple[str, ...] = field(init=False)
+  _compiled: Tuple[Tuple[str, Optional[str], str], ...] = field(init=False, repr=False)
+
+  def __post_init__(self):
+    compiled, arguments = [], []
+    for key, template in self.params.items():
+      fields_in_template = [name for _, name, _, _ in Formatter().parse(template) if name]
+      for name in fields_in_template:
+        if name not in arguments:
+          arguments.append(name)
+      # 값 전체가 단일 자리표시자이면 인자를 그대로 전달하고, 아니면 고정 문자열/포맷 문자열로 둡니다.
+      is_single_field = len(fields_in_template) == 1 and template == f"{{{fields_in_template[0]}}}"
+      compiled.append((key, fields_in_template[0] if is_single_field else None, template))
+    arguments.sort(key=lambda name: _ARGUMENT_ORDER.index(name) if name in _ARGUMENT_ORDER else len(_ARGUMENT_ORDER))
+    object.__setattr__(self, "arguments", tuple(arguments))
+    object.__setattr__(self, "_compiled", tuple(compiled))
+
+  def build_params(self, **kwargs: Any) -> Dict[str, Any]:
+    """컴파일된 템플릿에 호출 인자를 채워 요청 파라미터를 생성합니다.
+
+    Raises:
+      TypeError: 템플릿에 필요한 인자가 누락된 경우 발생합니다.
+    """
+    missing = [name for name in self.arguments if name not in kwargs]
+    if missing:
+      raise TypeError(f"get_{self.name}() missing required arguments: {missing}")
+    return {
+      key: kwargs[arg] if arg is not None else (template.format_map(kwargs) if "{" in template else template)
+      for key, arg, template in self._compiled
+    }
+
+  def build_batch_params(self, stock_codes: Sequence[str]) -> Dict[str, Any]:
+    """배치 엔드포인트의 템플릿을 종목 수만큼 펼쳐 요청 파라미터를 생성합니다.
+
+    Raises:
+      ValueError: 배치 엔드포인트가 아니거나, 종목 수가 batch_size를 초과한 경우 발생합니다.
+    """
+    if not self.batch_size:
+      raise ValueError(f"'{self.name}'은(는) 배치 조회 엔드포인트가 아닙니다.")
+    if not 0 < len(stock_codes) <= self.batch_size:
+      raise ValueError(f"'{self.name}'은(는) 한 번에 1~{self.batch_size}개 종목만 조회할 수 있습니다. (요청: {len(stock_codes)}개)")
+    params = {}
+    for n, stock_code in enumerate(stock_codes, start=1):
+      for key, arg, template in self._compiled:
+        params[key.format(n=n)] = stock_code if arg is not None else template
+    return params
+
+_STOCK_FINANCE_PARAMS = {
+  "FID_DIV_CLS_CODE": "1",        # 분류 구분 코드 (0:년, 1:분기)
+  "fid_cond_mrkt_div_code": "J",  # 조건 시장 분류 코드 (J: 주식)
+  "fid_input_iscd": "{stock_code}" # 입력 종목코드
+}
+
+_STOCK_RATIO_PARAMS = {
+  "fid_input_iscd": "{stock_code}", # 입력 종목코드
+  "fid_div_cls_code": "1",          # 분류 구분 코드 (0:년, 1:분기)
+  "fid_cond_mrkt_div_code": "J"     # 조건 시장 분류 코드 (J:주식)
+}
+
+_STOCK_QUOTE_PARAMS = {
+  "FID_COND_MRKT_DIV_CODE": "J",   # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
+  "FID_INPUT_ISCD": "{stock_code}" # 입력 종목코드
+}
+
+_ENDPOINTS = (
+  # ----- [국내 주식 정보] -----
+  KISEndpoint(
+    name="kr_stock_basic_info", description="[국내 주식 정보] 국내 주식 기본 정보를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/search-stock-info", tr_id="CTPF1002R",
+    error_prefix="주식 기본 정보 조회",
+    params={
+      "PDNO": "{stock_code}", # 상품번호 (종목코드)
+      "PRDT_TYPE_CD": "300"   # 상품타입코드 (300: 주식)
+    },
+    cache_ttl=12 * 3600, # 당일/전일 종가가 포함되어 있어 반나절만 캐시합니다.
+  ),
+  KISEndpoint(
+    name="kr_stock_balance_sheet", description="[국내 주식 정보] 국내 주식 대차대조표를 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/balance-sheet", tr_id="FHKST66430100",
+    error_prefix="주식 대차대조표 조회", params=_STOCK_FINANCE_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_income_statement", description="[국내 주식 정보] 국내 주식 손익계산서를 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/income-statement", tr_id="FHKST66430200",
+    error_prefix="국내 주식 손익계산서 조회", params=_STOCK_FINANCE_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_financial_ratio", description="[국내 주식 정보] 국내 주식 재무비율을 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/financial-ratio", tr_id="FHKST66430300",
+    error_prefix="국내 주식 재무비율 조회", params=_STOCK_FINANCE_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_profit_ratio", description="[국내 주식 정보] 국내 주식 수익성비율을 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/profit-ratio", tr_id="FHKST66430400",
+    error_prefix="국내 주식 수익성비율 조회",
+    params={
+      "fid_input_iscd": "{stock_code}", # 입력 종목코드
+      "FID_DIV_CLS_CODE": "1",          # 분류 구분 코드 (0:년, 1:분기)
+      "fid_cond_mrkt_div_code": "J"     # 조건 시장 분류 코드 (J:주식)
+    },
+    cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_other_major_ratio", description="[국내 주식 정보] 국내 주식 기타주요비율을 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/other-major-ratios", tr_id="FHKST66430500",
+    error_prefix="국내 주식 기타주요비율 조회", params=_STOCK_RATIO_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_stability_ratio", description="[국내 주식 정보] 국내 주식 안정성비율을 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/stability-ratio", tr_id="FHKST66430600",
+    error_prefix="국내 주식 안정성비율 조회", params=_STOCK_RATIO_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  KISEndpoint(
+    name="kr_stock_growth_ratio", description="[국내 주식 정보] 국내 주식 성장성비율을 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/growth-ratio", tr_id="FHKST66430800",
+    error_prefix="국내 주식 성장성비율 조회", params=_STOCK_RATIO_PARAMS, cache_ttl=7 * _DAY,
+  ),
+  # Note: 현재 '성장성비율' 조회와 동일한 path/tr_id로 설정되어 있습니다.
+  #       올바른 현재가 조회(예: FHKST01010100)로 수정이 필요합니다.
+  #       현재가 엔드포인트이므로 성장성비율과 달리 캐시하지 않습니다. (캐시 TTL은 엔드포인트 이름 기준)
+  KISEndpoint(
+    name="kr_stock_inquire_price_basic", description="[국내 주식 현재가] 국내 주식 현재가를 조회합니다.",
+    path="/uapi/domestic-stock/v1/finance/growth-ratio", tr_id="FHKST66430800",
+    error_prefix="국내 주식 성장성비율 조회", params=_STOCK_RATIO_PARAMS,
+  ),
+  KISEndpoint(
+    name="kr_stock_dividend", description="[국내 주식 정보] 기간별 배당금 정보를 조회합니다.",
+    path="/uapi/domestic-stock/v1/ksdinfo/dividend", tr_id="HHKDB669102C0",
+    error_prefix="국내 주식 예탁원 정보(배당일정) 조회",
+    params={
+      "CTS": "",               # 연속 조회 검증값 (첫 조회 시 빈칸)
+      "GB1": "0",              # 조회구분 (0:배당전체, 1:결산배당, 2:중간배당)
+      "F_DT": "{start_date}",  # 시작일
+      "T_DT": "{end_date}",    # 종료일
+      "SHT_CD": "{stock_code}", # 입력 종목코드
+      "HIGH_GB": "",           # 고배당여부 (빈칸)
+    },
+    date_params=("F_DT", "T_DT"),
+  ),
+  KISEndpoint(
+    name="kr_stock_estimate_perform", description="[국내 주식 정보] 국내 주식 종목추정실적을 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/estimate-perform", tr_id="HHKST668300C0",
+    error_prefix="국내 주식 종목추정실적 조회",
+    params={
+      "SHT_CD": "{stock_code}" # 종목코드
+    },
+  ),
+  KISEndpoint(
+    name="kr_stock_invest_opinion", description="[국내 주식 정보] 기간별 종목 투자 의견을 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/invest-opinion", tr_id="FHKST663300C0",
+    error_prefix="국내 주식 종목투자의견 조회",
+    params={
+      "FID_COND_MRKT_DIV_CODE": "J",    # 조건 시장 분류 코드(J:주식)
+      "FID_COND_SCR_DIV_CODE": "16633", # 조건 화면 분류 코드 (Primary Key)
+      "FID_INPUT_ISCD": "{stock_code}", # 입력 종목코드
+      "FID_INPUT_DATE_1": "{start_date}", # 시작일
+      "FID_INPUT_DATE_2": "{end_date}",   # 종료일
+    },
+    date_params=("FID_INPUT_DATE_1", "FID_INPUT_DATE_2"),
+  ),
+  KISEndpoint(
+    name="kr_stock_invest_opbysec", description="[국내 주식 정보] 기간별 증권사별 투자의견을 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/invest-opbysec", tr_id="FHKST663400C0",
+    error_prefix="국내 주식 증권사별 투자의견 조회",
+    params={
+      "FID_COND_MRKT_DIV_CODE": "J",    # 조건 시장 분류 코드(J:주식)
+      "FID_COND_SCR_DIV_CODE": "16633", # 조건 화면 분류 코드 (Primary Key)
+      "FID_INPUT_ISCD": "{stock_code}", # 입력 종목코드
+      "FID_DIV_CLS_CODE": "0",          # 분류구분코드 (0: 전체, 1: 매수, 2: 중립, 3: 매도)
+      "FID_INPUT_DATE_1": "{start_date}", # 시작일
+      "FID_INPUT_DATE_2": "{end_date}",   # 종료일
+    },
+    date_params=("FID_INPUT_DATE_1", "FID_INPUT_DATE_2"),
+  ),
+  # ----- [국내 주식 시세] -----
+  # 실시간 시세는 수집 시점의 값이 의미 있으므로 cache_ttl을 지정하지 않습니다. (캐시하지 않음)
+  KISEndpoint(
+    name="kr_stock_price_basic", description="[국내 주식 시세] 국내 주식의 기본 시세를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-price", tr_id="FHKST01010100",
+    error_prefix="국내 주식 현재가 기본 시세 조회", params=_STOCK_QUOTE_PARAMS,
+  ),
+  KISEndpoint(
+    name="kr_stock_price_detail", description="[국내 주식 시세] 국내 주식의 세부 시세를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-price-2", tr_id="FHPST01010000",
+    error_prefix="국내 주식 현재가 세부 시세 조회", params=_STOCK_QUOTE_PARAMS,
+  ),
+  KISEndpoint(
+    name="kr_stock_asking_price", description="[국내 주식 시세] 국내 주식의 호가/예상체결 정보를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn", tr_id="FHKST01010200",
+    error_prefix="국내 주식 호가/예상체결 정보 조회", params=_STOCK_QUOTE_PARAMS,
+  ),
+  KISEndpoint(
+    name="kr_stock_investor", description="[국내 주식 시세] 국내 주식의 투자자 정보를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-investor", tr_id="FHKST01010900",
+    error_prefix="국내 주식 투자자 정보 조회", params=_STOCK_QUOTE_PARAMS, max_rows=30,
+  ),
+  KISEndpoint(
+    name="kr_stock_member", description="[국내 주식 시세] 국내 주식의 회원사 정보를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-member", tr_id="FHKST01010600",
+    error_prefix="국내 주식 회원사 정보 조회", params=_STOCK_QUOTE_PARAMS,
+  ),
+  KISEndpoint(
+    name="kr_stock_daily_itemchartprice", description="[국내 주식 시세] 국내 주식의 기간별 시세를 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice", tr_id="FHKST03010100",
+    error_prefix="국내 주식 기간별 시세 조회",
+    params={
+      "FID_COND_MRKT_DIV_CODE": "J",      # 조건 시장 분류 코드 (J:KRX, NX:NXT, UN:통합)
+      "FID_INPUT_ISCD": "{stock_code}",   # 입력 종목코드
+      "FID_INPUT_DATE_1": "{start_date}", # 시작일
+      "FID_INPUT_DATE_2": "{end_date}",   # 종료일
+      "FID_PERIOD_DIV_CODE": "D",         # 기간분류코드 (D:일봉, W:주봉, M:월봉, Y:년봉)
+      "FID_ORG_ADJ_PRC": "0"              # 수정주가 원주가 가격 여부 (0:수정주가, 1:원주가)
+    },
+    date_params=("FID_INPUT_DATE_1", "FID_INPUT_DATE_2"), max_rows=100, date_field="stck_bsop_date",
+  ),
+  KISEndpoint(
+    name="kr_stock_multi_price", description="[국내 주식 시세] 관심종목(멀티종목) 시세를 최대 30종목까지 한 번에 조회합니다.",
+    path="/uapi/domestic-stock/v1/quotations/intstock-multprice", tr_id="FHKST11300006",
+    error_prefix="국내 주식 관심종목(멀티종목) 시세 조회",
+    params={
+      "FID_COND_MRKT_DIV_CODE_{n}": "J",  # n번째 조건 시장 분류 코드 (J:KRX)
+      "FID_INPUT_ISCD_{n}": "{stock_code}" # n번째 입력 종목코드
+    },
+    batch_size=30, batch_key_field="inter_shrn_iscd",
+  ),
+)
+
+KIS_ENDPOINTS: Dict[str, KISEndpoint] = {endpoint.name: endpoint for endpoint in _ENDPOINTS}
+
+def get_endpoint(name: str) -> KISEndpoint:
+  """이름으로 엔드포인트 선언을 조회합니다.
+
+  Raises:
+    ValueError: 등록되지 않은 엔드포인트 이름인 경우 발생합니다.
+  """
+  endpoint = KIS_ENDPOINTS.get(name)
+  if endpoint is None:
+    raise ValueError(f"Unsupported KIS endpoint: '{name}'")
+  return endpoint
@@ -0,0 +1,18 @@
+# src/utils/cache_dir.py
+import os
+from pathlib import Path
+
+def cache_dir() -> Path:
+  """실행 중에 생기는 로컬 파일(응답 캐시, 호출 한도 상태, 잠금 파일, 스냅샷)을 저장할 디렉터리를 반환합니다.
+
+  KIS_CACHE_DIR 환경 변수로 지정하며, 없으면 `$XDG_CACHE_HOME/finsight`(기본값 `~/.cache/finsight`)를 사용합니다.
+  저장소 밖에 두어 실행 파일이 작업 트리에 쌓이지 않도록 합니다. 디렉터리는 파일을 쓰는 쪽에서 생성합니다.
+  """
+  configured = os.getenv("KIS_CACHE_DIR")
+  if configured:
+    return Path(configured).expanduser()
+  return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache").expanduser() / "finsight"
+
+def cache_path(filename: str) -> Path:
+  """캐시 디렉터리 안의 파일 경로를 반환합니다."""
+  return cache_dir() / filename
@@ -1,6 +1,7 @@
 # src/utils/debug_utils.py
 import pandas as pd
-from dataclasses import fields
+
+from src.data.schemas.schema_registry import get_schema
 
 def inspect_dataframe_schema(df: pd.DataFrame, schema_class: type, stage: str = "N/A"):
   """
@@ -19,7 +20,7 @@ def inspect_dataframe_schema(df: pd.DataFrame, schema_class: type, stage: str =
     return
 
   # 스키마 정보
-  schema_columns = {field.name for field in fields(schema_class)}
+  schema_columns = set(get_schema(schema_class).columns)
   print(f"✅ 스키마 '{schema_class.__name__}' 기준 컬럼 수: {len(schema_columns)}개")
 
   # DataFrame 정보
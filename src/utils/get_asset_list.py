@@ -4,8 +4,9 @@ def get_asset_list(asset: Assets):
   kr_stock_list = ['005930', '000660', '373220', '207940', '012450', '005380', '329180', '000270', '105560', '034020', '068270', '042660', '035420', '055550', '032830', '009540', '028260', '012330', '035720', '015760', '086790', '011200', '005490', '064350', '138040', '000810', '402340', '051910', '010140', '010130', '316140', '267260', '033780', '006400', '096770', '259960', '024110', '034730', '086280', '030200', '009150', '066570', '003670', '352820', '003550', '003230', '018260', '017670', '323410', '298040', '267250', '079550', '006800', '272210', '005830', '000100', '047810', '443060', '010120', '000150', '047050', '003490', '326030', '278470', '042700', '010620', '021240', '180640', '071050', '377300', '090430', '005940', '010950', '000720', '032640', '000880', '034220', '016360', '029780', '006260', '039490', '028050', '251270', '241560', '161390', '009830', '001040', '138930', '175330', '051900', '004020', '271560', '078930', '036570', '011070', '128940', '302440', '454910', '035250', '036460', '450080', '011790', '052690', '097950', '002380', '103140', '022100', '012750', '004990', '017800', '001440', '008930', '011170', '011780', '026960', '042670', '088350', '489790', '001450', '004370', '383220', '192820', '111770', '000240', '018880', '030000', '361610', '066970', '081660', '051600', '002790', '006040', '139480', '139130', '028670', '000120', '008770', '009970', '014680', '282330', '023530', '112610', '161890', '017960', '004170', '005850', '006280', '006360', '007310', '375500', '010060', '047040', '069620', '069960', '204320', '009420', '000080', '001800', '003090', '007070', '457190', '011210', '073240', '300720', '007340', '004000', '005300', '012630', '120110', '285130', '185750', '192080', '280360', '137310', '001430', '003240', '004490', '009240', '298050', '071320', '114090', '298020', '014820', '000210', '268280', '001680', '002840', '003030', '003620', '005250', '005420', '006650', '008730', '039130', '069260', '093370', '145720', '000670', '456040', '002710']
   us_stock_list = ['NVDA', 'MSFT', 'AAPL', 'AMZN', 'META', 'GOOGL', 'AVGO', 'GOOG', 'TSLA', 'JPM', 'WMT', 'V', 'LLY', 'ORCL', 'MA', 'NFLX', 'XOM', 'JNJ', 'COST', 'HD', 'ABBV', 'BAC', 'PG', 'PLTR', 'CVX', 'KO', 'GE', 'GE', 'US', 'TMUS', 'UNH', 'CSCO', 'AMD', 'WFC', 'PM', 'MS', 'ABT', 'IBM', 'IBM', 'CRM', 'AXP', 'MCD', 'GS', 'LIN', 'DIS', 'RTX', 'RTX', 'MRK', 'T', 'PEP', 'CAT', 'UBER', 'NOW', 'INTU', 'VZ', 'TMO', 'BKNG', 'TXN', 'BA', 'C', 'SCHW', 'ANET', 'BLK', 'QCOM', 'SPGI', 'BSX', 'ISRG', 'ACN', 'GE', 'GEV', 'TJX', 'TJX', 'AMGN', 'SYK', 'NEE', 'ADBE', 'LOW', 'PGR', 'DHR', 'COF', 'PFE', 'GILD', 'HON', 'APH', 'ETN', 'MU', 'UNP', 'BX', 'PANW', 'DE', 'CMCSA', 'AMAT', 'LRCX', 'KKR', 'KKR', 'ADI', 'ADP', 'MDT', 'COP', 'MO', 'WELL', 'KLA', 'KLAC', 'CB', 'NKE', 'SNPS', 'DASH', 'LMT', 'INTC', 'CRWD', 'PLD', 'VRTX', 'MMC', 'SO', 'ICE', 'SBUX', 'BMY', 'RCL', 'CEG', 'CME', 'CME', 'HCA', 'HCA', 'DUK', 'CDNS', 'PH', 'CVS', 'CVS', 'AMT', 'TT', 'SHW', 'WM', 'MCO', 'ORLY', 'GD', 'MCK', 'DELL', 'NOC', 'CTAS', 'NEM', 'PNC', 'PNC', 'MMM', 'AON', 'CI', 'MSI', 'MDLZ', 'AJG', 'COIN', 'ECL', 'ABNB', 'ITW', 'APO', 'USB', 'EQIX', 'BNY', 'BK', 'FI', 'EMR', 'ELV', 'RSG', 'MAR', 'UPS', 'TDG', 'HWM', 'WMB', 'AZO', 'JCI', 'ADSK', 'CL', 'ZTS', 'PYPL', 'FCX', 'EOG', 'EOG', 'APD', 'HLT', 'VST', 'NSC', 'WDAY', 'TRV', 'MNST', 'TE', 'TEL', 'URI', 'REGN', 'CSX', 'CSX', 'TFC', 'GLW', 'KMI', 'FTNT', 'SPG', 'AEP', 'NXP', 'NXPI', 'COR', 'AXON', 'AFL', 'FAST', 'ROP', 'CMG', 'PWR', 'GM', 'DLR', 'CMI', 'MPC', 'BDX', 'SRE', 'ALL', 'MET', 'NDAQ', 'CARR', 'FDX', 'O', 'PSX', 'SLB', 'DHI', 'PSA', 'LHX', 'IDXX', 'PCAR', 'D', 'CTVA', 'ROST', 'PAYX', 'GWW', 'VLO', 'AMP', 'CBRE', 'CBRE', 'EW', 'CPRT', 'ONEOK', 'OKE', 'XYZ', 'F', 'DDOG', 'GRMN', 'OXY', 'KR', 'AIG', 'BKR', 'TTWO', 'EXC', 'XEL', 'MSCI', 'MSCI', 'CCL', 'AME', 'KMB', 'CCI', 'TGT', 'EA', 'EBAY', 'FANG', 'PEG', 'DAL', 'YUM', 'RMD', 'MPWR', 'KDP', 'KVUE', 'ETR', 'SYY', 'VMC', 'LVS', 'ROK', 'PRU', 'STX', 'HIG', 'LYV', 'CSGP', 'HUM', 'VRSK', 'HSY', 'MLM', 'FICO', 'FIS', 'CHTR', 'CAH', 'VICI', 'A', 'ED', 'CTSH', 'TRGP', 'LEN', 'ACGL', 'WEC', 'WEC', 'UAL', 'MCHP', 'XYL', 'PCG', 'OTIS', 'GE', 'GEHC', 'RJF', 'EL', 'NUE', 'WAB', 'STT', 'EQT', 'EQT', 'TSCO', 'WTW', 'KHC', 'DD', 'IQVIA', 'IQV', 'BRO', 'MTB', 'HPE', 'DXCM', 'ODFL', 'IR', 'VTR', 'EXR', 'FITB', 'WDC', 'WBD', 'ADM', 'EFX', 'BR', 'KEYS', 'IBKR', 'NRG', 'NRG', 'SYF', 'DTE', 'DTE', 'K', 'AWK', 'WRB', 'ROL', 'AVB', 'AEE', 'HP', 'HPQ', 'PPL', 'PPL', 'GIS', 'IRM', 'PHM', 'TTD', 'ATO', 'EXPE', 'MTD', 'VLTO', 'STZ', 'HBAN', 'TDY', 'VRSN', 'PTC', 'PTC', 'IP', 'FE', 'EQR', 'NTRS', 'PPG', 'PPG', 'CBOE', 'TROW', 'CNP', 'SW', 'DRI', 'DOV', 'PODD', 'LULU', 'RF', 'DG', 'CINF', 'SMCI', 'TYL', 'STE', 'ULTA', 'NTAP', 'ES', 'WSM', 'EXE', 'HUBB', 'LH', 'LDOS', 'CHD', 'NVR', 'CPAY', 'DVN', 'CFG', 'TPR', 'JBL', 'FSLR', 'CDW', 'CDW', 'CMS', 'CMS', 'SBA', 'SBAC', 'DLTR', 'EIX', 'GPN', 'TPL', 'ZBH', 'BIIB', 'KEY', 'TSN', 'L', 'DGX', 'GDDY', 'NI', 'ON', 'ON', 'AMCR', 'LII', 'STLD', 'PKG', 'TER', 'GPC', 'RL', 'IT', 'MKC', 'TRMB', 'INVH', 'DECK', 'HAL', 'GEN', 'CTRA', 'PFG', 'WY', 'WST', 'LYB', 'PNR', 'FFIV', 'APTV', 'J', 'WAT', 'ERIE', 'LUV', 'INCY', 'DOW', 'IFF', 'ESS', 'MAA', 'SNA', 'LNT', 'PSKY', 'BG', 'EVRG', 'EXPD', 'FTV', 'BBY', 'DPZ', 'ZBRA', 'TKO', 'TKO', 'KIM', 'CHRW', 'MAS', 'BLDR', 'CLX', 'OMC', 'CNC', 'HOLX', 'ALLE', 'EG', 'TXT', 'JBHT', 'FDS', 'HRL', 'ARE', 'CF', 'CF', 'BALL', 'COO', 'BEN', 'REG', 'WYNN', 'AVY', 'FOX', 'UDR', 'FOXA', 'NDSN', 'PAYC', 'SOLV', 'DOC', 'VTRS', 'BAX', 'IDEX', 'IEX', 'SJM', 'HST', 'JKHY', 'CPT', 'BXP', 'UHS', 'NCLH', 'GL', 'POOL', 'SWK', 'HAS', 'AKAM', 'DAY', 'SWKS', 'AIZ', 'NWSA', 'HII', 'PNW', 'MOS', 'MGM', 'MGM', 'GNRC', 'CPB', 'AOS', 'TAP', 'DVA', 'IVZ', 'IPG', 'RVTY', 'MOH', 'EPAM', 'EPAM', 'ALGN', 'ALB', 'AES', 'AES', 'MRNA', 'CAG', 'KMX', 'MTCH', 'FRT', 'TECH', 'LKQ', 'LKQ', 'HSIC', 'MHK', 'APA', 'APA', 'CRL', 'LW', 'EMN', 'MKTX']
 
+  # 목록에 중복으로 들어간 종목을 순서를 유지하며 제거합니다. (중복 호출 방지)
   if asset == "kr_stock":
-    return kr_stock_list
+    return list(dict.fromkeys(kr_stock_list))
   elif asset == "us_stock":
-    return us_stock_list
+    return list(dict.fromkeys(us_stock_list))
   
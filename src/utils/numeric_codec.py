@@ -0,0 +1,195 @@
+# src/utils/numeric_codec.py
+"""
+KIS 숫자 문자열 코덱.
+
+KIS API는 모든 숫자를 문자열로 반환합니다. ('1,234,500', '-3.25', '+12', '', '0' 등)
+열 묶음(block) 전체를 1차원 배열 하나로 펼치고, ASCII 바이트 배열 위에서 공백 판정과 쉼표 제거를
+벡터 연산으로 수행한 뒤 NumPy가 바이트 문자열을 직접 숫자로 변환합니다. 값별 Python 문자열 연산을 거치지 않으므로
+컬럼 수와 행 수가 늘어도 파싱이 병목이 되지 않습니다.
+
+결측(null) 규칙:
+  1. None, NaN, pd.NA는 결측입니다.
+  2. 공백만 있거나 빈 문자열은 결측입니다.
+  3. `null_values`에 지정한 값(예: EDA 설정의 '0' 자리표시자)은 결측입니다. 원본 값 그대로 비교합니다.
+  4. 그 외 문자열은 앞뒤 공백과 천 단위 쉼표를 제거한 뒤 숫자로 변환합니다. 부호(+/-)와 지수 표기를 허용합니다.
+  5. 숫자로 변환할 수 없는 값은 결측으로 바꾸고, 컬럼별 파싱 실패 수에 포함합니다.
+     'inf', 'nan' 같은 비유한 값도 KIS 응답에서 정상적으로 나올 수 없으므로 파싱 실패입니다.
+     정수 변환에서는 소수부가 있는 값과 int64 범위(-2**63 이상 2**63 미만)를 벗어난 값도 파싱 실패입니다.
+"""
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+_COMMA = ord(",")
+_INT64_BOUND = 2.0 ** 63
+
+def _flatten(block: pd.DataFrame) -> np.ndarray:
+  """열 묶음을 컬럼 순서(column-major)의 1차원 object 배열로 펼칩니다."""
+  return block.to_numpy(dtype=object).ravel(order="F")
+
+def _missing(values: np.ndarray, null_values: list) -> np.ndarray:
+  """펼친 값에서 결측 규칙 1, 3에 해당하는 위치를 계산합니다."""
+  mask = pd.isna(values)
+  if null_values:
+    mask |= pd.Series(values, dtype=object).isin(null_values).to_numpy()
+  return mask
+
+def _to_chars(values: np.ndarray) -> np.ndarray | None:
+  """값들을 (문자 위치, 값) 모양의 ASCII 바이트 배열로 바꿉니다. ASCII가 아닌 문자가 있으면 None을 반환합니다.
+
+  숫자 값은 str() 표현으로 바뀝니다. 문자 위치를 첫 번째 축에 두어 위치별 연산이 연속 메모리에서 수행되도록 합니다.
+  """
+  try:
+    text = values.astype("S")
+  except UnicodeEncodeError:
+    return None
+  return np.ascontiguousarray(text.view(np.uint8).reshape(len(text), text.dtype.itemsize).T)
+
+def _blank(chars: np.ndarray) -> np.ndarray:
+  """공백 문자(제어 문자 포함)만 있거나 빈 값의 위치를 계산합니다. (결측 규칙 2)"""
+  return ~(chars > ord(" ")).any(axis=0)
+
+def _drop_commas(chars: np.ndarray) -> np.ndarray:
+  """바이트 배열에서 천 단위 쉼표를 제거하고 뒤쪽 문자를 앞으로 당깁니다. (제자리 변경)"""
+  width = chars.shape[0]
+  while True:
+    comma = chars == _COMMA
+    has_comma = comma.any(axis=0)
+    if not has_comma.any():
+      return chars
+    # 값마다 첫 쉼표부터 한 칸씩 당깁니다. 반복 횟수는 값 수와 무관하게 (값당 최대 쉼표 수 × 문자 폭)입니다.
+    first = comma.argmax(axis=0)
+    for pos in range(width - 1):
+      np.copyto(chars[pos], chars[pos + 1], where=has_comma & (first <= pos))
+    chars[width - 1, has_comma] = 0
+
+def _parse(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+  """결측이 아닌 값들을 숫자로 변환합니다. (결측 규칙 2, 4)
+
+  Returns:
+    Tuple[np.ndarray, np.ndarray]: (float 배열 - 변환 실패는 NaN, 공백 값 위치)
+  """
+  chars = _to_chars(values)
+  if chars is None:
+    # ASCII가 아닌 문자가 섞인 경우: pandas 문자열 연산으로 정리합니다.
+    text = pd.Series(values, dtype=object).astype(str).str.strip()
+    blank = text.eq("").to_numpy()
+    numbers = pd.to_numeric(text.str.replace(",", "", regex=False), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    return numbers, blank
+
+  blank = _blank(chars)
+  width = chars.shape[0]
+  text = np.ascontiguousarray(_drop_commas(chars).T).view(f"S{width}").ravel()[~blank]
+  numbers = np.full(len(values), np.nan)
+  try:
+    # 바이트 문자열을 NumPy가 직접 변환합니다. (앞뒤 공백, 부호, 지수 표기 허용)
+    numbers[~blank] = text.astype(float)
+  except ValueError:
+    # 변환할 수 없는 값이 섞인 경우에만 값별 변환으로 대체합니다.
+    numbers[~blank] = pd.to_numeric(pd.Series(text.astype("U"), dtype=object), errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+  return numbers, blank
+
+def null_mask(block: pd.DataFrame, null_values: Iterable = ()) -> np.ndarray:
+  """열 묶음에서 결측 규칙(1~3)에 해당하는 위치를 한 번에 계산합니다.
+
+  Args:
+    block (pd.DataFrame): 검사할 열 묶음.
+    null_values (Iterable): 결측으로 처리할 추가 값 목록.
+
+  Returns:
+    np.ndarray: block과 같은 모양의 불리언 배열.
+  """
+  values = _flatten(block)
+  mask = _missing(values, list(null_values))
+  present = ~mask
+  if present.any():
+    chars = _to_chars(values[present])
+    if chars is None:
+      mask[present] = pd.Series(values[present], dtype=object).astype(str).str.strip().eq("").to_numpy()
+    else:
+      mask[present] = _blank(chars)
+  return mask.reshape(block.shape, order="F")
+
+def decode_numeric(block: pd.DataFrame, null_values: Iterable = (), integer: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
+  """KIS 숫자 문자열 열 묶음을 한 번에 숫자형으로 변환합니다.
+
+  Args:
+    block (pd.DataFrame): 변환할 열 묶음.
+    null_values (Iterable): 결측으로 처리할 추가 값 목록 (예: ['0', 0]).
+    integer (bool): True이면 결측을 지원하는 정수(Int64), False이면 float64로 변환합니다.
+
+  Returns:
+    Tuple[pd.DataFrame, Dict[str, int]]: (변환된 열 묶음, 컬럼별 파싱 실패 수)
+  """
+  row_count, column_count = block.shape
+  if column_count == 0:
+    return block.copy(), {}
+  null_values = list(null_values)
+
+  if all(pd.api.types.is_numeric_dtype(dtype) for dtype in block.dtypes):
+    # 이미 숫자형인 묶음은 문자열 정리 없이 결측 규칙만 적용합니다.
+    numbers = block.to_numpy(dtype=float, na_value=np.nan).ravel(order="F")
+    missing = np.isnan(numbers)
+    if null_values:
+      missing |= np.isin(numbers, [value for value in null_values if not isinstance(value, str)])
+    numbers[missing] = np.nan
+    failed = np.zeros(numbers.shape, dtype=bool)
+  else:
+    values = _flatten(block)
+    missing = _missing(values, null_values)
+
+    # [1] 결측이 아닌 값만 공백과 천 단위 쉼표를 제거하고 숫자로 변환합니다.
+    numbers = np.full(len(values), np.nan)
+    present = ~missing
+    if present.any():
+      numbers[present], missing[present] = _parse(values[present])
+
+    # [2] 변환할 수 없는 값은 NaN이 되며, 결측이 아니었던 위치만 파싱 실패로 셉니다.
+    failed = np.isnan(numbers) & ~missing
+
+  # [3] 무한대는 숫자로 변환되더라도 파싱 실패로 봅니다.
+  infinite = np.isinf(numbers)
+  numbers[infinite] = np.nan
+  failed |= infinite
+
+  if integer:
+    # 소수부가 있거나 int64로 표현할 수 없는 값은 정수로 변환하지 않고 파싱 실패로 봅니다.
+    present = ~np.isnan(numbers)
+    invalid = present & ((numbers != np.round(numbers)) | (numbers >= _INT64_BOUND) | (numbers < -_INT64_BOUND))
+    numbers[invalid] = np.nan
+    failed |= invalid
+
+  failures = dict(zip(block.columns, failed.reshape(row_count, column_count, order="F").sum(axis=0).tolist()))
+  numbers = numbers.reshape(row_count, column_count, order="F")
+  if not integer:
+    return pd.DataFrame(numbers, index=block.index, columns=block.columns), failures
+
+  nulls = np.isnan(numbers)
+  integers = np.where(nulls, 0, numbers).astype(np.int64)
+  decoded = pd.DataFrame(
+    {col: pd.arrays.IntegerArray(integers[:, i], nulls[:, i]) for i, col in enumerate(block.columns)},
+    index=block.index,
+  )
+  return decoded, failures
+
+def decode_columns(df: pd.DataFrame, columns: Iterable[str], null_values: Iterable = (), integer: bool = False) -> Tuple[pd.DataFrame, Dict[str, int]]:
+  """DataFrame의 지정한 컬럼들을 한 묶음으로 변환한 복사본을 반환합니다. (decode_numeric 참고)
+
+  Returns:
+    Tuple[pd.DataFrame, Dict[str, int]]: (변환된 DataFrame, 컬럼별 파싱 실패 수)
+  """
+  columns = [col for col in columns if col in df.columns]
+  if not columns:
+    return df, {}
+  decoded, failures = decode_numeric(df[columns], null_values=null_values, integer=integer)
+  df = df.copy()
+  df[columns] = decoded
+  return df, failures
+
+def report_failures(failures: Dict[str, int], label: str) -> int:
+  """파싱 실패가 있는 컬럼을 경고로 출력하고 전체 실패 수를 반환합니다."""
+  failed = {col: count for col, count in failures.items() if count}
+  if failed:
+    print(f"⚠️ [{label}] 숫자로 변환하지 못한 값 {sum(failed.values())}개를 결측으로 처리했습니다: {failed}")
+  return sum(failed.values())
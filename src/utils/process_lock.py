@@ -0,0 +1,99 @@
+# src/utils/process_lock.py
+import fcntl
+import hashlib
+import os
+from pathlib import Path
+
+class FileLock:
+  """
+  fcntl.flock 기반의 프로세스 간 배타 잠금(Context Manager).
+
+  같은 호스트에서 실행되는 여러 프로세스(예: Airflow Celery 워커)가
+  하나의 파일 자원을 안전하게 공유해야 할 때 사용합니다.
+  """
+  def __init__(self, path: str | Path):
+    """
+    Args:
+      path (str | Path): 잠금 파일 경로. 파일이 없으면 생성합니다.
+    """
+    self.path = Path(path)
+    self._fd: int | None = None
+
+  def acquire(self):
+    """잠금을 획득할 때까지 대기합니다."""
+    self.path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+      fcntl.flock(fd, fcntl.LOCK_EX)
+    except BaseException:
+      os.close(fd)
+      raise
+    self._fd = fd
+
+  def release(self):
+    """획득한 잠금을 해제합니다."""
+    if self._fd is None:
+      return
+    try:
+      fcntl.flock(self._fd, fcntl.LOCK_UN)
+    finally:
+      os.close(self._fd)
+      self._fd = None
+
+  def __enter__(self):
+    self.acquire()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.release()
+
+class PostgresAdvisoryLock:
+  """
+  PostgreSQL 세션 수준 advisory lock 기반의 프로세스 간 배타 잠금(Context Manager).
+
+  서로 다른 호스트에서 실행되는 프로세스들이 같은 DB를 바라보고 있을 때,
+  파일 잠금 대신 사용하여 단일 실행(single-flight)을 보장합니다.
+  """
+  def __init__(self, db_handler, name: str):
+    """
+    Args:
+      db_handler (DBHandler): 잠금을 관리할 DB의 핸들러.
+      name (str): 잠금 이름. 이름의 해시값이 advisory lock 키로 사용됩니다.
+    """
+    if db_handler.engine is None:
+      raise ValueError("DB 엔진이 없어 PostgresAdvisoryLock을 사용할 수 없습니다.")
+    self.engine = db_handler.engine
+    # advisory lock 키는 signed bigint이므로 해시의 앞 8바이트를 부호 있는 정수로 변환합니다.
+    self.key = int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "big", signed=True)
+    self._conn = None
+
+  def acquire(self):
+    """잠금을 획득할 때까지 대기합니다."""
+    from sqlalchemy import text
+
+    conn = self.engine.connect()
+    try:
+      conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": self.key})
+    except BaseException:
+      conn.close()
+      raise
+    self._conn = conn
+
+  def release(self):
+    """획득한 잠금을 해제합니다."""
+    from sqlalchemy import text
+
+    if self._conn is None:
+      return
+    try:
+      self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+    finally:
+      self._conn.close()
+      self._conn = None
+
+  def __enter__(self):
+    self.acquire()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.release()
@@ -0,0 +1,200 @@
+# src/utils/rate_limiter.py
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from src.utils.cache_dir import cache_path
+from src.utils.process_lock import FileLock
+
+def _refill_and_reserve(tokens: float, updated_at: float, now: float, rate: float, burst: float, cost: float) -> Tuple[float, float]:
+  """토큰 버킷을 경과 시간만큼 충전한 뒤 cost만큼 토큰을 예약합니다.
+
+  토큰이 부족하면 잔량을 음수로 남겨 '예약'으로 처리합니다. 이후 호출자는
+  음수 잔량만큼 더 오래 대기하게 되므로, 잠금 구간 밖에서 대기하더라도
+  전체 호출 속도가 rate를 넘지 않습니다.
+
+  Returns:
+    Tuple[float, float]: (예약 후 토큰 잔량, 호출 전에 대기해야 할 초)
+  """
+  elapsed = max(0.0, now - updated_at)
+  tokens = min(burst, tokens + elapsed * rate) - cost
+  wait = -tokens / rate if tokens < 0 else 0.0
+  return tokens, wait
+
+class RateLimiter(ABC):
+  """API 호출 속도 제한기에 대한 인터페이스"""
+  @abstractmethod
+  def acquire(self, cost: float = 1.0) -> float:
+    """호출 1건을 위한 토큰을 확보하고, 실제로 대기한 시간(초)을 반환합니다."""
+    pass
+
+class TokenBucketRateLimiter(RateLimiter):
+  """
+  단일 프로세스 내 스레드 간에 공유되는 토큰 버킷 속도 제한기.
+
+  초당 rate개의 토큰이 충전되고 최대 burst개까지 쌓입니다. 요청 처리 시간과 무관하게
+  실제 호출 간격만을 기준으로 제한하므로, 고정 sleep보다 한도를 정확히 활용할 수 있습니다.
+  """
+  def __init__(self, rate: float, burst: float = 1.0,
+               clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+    """
+    Args:
+      rate (float): 초당 허용 요청 수.
+      burst (float): 순간적으로 허용할 최대 연속 요청 수(버킷 용량).
+      clock (Callable): 현재 시각을 반환하는 함수. (테스트용 주입)
+      sleep (Callable): 대기 함수. (테스트용 주입)
+    """
+    if rate <= 0 or burst < 1:
+      raise ValueError("rate는 0보다 크고 burst는 1 이상이어야 합니다.")
+    self.rate, self.burst = float(rate), float(burst)
+    self._clock, self._sleep = clock, sleep
+    self._tokens = self.burst
+    self._updated_at = clock()
+    self._lock = threading.Lock()
+
+  def acquire(self, cost: float = 1.0) -> float:
+    with self._lock:
+      now = self._clock()
+      self._tokens, wait = _refill_and_reserve(self._tokens, self._updated_at, now, self.rate, self.burst, cost)
+      self._updated_at = now
+    if wait > 0:
+      self._sleep(wait)
+    return wait
+
+class FileTokenBucketRateLimiter(RateLimiter):
+  """
+  로컬 파일에 버킷 상태를 저장하여 같은 호스트의 여러 프로세스가
+  하나의 호출 한도를 공유하도록 하는 토큰 버킷 속도 제한기.
+  """
+  def __init__(self, path: str | Path, rate: float, burst: float = 1.0):
+    """
+    Args:
+      path (str | Path): 버킷 상태를 저장할 JSON 파일 경로.
+      rate (float): 초당 허용 요청 수.
+      burst (float): 버킷 용량.
+    """
+    if rate <= 0 or burst < 1:
+      raise ValueError("rate는 0보다 크고 burst는 1 이상이어야 합니다.")
+    self.path = Path(path)
+    self.rate, self.burst = float(rate), float(burst)
+    self._lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+
+  def acquire(self, cost: float = 1.0) -> float:
+    with self._lock:
+      now = time.time() # 프로세스 간 공유를 위해 벽시계 시각을 사용합니다.
+      try:
+        state = json.loads(self.path.read_text())
+        tokens, updated_at = float(state["tokens"]), float(state["updated_at"])
+      except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+        tokens, updated_at = self.burst, now
+
+      tokens, wait = _refill_and_reserve(tokens, updated_at, now, self.rate, self.burst, cost)
+      tmp_path = self.path.with_name(self.path.name + ".tmp")
+      tmp_path.write_text(json.dumps({"tokens": tokens, "updated_at": now}))
+      os.replace(tmp_path, self.path)
+
+    if wait > 0:
+      time.sleep(wait)
+    return wait
+
+class PostgresTokenBucketRateLimiter(RateLimiter):
+  """
+  PostgreSQL 행에 버킷 상태를 저장하여 여러 노드의 수집 프로세스가
+  하나의 호출 한도를 공유하도록 하는 토큰 버킷 속도 제한기.
+
+  충전과 예약을 단일 UPDATE 문으로 처리하므로 행 잠금 시간이 짧고,
+  시각은 DB 서버 시계를 사용하여 노드 간 시계 오차의 영향을 받지 않습니다.
+  """
+  DDL_PATH = "./sql/etl_meta/ddl/create_etl_rate_limit_bucket.sql"
+
+  def __init__(self, db_handler, bucket_key: str, rate: float, burst: float = 1.0):
+    """
+    Args:
+      db_handler (DBHandler): 버킷 테이블이 위치한 DB의 핸들러.
+      bucket_key (str): 호출 한도를 공유할 단위(앱 키 등)의 식별자.
+      rate (float): 초당 허용 요청 수.
+      burst (float): 버킷 용량.
+    """
+    if rate <= 0 or burst < 1:
+      raise ValueError("rate는 0보다 크고 burst는 1 이상이어야 합니다.")
+    if db_handler.engine is None:
+      raise ValueError("DB 엔진이 없어 PostgresTokenBucketRateLimiter를 사용할 수 없습니다.")
+    self.engine = db_handler.engine
+    self.bucket_key = bucket_key
+    self.rate, self.burst = float(rate), float(burst)
+    db_handler.create_table(self.DDL_PATH)
+
+  def acquire(self, cost: float = 1.0) -> float:
+    from sqlalchemy import text
+
+    with self.engine.begin() as conn:
+      conn.execute(
+        text(
+          "INSERT INTO etl_rate_limit_bucket (bucket_key, tokens, updated_at) "
+          "VALUES (:key, :burst, EXTRACT(EPOCH FROM clock_timestamp())) "
+          "ON CONFLICT (bucket_key) DO NOTHING"
+        ),
+        {"key": self.bucket_key, "burst": self.burst},
+      )
+      tokens = conn.execute(
+        text(
+          "UPDATE etl_rate_limit_bucket SET "
+          "tokens = LEAST(:burst, tokens + GREATEST(0, EXTRACT(EPOCH FROM clock_timestamp()) - updated_at) * :rate) - :cost, "
+          "updated_at = EXTRACT(EPOCH FROM clock_timestamp()) "
+          "WHERE bucket_key = :key RETURNING tokens"
+        ),
+        {"key": self.bucket_key, "burst": self.burst, "rate": self.rate, "cost": cost},
+      ).scalar()
+
+    wait = -tokens / self.rate if tokens < 0 else 0.0
+    if wait > 0:
+      time.sleep(wait)
+    return wait
+
+_SHARED_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+_SHARED_LIMITERS_LOCK = threading.Lock()
+
+def build_rate_limiter_from_env(bucket_key: str) -> RateLimiter:
+  """환경 변수 설정에 따라 속도 제한기를 생성합니다.
+
+  같은 프로세스 안에서 같은 bucket_key로 요청하면 동일한 인스턴스를 반환하므로,
+  훅을 여러 개 생성하더라도 하나의 호출 한도를 공유합니다.
+
+  환경 변수:
+    KIS_RATE_LIMIT_PER_SEC: 초당 허용 요청 수 (기본값 15)
+    KIS_RATE_LIMIT_BURST: 버킷 용량 (기본값 5)
+    KIS_RATE_LIMIT_BACKEND: 'memory' | 'file' | 'postgres' (기본값 'memory')
+    KIS_RATE_LIMIT_PATH: 'file' 백엔드의 상태 파일 경로 (기본값: 캐시 디렉터리의 'kis_rate_limit_{bucket_key}.json')
+      기본 경로는 bucket_key마다 다른 파일을 쓰지만, 경로를 지정하면 모든 bucket_key가 그 파일의 호출 한도를 공유합니다.
+
+  Args:
+    bucket_key (str): 호출 한도를 공유할 단위의 식별자.
+
+  Returns:
+    RateLimiter: 설정에 맞는 속도 제한기 인스턴스.
+  """
+  rate = float(os.getenv("KIS_RATE_LIMIT_PER_SEC", "15"))
+  burst = float(os.getenv("KIS_RATE_LIMIT_BURST", "5"))
+  backend = os.getenv("KIS_RATE_LIMIT_BACKEND", "memory").lower()
+
+  with _SHARED_LIMITERS_LOCK:
+    cache_key = (backend, bucket_key)
+    if cache_key in _SHARED_LIMITERS:
+      return _SHARED_LIMITERS[cache_key]
+
+    if backend == "memory":
+      limiter = TokenBucketRateLimiter(rate=rate, burst=burst)
+    elif backend == "file":
+      limiter = FileTokenBucketRateLimiter(os.getenv("KIS_RATE_LIMIT_PATH") or cache_path(f"kis_rate_limit_{bucket_key}.json"), rate=rate, burst=burst)
+    elif backend == "postgres":
+      from src.data.db_handler import DBHandler
+      limiter = PostgresTokenBucketRateLimiter(DBHandler(db_name="data_lake"), bucket_key=bucket_key, rate=rate, burst=burst)
+    else:
+      raise ValueError(f"Unsupported KIS_RATE_LIMIT_BACKEND: '{backend}'")
+
+    _SHARED_LIMITERS[cache_key] = limiter
+    return limiter
@@ -0,0 +1,111 @@
+# src/utils/response_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+class SQLiteResponseCache:
+  """
+  API 응답을 SQLite 파일에 압축 저장하는 TTL + LRU 응답 캐시.
+
+  키는 (path, tr_id, params)로 구성되며, 각 항목은 저장 시 지정한 TTL이 지나면 만료됩니다.
+  전체 저장 용량이 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+  WAL 모드를 사용하므로 여러 프로세스가 같은 캐시 파일을 동시에 읽을 수 있습니다.
+  """
+  def __init__(self, path: str | Path, max_bytes: int = 256 * 1024 * 1024):
+    """
+    Args:
+      path (str | Path): 캐시 SQLite 파일 경로. 첫 사용 시점에 생성됩니다.
+      max_bytes (int): 압축된 응답 본문 기준 최대 저장 용량.
+    """
+    self.path = Path(path)
+    self.max_bytes = max_bytes
+    self._conn: Optional[sqlite3.Connection] = None
+    self._lock = threading.Lock()
+
+  def _connection(self) -> sqlite3.Connection:
+    """캐시 DB 연결을 지연 생성합니다. (잠금을 획득한 상태에서만 호출)"""
+    if self._conn is None:
+      self.path.parent.mkdir(parents=True, exist_ok=True)
+      conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+      conn.execute("PRAGMA journal_mode=WAL")
+      conn.execute(
+        "CREATE TABLE IF NOT EXISTS response_cache ("
+        "  key TEXT PRIMARY KEY, path TEXT NOT NULL, expires_at REAL NOT NULL,"
+        "  last_access REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+      )
+      conn.execute("CREATE INDEX IF NOT EXISTS idx_response_cache_last_access ON response_cache (last_access)")
+      conn.commit()
+      self._conn = conn
+    return self._conn
+
+  @staticmethod
+  def make_key(path: str, tr_id: str, params: Dict[str, Any]) -> str:
+    """(path, tr_id, params)로부터 순서에 무관한 캐시 키를 생성합니다."""
+    raw = json.dumps([path, tr_id, sorted(params.items())], ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+  def get(self, path: str, tr_id: str, params: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """유효한 캐시 항목을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+
+    반환값은 매번 새로 역직렬화되므로 호출자가 자유롭게 수정해도 캐시에 영향이 없습니다.
+    """
+    key, now = self.make_key(path, tr_id, params), time.time()
+    with self._lock:
+      conn = self._connection()
+      row = conn.execute("SELECT expires_at, payload FROM response_cache WHERE key = ?", (key,)).fetchone()
+      if row is None:
+        return None
+      expires_at, payload = row
+      if expires_at <= now:
+        conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+        conn.commit()
+        return None
+      conn.execute("UPDATE response_cache SET last_access = ? WHERE key = ?", (now, key))
+      conn.commit()
+    return json.loads(zlib.decompress(payload))
+
+  def set(self, path: str, tr_id: str, params: Dict[str, Any], value: List[Dict[str, Any]], ttl: float):
+    """응답을 압축하여 저장하고, 용량을 초과하면 LRU 순서로 항목을 제거합니다."""
+    key, now = self.make_key(path, tr_id, params), time.time()
+    payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+    with self._lock:
+      conn = self._connection()
+      conn.execute(
+        "INSERT OR REPLACE INTO response_cache (key, path, expires_at, last_access, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+        (key, path, now + ttl, now, len(payload), payload),
+      )
+      self._evict(conn)
+      conn.commit()
+
+  def _evict(self, conn: sqlite3.Connection):
+    """만료된 항목을 지우고, 남은 용량이 max_bytes 이하가 될 때까지 LRU 항목을 제거합니다."""
+    conn.execute("DELETE FROM response_cache WHERE expires_at <= ?", (time.time(),))
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+    if total <= self.max_bytes:
+      return
+    evict_keys = []
+    for key, size in conn.execute("SELECT key, size FROM response_cache ORDER BY last_access"):
+      if total <= self.max_bytes:
+        break
+      evict_keys.append((key,))
+      total -= size
+    conn.executemany("DELETE FROM response_cache WHERE key = ?", evict_keys)
+
+  def clear(self):
+    """모든 캐시 항목을 제거합니다."""
+    with self._lock:
+      conn = self._connection()
+      conn.execute("DELETE FROM response_cache")
+      conn.commit()
+
+  def close(self):
+    """캐시 DB 연결을 닫습니다."""
+    with self._lock:
+      if self._conn is not None:
+        self._conn.close()
+        self._conn = None
@@ -0,0 +1,138 @@
+# src/utils/retry_policy.py
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+@dataclass(frozen=True)
+class RetryPolicy:
+  """
+  재시도 가능한 오류에 대한 재시도 횟수와 지수 백오프(jitter 포함) 규칙.
+
+  Attributes:
+    max_attempts (int): 전송 오류(네트워크, 5xx)에 대한 최대 시도 횟수.
+    max_throttle_attempts (int): 호출 한도 초과 응답에 대한 최대 시도 횟수.
+    base_delay (float): 전송 오류 백오프의 기준 대기 시간(초).
+    throttle_base_delay (float): 호출 한도 초과 백오프의 기준 대기 시간(초).
+      KIS는 초 단위로 호출 수를 집계하므로 1초 이상을 권장합니다.
+    max_delay (float): 한 번에 대기할 수 있는 최대 시간(초).
+  """
+  max_attempts: int = 3
+  max_throttle_attempts: int = 6
+  base_delay: float = 0.5
+  throttle_base_delay: float = 1.0
+  max_delay: float = 16.0
+
+  def backoff(self, attempt: int, throttled: bool = False) -> float:
+    """attempt번째(0부터 시작) 실패 후 대기할 시간을 계산합니다.
+
+    지수적으로 증가하는 상한의 절반은 반드시 대기하고, 나머지 절반은 무작위로
+    분산시켜(equal jitter) 여러 호출자가 동시에 재시도하는 현상을 막습니다.
+    """
+    base = self.throttle_base_delay if throttled else self.base_delay
+    ceiling = min(self.max_delay, base * (2 ** attempt))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+class CircuitBreaker:
+  """
+  최근 호출들의 오류 비율이 급증하면 모든 호출자를 일정 시간 멈추게 하는 서킷 브레이커.
+
+  - closed: 정상 상태. 최근 window_size개 호출 결과를 기록합니다.
+  - open: 오류 비율이 failure_threshold 이상이 되면 cooldown초 동안 모든 호출을 대기시킵니다.
+  - half-open: cooldown이 끝난 뒤 한 호출만 탐색(probe) 호출로 통과시키고, 나머지 호출자는 그 결과가 나올 때까지
+    대기시킵니다. 탐색 호출이 성공하면 closed로, 실패하면 다시 open으로 전환합니다. 서킷이 열리기 전에 시작된
+    호출의 결과는 상태 판단에 사용하지 않습니다.
+
+  호출을 실패시키지 않고 대기시키므로, 한도 초과가 몰리는 구간에서도 데이터 유실 없이
+  요청 속도만 자연스럽게 낮춰집니다.
+  """
+  def __init__(self, failure_threshold: float = 0.5, window_size: int = 20, min_calls: int = 10,
+               cooldown: float = 30.0, clock: Callable[[], float] = time.monotonic,
+               sleep: Callable[[float], None] = time.sleep):
+    """
+    Args:
+      failure_threshold (float): 서킷을 여는 오류 비율 (0~1).
+      window_size (int): 오류 비율 계산에 사용할 최근 호출 수.
+      min_calls (int): 오류 비율을 판단하기 위한 최소 호출 수.
+      cooldown (float): 서킷이 열린 뒤 호출을 멈추는 시간(초).
+      clock (Callable): 현재 시각을 반환하는 함수. (테스트용 주입)
+      sleep (Callable): 대기 함수. (테스트용 주입)
+    """
+    self.failure_threshold = failure_threshold
+    self.min_calls = min_calls
+    self.cooldown = cooldown
+    self._clock, self._sleep = clock, sleep
+    self._outcomes: deque = deque(maxlen=window_size)
+    self._open_until = 0.0
+    self._half_open = False
+    self._probe: int | None = None # 탐색 호출을 수행 중인 스레드 식별자
+    self._lock = threading.Lock()
+    self._probe_done = threading.Condition(self._lock)
+
+  @property
+  def is_open(self) -> bool:
+    return self._clock() < self._open_until
+
+  def before_call(self) -> float:
+    """서킷이 열려 있다면 닫힐 때까지 대기하고, 대기한 시간(초)을 반환합니다.
+
+    half-open 상태에서는 첫 호출자만 탐색 호출로 통과하고, 나머지는 탐색 결과가 기록될 때까지 대기합니다.
+    탐색 호출이 cooldown 안에 결과를 기록하지 않으면(예상하지 못한 예외 등) 대기하던 호출자가 탐색을 이어받습니다.
+    """
+    with self._lock:
+      wait = self._open_until - self._clock()
+    waited = 0.0
+    while True:
+      if wait > 0:
+        self._sleep(wait)
+        waited += wait
+      with self._probe_done:
+        if not self._half_open:
+          return waited
+        if self._probe is None:
+          self._probe = threading.get_ident()
+          return waited
+        probe, started = self._probe, time.monotonic()
+        if not self._probe_done.wait(timeout=self.cooldown) and self._probe == probe:
+          self._probe = threading.get_ident()
+          return waited + (time.monotonic() - started)
+        waited += time.monotonic() - started
+        wait = self._open_until - self._clock()
+
+  def record_success(self):
+    """성공한 호출을 기록합니다."""
+    with self._lock:
+      if self._half_open:
+        if not self._is_probe():
+          return
+        self._half_open, self._probe = False, None
+        self._probe_done.notify_all()
+      self._outcomes.append(True)
+
+  def record_failure(self):
+    """재시도 대상 오류로 실패한 호출을 기록하고, 필요하면 서킷을 엽니다."""
+    with self._lock:
+      if self._half_open:
+        if self._is_probe():
+          self._trip()
+          self._probe_done.notify_all()
+        return
+      self._outcomes.append(False)
+      if len(self._outcomes) < self.min_calls:
+        return
+      failure_rate = self._outcomes.count(False) / len(self._outcomes)
+      if failure_rate >= self.failure_threshold:
+        self._trip()
+
+  def _is_probe(self) -> bool:
+    """현재 스레드가 탐색 호출을 수행 중인지 여부. (잠금을 획득한 상태에서만 호출)"""
+    return self._probe == threading.get_ident()
+
+  def _trip(self):
+    """서킷을 열고 기록을 초기화합니다. (잠금을 획득한 상태에서만 호출)"""
+    self._open_until = self._clock() + self.cooldown
+    self._outcomes.clear()
+    self._half_open = True
+    self._probe = None
@@ -1,9 +1,8 @@
 # src/utils/sql_generator.py
-import inspect
-import re
-from dataclasses import fields, is_dataclass
 from types import ModuleType
-from typing import Type, Any, Dict, List
+from typing import List
+
+from src.data.schemas.schema_registry import SchemaRegistry, TableSchema
 
 class SQLGenerator:
   """
@@ -14,56 +13,32 @@ class SQLGenerator:
   def __init__(self, schemas_module: ModuleType):
     """
     스키마 모듈을 입력받아 내부에 정의된 모든 데이터클래스를 로드합니다.
+    컬럼 순서, 테이블 이름, SQL 타입은 스키마 레지스트리에서 한 번만 계산한 값을 사용합니다.
     
     Args:
         schemas_module (ModuleType): @dataclass가 정의된 파이썬 모듈
     """
-    self.schemas: Dict[str, Type[Any]] = self._discover_dataclasses(schemas_module)
-    print(f"✅ {len(self.schemas)}개의 데이터클래스 스키마를 성공적으로 로드했습니다.")
-
-  def _discover_dataclasses(self, module: ModuleType) -> Dict[str, Type[Any]]:
-    """모듈 내에서 모든 데이터클래스를 찾아 딕셔너리로 반환합니다."""
-    found_schemas = {}
-    for name, obj in inspect.getmembers(module):
-      # is_dataclass()는 @dataclass로 정의된 클래스인지 확인합니다.
-      if is_dataclass(obj):
-        # 동일한 이름의 클래스가 중복 정의된 경우, 파일의 더 마지막에 정의된 것을 사용합니다.
-        # 이는 수정된 최종 버전을 채택하기 위함입니다.
-        if name not in found_schemas or \
-          inspect.getsourcelines(obj)[1] > inspect.getsourcelines(found_schemas[name])[1]:
-          found_schemas[name] = obj
-    return found_schemas
+    self.registry = SchemaRegistry(schemas_module)
+    print(f"✅ {len(self.registry.names())}개의 데이터클래스 스키마를 성공적으로 로드했습니다.")
 
-  def _map_type(self, py_type: Type[Any]) -> str:
-    """Python 타입을 PostgreSQL 타입으로 변환합니다."""
-    type_mapping = {
-      str: "TEXT",
-      int: "INTEGER",
-      float: "REAL",
-    }
-    return type_mapping.get(py_type, "TEXT") # 매핑에 없는 타입은 TEXT로 기본 처리
-
-  def _to_snake_case(self, name: str) -> str:
-    """CamelCase 클래스 이름을 snake_case 테이블 이름으로 변환합니다."""
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+  def _get_schema(self, schema_name: str) -> TableSchema:
+    try:
+      return self.registry.get(schema_name)
+    except KeyError:
+      raise ValueError(f"'{schema_name}' 스키마를 찾을 수 없습니다.") from None
 
   def get_available_schemas(self) -> List[str]:
     """로드된 모든 스키마의 이름을 리스트로 반환합니다."""
-    return list(self.schemas.keys())
+    return self.registry.names()
 
   def generate_create_sql(self, schema_name: str, primary_key: str = 'ticker') -> str:
     """데이터클래스 이름을 기반으로 CREATE TABLE SQL문을 생성합니다."""
-    if schema_name not in self.schemas:
-      raise ValueError(f"'{schema_name}' 스키마를 찾을 수 없습니다.")
-    
-    dataclass = self.schemas[schema_name]
-    table_name = self._to_snake_case(schema_name)
+    schema = self._get_schema(schema_name)
+    table_name = schema.table_name
     
     columns = ["id SERIAL PRIMARY KEY"]
-    for field in fields(dataclass):
-      col_name = field.name
-      sql_type = self._map_type(field.type)
+    for col_name in schema.columns:
+      sql_type = schema.sql_types[col_name]
       constraints = f"UNIQUE NOT NULL" if col_name == primary_key else ""
       columns.append(f"{col_name} {sql_type} {constraints}".strip())
     
@@ -74,13 +49,10 @@ class SQLGenerator:
 
   def generate_upsert_sql(self, schema_name: str, conflict_key: str = 'ticker') -> str:
     """데이터클래스 이름을 기반으로 UPSERT (INSERT ON CONFLICT) SQL문을 생성합니다."""
-    if schema_name not in self.schemas:
-      raise ValueError(f"'{schema_name}' 스키마를 찾을 수 없습니다.")
-        
-    dataclass = self.schemas[schema_name]
-    table_name = self._to_snake_case(schema_name)
+    schema = self._get_schema(schema_name)
+    table_name = schema.table_name
     
-    field_names = [f.name for f in fields(dataclass)]
+    field_names = list(schema.columns)
     
     columns_str = ", ".join(field_names)
     placeholders_str = ", ".join(["%s"] * len(field_names))
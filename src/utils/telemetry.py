@@ -0,0 +1,103 @@
+# src/utils/telemetry.py
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+_local = threading.local()
+
+def current_metrics() -> "RunMetrics | None":
+  """현재 스레드에 연결된 수집 실행 지표를 반환합니다. 연결되지 않았으면 None."""
+  return getattr(_local, "metrics", None)
+
+@contextmanager
+def bind_metrics(metrics: "RunMetrics | None") -> Iterator[None]:
+  """블록 안에서 현재 스레드의 API 호출 지표를 metrics에 기록하도록 연결합니다.
+
+  훅은 여러 CONFIG가 공유하므로, 작업을 실행하는 스레드에 지표를 연결하여
+  호출 지표가 어느 실행에 속하는지 구분합니다.
+  """
+  previous = current_metrics()
+  _local.metrics = metrics
+  try:
+    yield
+  finally:
+    _local.metrics = previous
+
+class RunMetrics:
+  """
+  수집 실행 하나의 구조화된 지표 (스레드 안전).
+
+  - API 호출: 호출 수, 재시도 수(유형별), 오류 클래스별 횟수, 지연 시간 분포, 응답 바이트
+  - 단계별 소요 시간: fetch(작업 단위 수집), transform(변환), insert(DB 저장) 등
+  - 처리량: 수집/저장 행 수와 초당 행 수
+  """
+  def __init__(self, run_id: str, table_name: str):
+    self.run_id = run_id
+    self.table_name = table_name
+    self.started_at = datetime.now(timezone.utc)
+    self._started = time.monotonic()
+    self._lock = threading.Lock()
+    self._latencies: List[float] = []
+    self.calls = 0
+    self.response_bytes = 0
+    self.retries: Counter = Counter()
+    self.errors: Counter = Counter()
+    self.stage_seconds: Dict[str, float] = defaultdict(float)
+    self.counters: Counter = Counter()
+
+  def record_call(self, latency: float, response_bytes: int = 0, error: str | None = None):
+    """API 요청 한 번(재시도 포함 각 시도)의 결과를 기록합니다."""
+    with self._lock:
+      self.calls += 1
+      self._latencies.append(latency)
+      self.response_bytes += response_bytes
+      if error:
+        self.errors[error] += 1
+
+  def record_retry(self, kind: str):
+    """재시도 한 번을 유형(throttle, transport 등)별로 기록합니다."""
+    with self._lock:
+      self.retries[kind] += 1
+
+  def add(self, counter: str, value: int = 1):
+    """행 수, 바이트 등 누적 값을 더합니다."""
+    with self._lock:
+      self.counters[counter] += value
+
+  @contextmanager
+  def stage(self, name: str) -> Iterator[None]:
+    """블록의 소요 시간을 단계(name)별로 누적합니다."""
+    started = time.perf_counter()
+    try:
+      yield
+    finally:
+      elapsed = time.perf_counter() - started
+      with self._lock:
+        self.stage_seconds[name] += elapsed
+
+  def summary(self) -> Dict[str, Any]:
+    """실행 지표 요약을 JSON으로 직렬화 가능한 딕셔너리로 반환합니다."""
+    with self._lock:
+      elapsed = time.monotonic() - self._started
+      latencies = np.asarray(self._latencies, dtype=float)
+      p50, p95, p99 = (np.percentile(latencies, [50, 95, 99]) * 1000).round(1).tolist() if latencies.size else (None, None, None)
+      rows_written = self.counters.get("rows_written", 0)
+      return {
+        "run_id": self.run_id,
+        "table_name": self.table_name,
+        "started_at": self.started_at.isoformat(),
+        "elapsed_seconds": round(elapsed, 3),
+        "calls": self.calls,
+        "retries": dict(self.retries),
+        "errors": dict(self.errors),
+        "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+        "response_bytes": self.response_bytes,
+        "rows_per_second": round(rows_written / elapsed, 1) if elapsed > 0 else None,
+        "stage_seconds": {name: round(seconds, 3) for name, seconds in self.stage_seconds.items()},
+        **{name: value for name, value in self.counters.items()},
+      }
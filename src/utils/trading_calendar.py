@@ -0,0 +1,85 @@
+# src/utils/trading_calendar.py
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+# 매년 같은 날짜에 휴장하는 KRX 휴장일 (MMDD): 신정, 삼일절, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절, 연말 휴장일
+KRX_FIXED_HOLIDAYS: FrozenSet[str] = frozenset({"0101", "0301", "0505", "0606", "0815", "1003", "1009", "1225", "1231"})
+
+class KRXTradingCalendar:
+  """
+  KRX(한국거래소) 영업일 달력.
+
+  주말과 매년 고정된 휴장일을 제외한 날을 영업일로 봅니다. 설날/추석 같은 음력 공휴일,
+  대체공휴일, 선거일 등 해마다 달라지는 휴장일은 `holidays`로 추가할 수 있습니다.
+  휴장일을 빠뜨리면 구간에 실제 영업일이 조금 적게 담길 뿐입니다. (요청 수가 약간 늘어남)
+  반대로 실제 영업일을 휴장일로 보는 경우(1998년 12월 이전의 토요일 거래, 1991~2012년의 한글날 등)에도
+  `pack_ranges`의 구간들은 시작일부터 종료일까지 빈틈없이 이어지므로 그 날의 행이 누락되지 않고,
+  구간에 담긴 행이 응답 한도를 넘으면 연속 조회로 이어서 받습니다.
+  """
+  def __init__(self, holidays: Iterable[str] = (), fixed_holidays: Iterable[str] = KRX_FIXED_HOLIDAYS):
+    """
+    Args:
+      holidays (Iterable[str]): 추가 휴장일 목록 (YYYYMMDD).
+      fixed_holidays (Iterable[str]): 매년 반복되는 휴장일 목록 (MMDD).
+    """
+    self.holidays = frozenset(holidays)
+    self.fixed_holidays = frozenset(fixed_holidays)
+    self._years: Dict[int, List[str]] = {}
+
+  def is_trading_day(self, day: date) -> bool:
+    """주어진 날짜가 영업일인지 확인합니다."""
+    if day.weekday() >= 5:
+      return False
+    day_str = day.strftime("%Y%m%d")
+    return day_str not in self.holidays and day_str[4:] not in self.fixed_holidays
+
+  def _trading_days_of_year(self, year: int) -> List[str]:
+    """연도별 영업일 목록을 한 번만 계산하여 재사용합니다. (전 종목 계획 시 반복 계산 방지)"""
+    if year not in self._years:
+      day, days = date(year, 1, 1), []
+      while day.year == year:
+        if self.is_trading_day(day):
+          days.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+      self._years[year] = days
+    return self._years[year]
+
+  def trading_days(self, start_date: str, end_date: str) -> List[str]:
+    """시작일과 종료일 사이(양 끝 포함)의 영업일 목록을 반환합니다.
+
+    Args:
+      start_date (str): 시작일 (YYYYMMDD).
+      end_date (str): 종료일 (YYYYMMDD).
+
+    Returns:
+      List[str]: 오름차순 영업일 목록 (YYYYMMDD).
+    """
+    days = []
+    for year in range(int(start_date[:4]), int(end_date[:4]) + 1):
+      year_days = self._trading_days_of_year(year)
+      days.extend(year_days[bisect_left(year_days, start_date):bisect_right(year_days, end_date)])
+    return days
+
+  def pack_ranges(self, start_date: str, end_date: str, trading_days_per_chunk: int) -> List[Tuple[str, str]]:
+    """기간을 영업일 기준 trading_days_per_chunk일씩 묶은 (시작일, 종료일) 구간으로 나눕니다.
+
+    구간들은 start_date부터 end_date까지 빈틈없이 이어집니다. 각 구간은 다음 구간 시작일의 전날에 끝나고
+    (마지막 구간은 end_date), 두 번째 구간부터는 영업일에서 시작하므로 구간마다 달력상 영업일이 정확히
+    trading_days_per_chunk일씩 담깁니다. 영업일이 하나도 없는 기간은 구간을 만들지 않습니다.
+
+    Args:
+      start_date (str): 시작일 (YYYYMMDD).
+      end_date (str): 종료일 (YYYYMMDD).
+      trading_days_per_chunk (int): 한 구간에 담을 영업일 수 (예: 응답 1회 최대 행 수).
+
+    Returns:
+      List[Tuple[str, str]]: (시작일, 종료일) 튜플의 리스트.
+    """
+    days = self.trading_days(start_date, end_date)
+    if not days:
+      return []
+    # 구간 사이의 주말/휴장일도 앞 구간에 포함하여, 달력이 영업일을 휴장일로 잘못 보더라도 조회되도록 합니다.
+    starts = [start_date] + days[trading_days_per_chunk::trading_days_per_chunk]
+    ends = [(datetime.strptime(start, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d") for start in starts[1:]] + [end_date]
+    return list(zip(starts, ends))
@@ -1,5 +1,9 @@
 # tests/hooks/test_KIS_API_hook.py
 
+import asyncio
+import inspect
+import threading
+import time
 import pytest
 import requests
 import json
@@ -8,7 +12,13 @@ from datetime import datetime, timedelta
 
 # 테스트 대상 모듈 및 클래스 임포트
 from src.hooks.KIS_API_hook import KISAPIHook
-from src.errors.KIS_API_errors import KISAPIError, KISAuthenticationError, KISDataError
+from src.hooks.KIS_API_async_hook import AsyncKISAPIHook
+from src.hooks.KIS_endpoints import KIS_ENDPOINTS, KISEndpoint
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucketRateLimiter, FileTokenBucketRateLimiter, build_rate_limiter_from_env
+from src.utils.retry_policy import CircuitBreaker
+from src.utils.response_cache import SQLiteResponseCache
+from src.errors.KIS_API_errors import KISAPIError, KISAuthenticationError, KISDataError, KISRateLimitError
 
 # --- Pytest Fixtures: 테스트 환경 설정 ---
 
@@ -19,8 +29,9 @@ def mock_env_vars(monkeypatch):
   monkeypatch.setenv("KIS_APP_SECRET", "test_app_secret")
 
 @pytest.fixture
-def api_hook(mock_env_vars, tmp_path):
+def api_hook(mock_env_vars, tmp_path, monkeypatch):
   """테스트에 사용될 KISAPIHook 인스턴스를 생성하고 임시 파일 경로를 설정합니다."""
+  monkeypatch.setenv("KIS_RESPONSE_CACHE_PATH", str(tmp_path / "kis_response_cache.sqlite"))
   hook = KISAPIHook()
   hook.token_filepath = tmp_path / "kis_token.json"
   return hook
@@ -78,10 +89,47 @@ class TestAccessTokenManagement:
       assert token == valid_token
       mock_get_new.assert_not_called()
 
+  def test_get_access_token_refreshes_before_expiry(self, api_hook):
+    """만료 직전(갱신 여유 시간 이내)의 파일 캐시 토큰은 미리 갱신하는지 테스트"""
+    expired_at = (datetime.now() + timedelta(minutes=5)).strftime('%Y-%m-%d %H:%M:%S')
+    with open(api_hook.token_filepath, 'w') as f:
+      json.dump({"access_token": "Bearer almost_expired", "expired_at": expired_at}, f)
+
+    with patch.object(api_hook, '_get_new_access_token', return_value="Bearer refreshed") as mock_get_new:
+      assert api_hook.get_access_token() == "Bearer refreshed"
+      mock_get_new.assert_called_once()
+
+  @patch('src.hooks.KIS_API_hook.requests.post')
+  def test_concurrent_hooks_issue_token_only_once(self, mock_post, mock_env_vars, tmp_path):
+    """여러 훅이 동시에 토큰을 요청해도 발급 API는 한 번만 호출되는지 테스트 (single-flight)"""
+    def slow_post(*args, **kwargs):
+      time.sleep(0.05)
+      response = MagicMock()
+      response.json.return_value = {
+        "access_token": "shared_token",
+        "access_token_token_expired": (datetime.now() + timedelta(hours=6)).strftime('%Y-%m-%d %H:%M:%S')
+      }
+      return response
+    mock_post.side_effect = slow_post
+
+    hooks = [KISAPIHook(use_cache=False) for _ in range(4)]
+    for hook in hooks:
+      hook.token_filepath = tmp_path / "kis_token.json"
+
+    tokens = []
+    threads = [threading.Thread(target=lambda h=hook: tokens.append(h.get_access_token())) for hook in hooks]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    assert mock_post.call_count == 1
+    assert tokens == ["Bearer shared_token"] * 4
+
 class TestRequestSending:
   """_send_request 메서드의 요청 및 응답 처리 로직을 테스트합니다."""
 
-  @patch('src.hooks.KIS_API_hook.requests.get')
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
   def test_send_request_success_parsing(self, mock_get, api_hook):
     """API 성공 응답을 올바르게 파싱하는지 테스트"""
     mock_response = MagicMock()
@@ -99,7 +147,7 @@ class TestRequestSending:
     assert result[0]['data_source'] == 'output1'
     assert result[1]['data_source'] == 'output2'
 
-  @patch('src.hooks.KIS_API_hook.requests.get')
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
   def test_send_request_api_business_error(self, mock_get, api_hook):
     """API 비즈니스 오류(rt_cd != '0') 시 KISDataError 발생 테스트"""
     mock_response = MagicMock()
@@ -111,7 +159,7 @@ class TestRequestSending:
       api_hook._send_request("path", "tr_id", {}, "prefix")
 
   @patch('src.hooks.KIS_API_hook.time.sleep')
-  @patch('src.hooks.KIS_API_hook.requests.get', side_effect=requests.exceptions.RequestException)
+  @patch('src.hooks.KIS_API_hook.requests.Session.get', side_effect=requests.exceptions.RequestException)
   def test_send_request_retry_and_fail(self, mock_get, mock_sleep, api_hook):
     """네트워크 오류 시, 3회 재시도 후 최종 실패하는지 테스트"""
     api_hook._access_token = "dummy_token"
@@ -120,6 +168,23 @@ class TestRequestSending:
       api_hook._send_request("path", "tr_id", {}, "prefix")
     assert mock_get.call_count == 3
 
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_send_request_reuses_session_and_static_headers(self, mock_get, api_hook):
+    """여러 요청이 하나의 세션과 정적 헤더를 재사용하고 tr_id만 바뀌는지 테스트"""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {'rt_cd': '0', 'msg1': 'Success', 'output': {'key': 'value'}}
+    mock_get.return_value = mock_response
+    api_hook._access_token = "dummy_token"
+
+    api_hook._send_request("path", "TR_A", {}, "prefix")
+    static_headers = api_hook._static_headers
+    api_hook._send_request("path", "TR_B", {}, "prefix")
+
+    assert api_hook._static_headers is static_headers
+    tr_ids = [call.kwargs['headers']['tr_id'] for call in mock_get.call_args_list]
+    assert tr_ids == ["TR_A", "TR_B"]
+    assert all(call.kwargs['headers']['authorization'] == "dummy_token" for call in mock_get.call_args_list)
+
 class TestAPIWrapperMethods:
   """각 API 엔드포인트를 감싸는 래퍼(wrapper) 메서드들의 정확성 테스트 그룹."""
 
@@ -292,6 +357,352 @@ class TestAPIWrapperMethods:
       error_prefix="국내 주식 증권사별 투자의견 조회"
     )
 
+  def test_every_registered_endpoint_has_generated_method(self):
+    """[정상] 엔드포인트 테이블의 모든 항목에 대해 get_* 메서드가 생성되는지 검증합니다."""
+    for name, endpoint in KIS_ENDPOINTS.items():
+      method = getattr(KISAPIHook, f"get_{name}")
+      expected = ["stock_codes"] if endpoint.batch_size else list(endpoint.arguments)
+      assert list(inspect.signature(method).parameters)[1:] == expected
+
+  @patch('src.hooks.KIS_API_hook.KISAPIHook._send_request')
+  def test_get_kr_stock_multi_price_expands_batch_params(self, mock_send_request, api_hook):
+    """[정상/예외] 멀티종목 시세 조회가 종목 순번별 파라미터를 만들고, 최대 종목 수를 넘으면 거부하는지 검증합니다."""
+    api_hook.get_kr_stock_multi_price(["005930", "000660"])
+    mock_send_request.assert_called_once_with(
+      path="/uapi/domestic-stock/v1/quotations/intstock-multprice",
+      tr_id="FHKST11300006",
+      params={
+        "FID_COND_MRKT_DIV_CODE_1": "J", "FID_INPUT_ISCD_1": "005930",
+        "FID_COND_MRKT_DIV_CODE_2": "J", "FID_INPUT_ISCD_2": "000660",
+      },
+      error_prefix="국내 주식 관심종목(멀티종목) 시세 조회"
+    )
+
+    with pytest.raises(ValueError):
+      api_hook.get_kr_stock_multi_price([f"{i:06d}" for i in range(31)])
+
+  @patch('src.hooks.KIS_API_hook.KISAPIHook._send_request')
+  def test_call_endpoint_by_name_and_missing_argument(self, mock_send_request, api_hook):
+    """[정상/예외] 이름으로 엔드포인트를 호출할 수 있고, 인자 누락 시 TypeError가 발생하는지 검증합니다."""
+    api_hook.call_endpoint("kr_stock_estimate_perform", stock_code="005930")
+    assert mock_send_request.call_args.kwargs["params"] == {"SHT_CD": "005930"}
+
+    with pytest.raises(TypeError):
+      api_hook.call_endpoint("kr_stock_daily_itemchartprice", stock_code="005930")
+
+class TestErrorClassification:
+  """오류 분류, 호출 한도 초과 재시도, 서킷 브레이커 동작을 테스트합니다."""
+
+  @patch('src.hooks.KIS_API_hook.time.sleep')
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_throttle_response_is_retried(self, mock_get, mock_sleep, api_hook):
+    """호출 한도 초과 응답(EGW00201)은 즉시 실패하지 않고 재시도되는지 테스트"""
+    throttled = MagicMock()
+    throttled.json.return_value = {'rt_cd': '1', 'msg_cd': 'EGW00201', 'msg1': '초당 거래건수를 초과하였습니다.'}
+    success = MagicMock()
+    success.json.return_value = {'rt_cd': '0', 'msg1': 'Success', 'output': {'key': 'value'}}
+    mock_get.side_effect = [throttled, throttled, success]
+    api_hook._access_token = "dummy_token"
+
+    result = api_hook._send_request("path", "tr_id", {}, "prefix")
+
+    assert result == [{'key': 'value', 'data_source': 'output'}]
+    assert mock_get.call_count == 3
+    assert all(call.args[0] >= 0.5 for call in mock_sleep.call_args_list)
+
+  @patch('src.hooks.KIS_API_hook.time.sleep')
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_http_429_raises_rate_limit_error_after_retries(self, mock_get, mock_sleep, api_hook):
+    """HTTP 429가 계속되면 재시도 횟수 소진 후 KISRateLimitError가 발생하는지 테스트"""
+    throttled = MagicMock(status_code=429)
+    throttled.raise_for_status.side_effect = requests.exceptions.HTTPError(response=throttled)
+    throttled.json.return_value = {}
+    mock_get.return_value = throttled
+    api_hook._access_token = "dummy_token"
+
+    with pytest.raises(KISRateLimitError):
+      api_hook._send_request("path", "tr_id", {}, "prefix")
+    assert mock_get.call_count == api_hook.retry_policy.max_throttle_attempts
+
+  def test_circuit_breaker_pauses_callers_when_error_rate_spikes(self):
+    """오류 비율이 기준을 넘으면 서킷이 열려 다음 호출이 cooldown만큼 대기하는지 테스트"""
+    now = [0.0]
+    waits = []
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, min_calls=4, cooldown=10.0,
+                             clock=lambda: now[0], sleep=waits.append)
+
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+
+    assert breaker.before_call() == pytest.approx(10.0)
+    now[0] = 10.0
+    breaker.record_failure() # half-open 상태의 첫 실패는 즉시 서킷을 다시 엽니다.
+    assert breaker.is_open
+
+  def test_circuit_breaker_allows_single_half_open_probe(self):
+    """half-open 상태에서는 탐색 호출 하나만 통과하고, 나머지는 탐색이 성공할 때까지 대기하는지 테스트"""
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=2, min_calls=2, cooldown=0.2)
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.21)
+    breaker.before_call() # 현재 스레드가 탐색 호출을 맡습니다.
+
+    passed = []
+    def call(i):
+      breaker.before_call()
+      passed.append(i)
+    callers = [threading.Thread(target=call, args=(i,)) for i in range(3)]
+    for caller in callers:
+      caller.start()
+    stale = threading.Thread(target=breaker.record_failure) # 탐색이 아닌 호출의 실패는 서킷을 다시 열지 않습니다.
+    stale.start()
+    stale.join()
+    time.sleep(0.1)
+    assert passed == []
+    assert not breaker.is_open
+
+    breaker.record_success()
+    for caller in callers:
+      caller.join(timeout=1)
+    assert sorted(passed) == [0, 1, 2]
+
+@pytest.fixture
+def cached_hook(mock_env_vars, tmp_path, monkeypatch):
+  """응답 캐시를 명시적으로 켠 KISAPIHook 인스턴스를 생성합니다."""
+  monkeypatch.setenv("KIS_RESPONSE_CACHE_PATH", str(tmp_path / "kis_response_cache.sqlite"))
+  hook = KISAPIHook(use_cache=True)
+  hook.token_filepath = tmp_path / "kis_token.json"
+  hook._access_token = "dummy_token"
+  return hook
+
+class TestResponseCache:
+  """변경 주기가 긴 엔드포인트의 응답 캐시 동작을 테스트합니다."""
+
+  def test_cache_is_disabled_by_default(self, api_hook):
+    """캐시는 명시적으로 켜지 않으면 사용하지 않는지 테스트"""
+    assert api_hook.response_cache is None
+
+  def test_cache_file_defaults_to_cache_dir(self, mock_env_vars, tmp_path, monkeypatch):
+    """캐시 파일 경로를 지정하지 않으면 작업 디렉터리가 아닌 KIS_CACHE_DIR 아래에 두는지 테스트"""
+    monkeypatch.delenv("KIS_RESPONSE_CACHE_PATH", raising=False)
+    monkeypatch.setenv("KIS_CACHE_DIR", str(tmp_path / "cache"))
+
+    hook = KISAPIHook(use_cache=True)
+    assert hook.response_cache.path == tmp_path / "cache" / "kis_response_cache.sqlite"
+
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_cached_endpoint_skips_second_request(self, mock_get, cached_hook):
+    """캐시 대상 엔드포인트는 두 번째 호출부터 API를 호출하지 않는지 테스트"""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {'rt_cd': '0', 'msg1': 'Success', 'output': [{'stac_yymm': '202412'}]}
+    mock_get.return_value = mock_response
+
+    first = cached_hook.get_kr_stock_balance_sheet("005930")
+    first[0]['ticker'] = "005930" # 호출자가 결과를 수정해도 캐시에는 영향이 없어야 합니다.
+    second = cached_hook.get_kr_stock_balance_sheet("005930")
+
+    assert mock_get.call_count == 1
+    assert second == [{'stac_yymm': '202412', 'data_source': 'output'}]
+
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_uncached_endpoint_always_requests(self, mock_get, cached_hook):
+    """캐시 대상이 아닌 엔드포인트(시세 등)는 tr_id를 공유하더라도 매번 API를 호출하는지 테스트"""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {'rt_cd': '0', 'msg1': 'Success', 'output': {'stck_prpr': '70000'}}
+    mock_get.return_value = mock_response
+
+    cached_hook.get_kr_stock_price_basic("005930")
+    cached_hook.get_kr_stock_price_basic("005930")
+    cached_hook.get_kr_stock_growth_ratio("005930") # 같은 tr_id의 성장성비율 응답이 캐시된 뒤에도
+    cached_hook.get_kr_stock_inquire_price_basic("005930")
+    cached_hook.get_kr_stock_inquire_price_basic("005930")
+
+    assert mock_get.call_count == 5
+
+  def test_cache_expires_and_evicts_least_recently_used(self, tmp_path):
+    """TTL이 지난 항목은 무시되고, 용량 초과 시 가장 오래 사용되지 않은 항목이 제거되는지 테스트"""
+    cache = SQLiteResponseCache(tmp_path / "cache.sqlite", max_bytes=10**9)
+    cache.set("/a", "TR", {"k": "1"}, [{"v": 1}], ttl=-1)
+    assert cache.get("/a", "TR", {"k": "1"}) is None
+
+    cache.set("/a", "TR", {"k": "1"}, [{"v": 1}], ttl=60)
+    cache.set("/a", "TR", {"k": "2"}, [{"v": 2}], ttl=60)
+    cache.get("/a", "TR", {"k": "1"})
+    cache.max_bytes = 1
+    cache.set("/a", "TR", {"k": "3"}, [{"v": 3}], ttl=60)
+
+    assert cache.get("/a", "TR", {"k": "2"}) is None
+    cache.close()
+
+class TestContinuationPaging:
+  """연속 조회(tr_cont) 및 기간 이어 붙이기 페이지네이션을 테스트합니다."""
+
+  @staticmethod
+  def _page(body, tr_cont=""):
+    response = MagicMock()
+    response.json.return_value = {'rt_cd': '0', 'msg1': 'Success', **body}
+    response.headers = {"tr_cont": tr_cont}
+    return response
+
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_iter_pages_follows_tr_cont(self, mock_get, api_hook):
+    """tr_cont가 'M'이면 연속 조회 키를 실어 다음 페이지를 요청하고, 'D'이면 멈추는지 테스트"""
+    mock_get.side_effect = [
+      self._page({'ctx_area_fk100': 'FK1', 'ctx_area_nk100': 'NK1', 'output': [{'n': 1}]}, tr_cont="M"),
+      self._page({'ctx_area_fk100': '', 'ctx_area_nk100': '', 'output': [{'n': 2}]}, tr_cont="D"),
+    ]
+    api_hook._access_token = "dummy_token"
+
+    pages = api_hook.iter_pages("/path", "TR", {"CTX_AREA_FK100": "", "CTX_AREA_NK100": ""}, "조회")
+    assert next(pages) == [{'n': 1, 'data_source': 'output'}]
+    assert mock_get.call_count == 1 # 다음 페이지는 소비할 때 요청합니다.
+    assert list(pages) == [[{'n': 2, 'data_source': 'output'}]]
+
+    second_call = mock_get.call_args_list[1].kwargs
+    assert second_call["headers"]["tr_cont"] == "N"
+    assert second_call["params"] == {"CTX_AREA_FK100": "FK1", "CTX_AREA_NK100": "NK1"}
+    assert "tr_cont" not in mock_get.call_args_list[0].kwargs["headers"]
+
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_iter_endpoint_moves_end_date_for_full_pages(self, mock_get, api_hook):
+    """기간 조회 페이지가 가득 차면 종료일을 가장 오래된 행의 전날로 옮겨 이어서 조회하는지 테스트"""
+    endpoint = KISEndpoint(
+      name="test_chart", description="", path="/chart", tr_id="TR", error_prefix="조회",
+      params={"FROM": "{start_date}", "TO": "{end_date}"}, date_params=("FROM", "TO"),
+      max_rows=2, date_field="stck_bsop_date",
+    )
+    mock_get.side_effect = [
+      self._page({'output2': [{'stck_bsop_date': '20240105'}, {'stck_bsop_date': '20240104'}]}),
+      self._page({'output2': [{'stck_bsop_date': '20240102'}]}),
+    ]
+    api_hook._access_token = "dummy_token"
+
+    pages = list(api_hook.iter_endpoint(endpoint, start_date="20240101", end_date="20240105"))
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert mock_get.call_args_list[1].kwargs["params"] == {"FROM": "20240101", "TO": "20240103"}
+
+class TestRateLimiting:
+  """토큰 버킷 속도 제한기와 훅의 연동을 테스트합니다."""
+
+  def test_token_bucket_reserves_wait_after_burst(self):
+    """버킷 용량을 모두 쓴 뒤에는 rate에 맞춰 대기 시간이 누적되는지 테스트"""
+    now = [0.0]
+    waits = []
+    limiter = TokenBucketRateLimiter(rate=10, burst=2, clock=lambda: now[0], sleep=waits.append)
+
+    results = [limiter.acquire() for _ in range(4)]
+
+    assert results[:2] == [0.0, 0.0]
+    assert results[2] == pytest.approx(0.1)
+    assert results[3] == pytest.approx(0.2)
+    assert waits == pytest.approx([0.1, 0.2])
+
+  def test_file_token_bucket_is_shared_between_instances(self, tmp_path):
+    """같은 상태 파일을 쓰는 제한기들이 하나의 버킷을 공유하는지 테스트"""
+    path = tmp_path / "bucket.json"
+    first = FileTokenBucketRateLimiter(path, rate=1000, burst=1)
+    second = FileTokenBucketRateLimiter(path, rate=1000, burst=1)
+
+    assert first.acquire() == 0.0
+    assert second.acquire() > 0.0
+
+  def test_file_backend_keeps_a_bucket_per_key(self, tmp_path, monkeypatch):
+    """file 백엔드의 기본 상태 파일은 bucket_key(앱 키)마다 달라 호출 한도를 공유하지 않는지 테스트"""
+    monkeypatch.setattr(rate_limiter, "_SHARED_LIMITERS", {})
+    monkeypatch.setenv("KIS_RATE_LIMIT_BACKEND", "file")
+    monkeypatch.setenv("KIS_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("KIS_RATE_LIMIT_PATH", raising=False)
+
+    first, second = build_rate_limiter_from_env("key_a"), build_rate_limiter_from_env("key_b")
+    assert first.path == tmp_path / "kis_rate_limit_key_a.json"
+    assert second.path == tmp_path / "kis_rate_limit_key_b.json"
+
+  @patch('src.hooks.KIS_API_hook.time.sleep')
+  @patch('src.hooks.KIS_API_hook.requests.Session.get', side_effect=requests.exceptions.RequestException)
+  def test_send_request_acquires_token_per_attempt(self, mock_get, mock_sleep, api_hook):
+    """재시도를 포함한 모든 HTTP 호출 전에 토큰을 확보하는지 테스트"""
+    api_hook._access_token = "dummy_token"
+    api_hook.rate_limiter = MagicMock()
+
+    with pytest.raises(KISDataError):
+      api_hook._send_request("path", "tr_id", {}, "prefix")
+    assert api_hook.rate_limiter.acquire.call_count == mock_get.call_count == 3
+
+class TestAsyncKISAPIHook:
+  """AsyncKISAPIHook의 동시성 제한 및 동기 훅과의 동작 일치 여부를 테스트합니다."""
+
+  def test_async_endpoint_respects_concurrency_limit(self, api_hook):
+    """동시에 진행되는 요청 수가 max_concurrency를 넘지 않는지 테스트"""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_send_request(path, tr_id, params, error_prefix):
+      with lock:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+      time.sleep(0.02)
+      with lock:
+        state["active"] -= 1
+      return [{"stck_shrn_iscd": params["FID_INPUT_ISCD"], "data_source": "output"}]
+
+    async def run():
+      async with AsyncKISAPIHook(max_concurrency=2, hook=api_hook) as async_hook:
+        return await asyncio.gather(*(async_hook.get_kr_stock_price_basic(f"{i:06d}") for i in range(6)))
+
+    with patch.object(api_hook, '_send_request', side_effect=fake_send_request):
+      results = asyncio.run(run())
+
+    assert state["peak"] == 2
+    assert [rows[0]["stck_shrn_iscd"] for rows in results] == [f"{i:06d}" for i in range(6)]
+
+  def test_async_exit_does_not_block_event_loop(self, api_hook):
+    """컨텍스트를 빠져나오며 진행 중인 요청을 기다리는 동안에도 다른 코루틴이 실행되는지 테스트"""
+    def slow_send_request(path, tr_id, params, error_prefix):
+      time.sleep(0.2)
+      return [{"stck_shrn_iscd": params["FID_INPUT_ISCD"]}]
+
+    async def run():
+      ticks = 0
+
+      async def tick():
+        nonlocal ticks
+        while True:
+          await asyncio.sleep(0.01)
+          ticks += 1
+
+      async with AsyncKISAPIHook(max_concurrency=1, hook=api_hook) as async_hook:
+        request = asyncio.ensure_future(async_hook.get_kr_stock_price_basic("000001"))
+        await asyncio.sleep(0.01)
+        ticker = asyncio.ensure_future(tick())
+      ticker.cancel()
+      return ticks, await request
+
+    with patch.object(api_hook, '_send_request', side_effect=slow_send_request):
+      ticks, rows = asyncio.run(run())
+
+    assert ticks >= 5
+    assert rows == [{"stck_shrn_iscd": "000001"}]
+
+  @patch('src.hooks.KIS_API_hook.requests.Session.get')
+  def test_async_send_request_raises_business_error(self, mock_get, api_hook):
+    """비동기 요청도 rt_cd 오류 시 동기 훅과 동일하게 KISDataError를 발생시키는지 테스트"""
+    mock_response = MagicMock()
+    mock_response.json.return_value = {'rt_cd': '1', 'msg1': 'Error Message'}
+    mock_get.return_value = mock_response
+    api_hook._access_token = "dummy_token"
+
+    async def run():
+      async with AsyncKISAPIHook(max_concurrency=1, hook=api_hook) as async_hook:
+        await async_hook._send_request("path", "tr_id", {}, "prefix")
+
+    with pytest.raises(KISDataError, match="prefix 실패: Error Message"):
+      asyncio.run(run())
+
 if __name__ == "__main__":
   """
   이 스크립트를 직접 실행할 경우, pytest를 통해 모든 테스트를 수행하고
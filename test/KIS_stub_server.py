@@ -0,0 +1,243 @@
+# test/KIS_stub_server.py
+"""한국투자증권(KIS) REST API를 흉내 내는 로컬 HTTP 서버.
+
+실제 API 한도를 소모하지 않고 훅(Hook)과 수집기(Collector)의 처리량을 측정하거나
+회귀 테스트를 수행하기 위한 용도입니다. 다음을 재현합니다:
+  - /oauth2/tokenP 토큰 발급
+  - 엔드포인트 테이블(KIS_endpoints)에 등록된 모든 조회 API의 `output`/`output1..4` 응답 형태
+  - (종목, 필드, 행 번호)로 결정되는 재현 가능한 합성 데이터
+  - 초당 호출 한도(초과 시 HTTP 500 + EGW00201), 무작위 한도 초과 오류, 응답 지연 분포
+  - 연속 조회(tr_cont + CTS) 및 기간 조회의 페이지당 최대 행 수
+
+사용 예시 (프로젝트 루트에서 실행):
+  PYTHONPATH=. python test/KIS_stub_server.py --port 8999 --rate-limit 20 --latency-ms 30
+  KIS_BASE_URL=http://127.0.0.1:8999 python -m src.etl.KIS_collector
+"""
+
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from src.data.schemas import KIS_schemas
+from src.hooks.KIS_endpoints import KIS_ENDPOINTS, KISEndpoint
+
+THROTTLE_BODY = {"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}
+
+def _schema_fields(endpoint: KISEndpoint) -> List[str]:
+  """엔드포인트 이름(kr_stock_xxx)에 대응하는 스키마(KrStockXxx)의 필드 목록을 반환합니다."""
+  schema = getattr(KIS_schemas, "".join(part.capitalize() for part in endpoint.name.split("_")), None)
+  if schema is None or not is_dataclass(schema):
+    return ["stck_prpr", "prdy_vrss", "acml_vol"]
+  return [field.name for field in fields(schema) if field.name != "ticker"]
+
+def _value(ticker: str, field: str, index: int = 0) -> str:
+  """(종목, 필드, 행 번호)로 결정되는 합성 숫자 문자열을 생성합니다."""
+  return str(zlib.crc32(f"{ticker}:{field}:{index}".encode()) % 100000)
+
+def _row(columns: List[str], ticker: str, index: int = 0, **overrides: str) -> Dict[str, str]:
+  row = {column: _value(ticker, column, index) for column in columns}
+  row.update(overrides)
+  return row
+
+def _weekdays_desc(start_date: str, end_date: str, step_days: int = 1) -> List[str]:
+  """종료일부터 시작일까지 평일 날짜를 내림차순으로 반환합니다."""
+  start, day = datetime.strptime(start_date, "%Y%m%d"), datetime.strptime(end_date, "%Y%m%d")
+  dates = []
+  while day >= start:
+    if day.weekday() < 5:
+      dates.append(day.strftime("%Y%m%d"))
+    day -= timedelta(days=step_days)
+  return dates
+
+class KISStubServer:
+  """
+  KIS REST API 스텁 서버 (Context Manager).
+
+  `start()` 후 `url`을 `KISAPIHook.base_url`(또는 KIS_BASE_URL 환경 변수)에 지정하여 사용합니다.
+  `stats`에는 경로별 요청 수와 한도 초과 응답 수가 기록됩니다.
+  """
+  def __init__(self, host: str = "127.0.0.1", port: int = 0, rate_limit_per_sec: int | None = None,
+               throttle_probability: float = 0.0, latency: Tuple[float, float] = (0.0, 0.0),
+               continuation_page_size: int = 10, seed: int = 0):
+    """
+    Args:
+      host (str): 바인딩할 호스트.
+      port (int): 바인딩할 포트. 0이면 사용 가능한 포트를 자동으로 선택합니다.
+      rate_limit_per_sec (int | None): 초당 허용 요청 수. 초과 요청에는 EGW00201 오류를 반환합니다.
+      throttle_probability (float): 한도와 무관하게 EGW00201 오류를 반환할 확률 (0~1).
+      latency (Tuple[float, float]): 응답 지연의 (평균, 표준편차) 초. 정규분포에서 추출하며 음수는 0으로 처리합니다.
+      continuation_page_size (int): 연속 조회(CTS) 엔드포인트의 페이지당 행 수.
+      seed (int): 지연/오류 추출용 난수 시드.
+    """
+    self.rate_limit_per_sec = rate_limit_per_sec
+    self.throttle_probability = throttle_probability
+    self.latency = latency
+    self.continuation_page_size = continuation_page_size
+    self.stats: Counter = Counter()
+    self._random = random.Random(seed)
+    self._recent_calls: deque = deque()
+    self._lock = threading.Lock()
+    self._endpoints = {endpoint.tr_id: endpoint for endpoint in KIS_ENDPOINTS.values()}
+    self._fields = {endpoint.name: _schema_fields(endpoint) for endpoint in KIS_ENDPOINTS.values()}
+    self._server = ThreadingHTTPServer((host, port), self._make_handler())
+    self._server.daemon_threads = True
+    self._thread: threading.Thread | None = None
+
+  @property
+  def url(self) -> str:
+    host, port = self._server.server_address[:2]
+    return f"http://{host}:{port}"
+
+  def start(self) -> "KISStubServer":
+    self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self):
+    self._server.shutdown()
+    self._server.server_close()
+    if self._thread is not None:
+      self._thread.join()
+
+  def __enter__(self):
+    return self.start()
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.stop()
+
+  # ----- 요청 처리 -----
+  def _is_throttled(self) -> bool:
+    """초당 한도(최근 1초 슬라이딩 윈도우) 또는 무작위 오류 확률에 따라 한도 초과 여부를 결정합니다."""
+    with self._lock:
+      now = time.monotonic()
+      while self._recent_calls and now - self._recent_calls[0] >= 1.0:
+        self._recent_calls.popleft()
+      if self.rate_limit_per_sec is not None and len(self._recent_calls) >= self.rate_limit_per_sec:
+        return True
+      self._recent_calls.append(now)
+      return self._random.random() < self.throttle_probability
+
+  def _delay(self) -> float:
+    mean, stdev = self.latency
+    with self._lock:
+      return max(0.0, self._random.gauss(mean, stdev)) if mean or stdev else 0.0
+
+  def _handle_query(self, tr_id: str, params: Dict[str, str]) -> Tuple[Dict[str, Any], str]:
+    """조회 요청의 응답 본문과 응답 헤더의 tr_cont 값을 생성합니다."""
+    endpoint = self._endpoints.get(tr_id)
+    if endpoint is None:
+      return {"rt_cd": "1", "msg_cd": "OPSQ0002", "msg1": f"없는 서비스 코드 입니다. ({tr_id})"}, ""
+    columns, body = self._fields[endpoint.name], {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다."}
+    lowered = {key.lower(): value for key, value in params.items()}
+    ticker = lowered.get("fid_input_iscd") or lowered.get("pdno") or lowered.get("sht_cd") or ""
+
+    if endpoint.batch_size:
+      codes = [params[key] for key in sorted(params, key=lambda k: int(k.rsplit("_", 1)[1])) if key.startswith("FID_INPUT_ISCD_")]
+      body["output"] = [_row(columns, code, **{endpoint.batch_key_field: code}) for code in codes]
+    elif endpoint.name == "kr_stock_daily_itemchartprice":
+      start_key, end_key = endpoint.date_params
+      dates = _weekdays_desc(params[start_key], params[end_key])[:endpoint.max_rows]
+      body["output1"] = _row(columns, ticker)
+      body["output2"] = [_row(columns, ticker, i, stck_bsop_date=date) for i, date in enumerate(dates)]
+    elif endpoint.name == "kr_stock_dividend":
+      # 연속 조회: CTS에 다음 페이지의 시작 위치를 담아 돌려줍니다.
+      years = range(int(params["T_DT"][:4]), int(params["F_DT"][:4]) - 1, -1)
+      rows = [_row(columns, ticker, year, record_date=f"{year}1231") for year in years]
+      offset = int(params.get("CTS") or 0)
+      page, next_offset = rows[offset:offset + self.continuation_page_size], offset + self.continuation_page_size
+      body["output1"], body["CTS"] = page, str(next_offset) if next_offset < len(rows) else ""
+      return body, "M" if body["CTS"] else "D"
+    elif endpoint.name in ("kr_stock_invest_opinion", "kr_stock_invest_opbysec"):
+      start_key, end_key = endpoint.date_params
+      dates = _weekdays_desc(params[start_key], params[end_key], step_days=7)[:100]
+      body["output"] = [_row(columns, ticker, i, stck_bsop_date=date) for i, date in enumerate(dates)]
+    elif endpoint.name == "kr_stock_investor":
+      dates = _weekdays_desc("19000101", datetime.today().strftime("%Y%m%d"))[:endpoint.max_rows]
+      body["output"] = [_row(columns, ticker, i, stck_bsop_date=date) for i, date in enumerate(dates)]
+    elif endpoint.name == "kr_stock_asking_price":
+      body["output1"], body["output2"] = _row(columns, ticker, 0), _row(columns, ticker, 1)
+    elif endpoint.name == "kr_stock_estimate_perform":
+      periods = [f"{datetime.today().year + offset}.12E" for offset in range(-2, 3)]
+      data_row = lambda i: {f"data{k + 1}": _value(ticker, f"data{k + 1}", i) for k in range(5)}
+      body["output1"] = {"sht_cd": ticker, "name1": "STUB", "rcmd_name": "매수"}
+      body["output2"] = [data_row(i) for i in range(6)]
+      body["output3"] = [data_row(i) for i in range(6, 14)]
+      body["output4"] = [{"dt": period} for period in periods]
+    elif endpoint.max_rows is None and endpoint.cache_ttl and endpoint.name != "kr_stock_basic_info":
+      # 재무제표/재무비율: 최근 4개 분기
+      quarters = [f"{datetime.today().year - 1}{month:02d}" for month in (12, 9, 6, 3)]
+      body["output"] = [_row(columns, ticker, i, stac_yymm=quarter) for i, quarter in enumerate(quarters)]
+    else:
+      body["output"] = _row(columns, ticker)
+    return body, "D"
+
+  def _make_handler(self):
+    stub = self
+
+    class Handler(BaseHTTPRequestHandler):
+      protocol_version = "HTTP/1.1" # keep-alive
+
+      def log_message(self, format, *args):
+        pass
+
+      def _reply(self, status: int, body: Dict[str, Any], tr_cont: str = ""):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if tr_cont:
+          self.send_header("tr_cont", tr_cont)
+        self.end_headers()
+        self.wfile.write(payload)
+
+      def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if urlsplit(self.path).path != "/oauth2/tokenP":
+          return self._reply(404, {"error_description": "not found"})
+        stub.stats["/oauth2/tokenP"] += 1
+        expired_at = (datetime.now() + timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
+        self._reply(200, {"access_token": "stub-token", "token_type": "Bearer", "expires_in": 86400,
+                          "access_token_token_expired": expired_at})
+
+      def do_GET(self):
+        url = urlsplit(self.path)
+        stub.stats[url.path] += 1
+        time.sleep(stub._delay())
+        if stub._is_throttled():
+          stub.stats["throttled"] += 1
+          return self._reply(500, THROTTLE_BODY)
+        body, tr_cont = stub._handle_query(self.headers.get("tr_id", ""), dict(parse_qsl(url.query, keep_blank_values=True)))
+        self._reply(200, body, tr_cont)
+
+    return Handler
+
+if __name__ == "__main__":
+  import argparse
+
+  parser = argparse.ArgumentParser(description="KIS REST API 스텁 서버")
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=8999)
+  parser.add_argument("--rate-limit", type=int, default=None, help="초당 허용 요청 수")
+  parser.add_argument("--throttle-probability", type=float, default=0.0)
+  parser.add_argument("--latency-ms", type=float, default=0.0, help="평균 응답 지연(ms)")
+  parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="응답 지연 표준편차(ms)")
+  args = parser.parse_args()
+
+  server = KISStubServer(
+    host=args.host, port=args.port, rate_limit_per_sec=args.rate_limit,
+    throttle_probability=args.throttle_probability,
+    latency=(args.latency_ms / 1000, args.latency_jitter_ms / 1000),
+  )
+  print(f"🚀 KIS 스텁 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+  try:
+    server._server.serve_forever()
+  except KeyboardInterrupt:
+    print(f"\n📊 요청 통계: {dict(server.stats)}")
@@ -0,0 +1,107 @@
+# test/KIS_stub_server_test.py
+
+import pytest
+from unittest.mock import patch
+
+from KIS_stub_server import KISStubServer
+from src.hooks.KIS_API_hook import KISAPIHook
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from src.utils.retry_policy import CircuitBreaker, RetryPolicy
+
+# --- Pytest Fixtures: 테스트 환경 설정 ---
+
+@pytest.fixture
+def stub_server():
+  """테스트마다 임의 포트에서 KIS 스텁 서버를 실행합니다."""
+  with KISStubServer(continuation_page_size=3) as server:
+    yield server
+
+@pytest.fixture
+def stub_hook(stub_server, tmp_path, monkeypatch):
+  """스텁 서버를 바라보는 KISAPIHook 인스턴스를 생성합니다."""
+  monkeypatch.setenv("KIS_APP_KEY", "test_app_key")
+  monkeypatch.setenv("KIS_APP_SECRET", "test_app_secret")
+  monkeypatch.setenv("KIS_BASE_URL", stub_server.url)
+  hook = KISAPIHook(
+    rate_limiter=TokenBucketRateLimiter(rate=1000, burst=1000), use_cache=False,
+    retry_policy=RetryPolicy(throttle_base_delay=0.05, base_delay=0.01, max_throttle_attempts=20),
+    circuit_breaker=CircuitBreaker(cooldown=0.1),
+  )
+  hook.token_filepath = tmp_path / "kis_token.json"
+  yield hook
+  hook.close()
+
+# --- 테스트 케이스 ---
+
+class TestKISStubServer:
+  """스텁 서버를 통해 훅의 실제 HTTP 경로(토큰, 페이지네이션, 한도 초과 재시도)를 테스트합니다."""
+
+  def test_token_issued_once_and_snapshot_shape(self, stub_hook, stub_server):
+    """토큰은 한 번만 발급되고, 스냅샷 엔드포인트는 단일 output 행을 반환하는지 테스트"""
+    first = stub_hook.get_kr_stock_price_basic("005930")
+    second = stub_hook.get_kr_stock_price_basic("005930")
+
+    assert stub_server.stats["/oauth2/tokenP"] == 1
+    assert first == second and len(first) == 1 and first[0]["data_source"] == "output"
+
+  def test_daily_chart_pages_cover_whole_range(self, stub_hook, stub_server):
+    """100행 제한이 있는 일봉 조회가 기간 이어 붙이기로 전체 평일을 중복 없이 가져오는지 테스트"""
+    pages = list(stub_hook.iter_endpoint("kr_stock_daily_itemchartprice", stock_code="005930", start_date="20230101", end_date="20231231"))
+    dates = [row["stck_bsop_date"] for page in pages for row in page if row["data_source"] == "output2"]
+
+    assert len(pages) == 3 # 260 평일 = 100 + 100 + 60
+    assert len(dates) == len(set(dates)) == 260
+    assert min(dates) == "20230102" and max(dates) == "20231229"
+
+  def test_dividend_follows_cts_continuation(self, stub_hook, stub_server):
+    """CTS 연속 조회를 따라 모든 페이지를 가져오는지 테스트"""
+    pages = list(stub_hook.iter_pages(
+      "/uapi/domestic-stock/v1/ksdinfo/dividend", "HHKDB669102C0",
+      {"CTS": "", "GB1": "0", "F_DT": "20150101", "T_DT": "20241231", "SHT_CD": "005930", "HIGH_GB": ""},
+      "배당일정 조회",
+    ))
+
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    assert len({row["record_date"] for page in pages for row in page}) == 10
+
+  def test_quota_throttle_is_retried(self, stub_hook, stub_server):
+    """서버의 초당 한도를 넘겨 EGW00201을 받더라도 재시도로 모든 호출이 성공하는지 테스트"""
+    stub_server.rate_limit_per_sec = 5
+    results = [stub_hook.get_kr_stock_multi_price(["005930", "000660"]) for _ in range(8)]
+
+    assert stub_server.stats["throttled"] > 0
+    assert all([row["inter_shrn_iscd"] for row in rows] == ["005930", "000660"] for rows in results)
+
+  def test_collector_fan_out_keeps_ticker_order(self, stub_hook, stub_server):
+    """동시 수집 모드에서도 결과가 종목 순서대로 취합되는지 테스트"""
+    from src.etl import KIS_collector as collector
+
+    tickers = [f"{i:06d}" for i in range(1, 41)]
+    with patch.object(collector, "load_universe", return_value=tickers), \
+         patch.object(collector, "KISAPIHook", return_value=stub_hook), \
+         patch.object(collector.DBHandler, "create_table"), \
+         patch.object(collector.DBHandler, "insert_data") as mock_insert:
+      collector.KIS_collector(collector.KR_STOCK_PRICE_BASIC, max_workers=8)
+
+    data_inserts = [call for call in mock_insert.call_args_list if call.args[1].endswith("insert_kr_stock_price_basic.sql")]
+    inserted = data_inserts[-1].args[0]
+    assert inserted["ticker"].tolist() == tickers
+    assert stub_server.stats["/uapi/domestic-stock/v1/quotations/inquire-price"] == len(tickers)
+
+  def test_run_metrics_capture_calls_and_retries(self, stub_hook, stub_server):
+    """실행 지표가 연결된 스레드의 API 호출 수, 한도 초과 재시도, 지연 시간 분위수를 기록하는지 테스트"""
+    from src.utils.telemetry import RunMetrics, bind_metrics
+
+    stub_server.rate_limit_per_sec = 5
+    metrics = RunMetrics("test-run", "kr_stock_multi_price")
+    with bind_metrics(metrics):
+      for _ in range(8):
+        stub_hook.get_kr_stock_multi_price(["005930"])
+    stub_hook.get_kr_stock_multi_price(["005930"]) # 연결 해제 후 호출은 기록하지 않음
+
+    summary = metrics.summary()
+    throttled = summary["retries"].get("throttle", 0)
+    assert throttled > 0 and summary["calls"] == 8 + throttled
+    assert summary["errors"]["KISRateLimitError"] == throttled
+    assert summary["response_bytes"] > 0
+    assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p95"] <= summary["latency_ms"]["p99"]
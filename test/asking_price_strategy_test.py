@@ -0,0 +1,39 @@
+# test/asking_price_strategy_test.py
+
+import pandas as pd
+import pytest
+
+from src.etl.transformer.strategies.asking_price_strategy import AskingPriceStrategy
+
+def _raw_df(ticker_count: int = 3) -> pd.DataFrame:
+  """KIS 훅이 반환하는 형태(종목별 output1 1행 + output2 1행)의 원본 데이터를 만듭니다."""
+  records = []
+  for i in reversed(range(ticker_count)):
+    ticker = f"{i:06d}"
+    records.append({"aspr_acpt_hour": "153000", "askp1": str(1000 + i), "bidp1": str(990 + i), "data_source": "output1", "ticker": ticker})
+    records.append({"antc_cnpr": str(995 + i), "stck_prpr": str(1001 + i), "askp1": "무시됨", "data_source": "output2", "ticker": ticker})
+  records.append({"askp1": "1", "data_source": "output1", "ticker": "900001"}) # output2가 없는 종목은 제외
+  return pd.DataFrame(records)
+
+class TestAskingPriceStrategy:
+  """주식호가 변환 전략의 벡터화 경로를 테스트합니다."""
+
+  def test_vectorized_matches_builder(self):
+    """벡터화 변환이 종목별 Builder 변환과 값, dtype, 순서까지 같은 결과를 내는지 테스트"""
+    raw_df = _raw_df()
+
+    expected = AskingPriceStrategy(vectorized=False).transform(raw_df)
+    actual = AskingPriceStrategy().transform(raw_df)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["ticker"].tolist() == ["000000", "000001", "000002"]
+    assert actual["askp1"].tolist() == ["1000", "1001", "1002"] # output1 우선
+
+  @pytest.mark.parametrize("vectorized", [True, False])
+  def test_output2_fills_fields_missing_from_output1(self, vectorized):
+    """output1에 값이 없는 컬럼은 output2 값으로 채우고, 겹치는 컬럼은 output1 값이 우선하는지 테스트 (두 경로 모두)"""
+    result = AskingPriceStrategy(vectorized=vectorized).transform(_raw_df())
+
+    assert result["askp1"].tolist() == ["1000", "1001", "1002"]
+    assert result["antc_cnpr"].tolist() == ["995", "996", "997"]
+    assert result["stck_prpr"].tolist() == ["1001", "1002", "1003"]
@@ -0,0 +1,53 @@
+# test/checkpoint_ledger_test.py
+
+from unittest.mock import MagicMock, patch
+
+from src.etl import KIS_collector as collector
+from src.etl.checkpoint_ledger import CheckpointLedger
+
+class TestCheckpointLedger:
+  """체크포인트 원장을 이용한 수집 재시작을 테스트합니다."""
+
+  def test_restarted_run_skips_completed_work_items(self):
+    """같은 run_id의 완료 작업은 요청하지 않고, 새로 완료된 작업만 데이터와 함께 원장에 기록하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.get_checkpoints.return_value = {("000001", "", ""), ("000002", "", "")}
+    db_handler.insert_data.return_value = True
+    db_handler.get_row_hashes.return_value = {}
+    kis_hook = MagicMock()
+    kis_hook.iter_endpoint.side_effect = lambda endpoint, **params: iter([[{"stck_prpr": "100"}]])
+
+    with patch.object(collector, "load_universe", return_value=["000001", "000002", "000003"]):
+      result = collector.KIS_collector(
+        collector.KR_STOCK_PRICE_BASIC, max_workers=2, kis_hook=kis_hook,
+        db_handler=db_handler, transformer=MagicMock(), run_id="resume-test",
+      )
+
+    db_handler.get_checkpoints.assert_called_once_with("kr_stock_price_basic", "resume-test")
+    assert [call.kwargs["stock_code"] for call in kis_hook.iter_endpoint.call_args_list] == ["000003"]
+    assert result["skipped"] == 2
+
+    data_insert = next(call for call in db_handler.insert_data.call_args_list if call.args[1].endswith("insert_kr_stock_price_basic.sql"))
+    companion_rows = data_insert.kwargs["companion_rows"]
+    assert companion_rows[CheckpointLedger.DML_PATH] == [("resume-test", "kr_stock_price_basic", "000003", "", "")]
+
+  def test_run_without_run_id_does_not_resume(self, monkeypatch):
+    """run_id 없이 실행하면 매번 새 식별자로 원장을 조회하여, 같은 날 다시 실행해도 전 종목을 수집하는지 테스트"""
+    monkeypatch.delenv("KIS_RUN_ID", raising=False)
+    db_handler = MagicMock()
+    db_handler.get_checkpoints.side_effect = lambda table_name, run_id: {("000001", "", "")} if run_id == "resume-test" else set()
+    db_handler.insert_data.return_value = True
+    db_handler.get_row_hashes.return_value = {}
+    kis_hook = MagicMock()
+    kis_hook.iter_endpoint.side_effect = lambda endpoint, **params: iter([[{"stck_prpr": "100"}]])
+
+    with patch.object(collector, "load_universe", return_value=["000001", "000002"]):
+      results = [
+        collector.KIS_collector(collector.KR_STOCK_PRICE_BASIC, max_workers=2, kis_hook=kis_hook, db_handler=db_handler, transformer=MagicMock())
+        for _ in range(2)
+      ]
+
+    run_ids = [call.args[1] for call in db_handler.get_checkpoints.call_args_list]
+    assert len(set(run_ids)) == 2
+    assert [result["skipped"] for result in results] == [0, 0]
+    assert kis_hook.iter_endpoint.call_count == 4
@@ -0,0 +1,51 @@
+# test/collection_runner_test.py
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.etl.collection_runner import CollectionRunner
+
+def _config(path, **extra):
+  return {"description": path, "asset": "kr_stock", "path": path, "table_type": "stock_info", **extra}
+
+def _runner(configs, **kwargs):
+  return CollectionRunner(configs, kis_hook=MagicMock(), db_handler=MagicMock(), transformer=MagicMock(), **kwargs)
+
+class TestCollectionRunner:
+  """수집 작업 그래프의 우선순위, 의존 관계, 실패 전파를 테스트합니다."""
+
+  def test_snapshots_start_before_backfills(self):
+    """동시 실행 슬롯이 하나일 때 스냅샷 작업이 기간 수집 작업보다 먼저 실행되는지 테스트"""
+    configs = [_config("daily", date_column="stck_bsop_date"), _config("price"), _config("member")]
+    started = []
+    runner = _runner(configs, max_parallel_jobs=1)
+
+    with patch.object(runner, "_run_job", side_effect=lambda name: started.append(name) or {"rows": 1, "failed": 0}):
+      results = runner.run()
+
+    assert started == ["kr_stock_price", "kr_stock_member", "kr_stock_daily"]
+    assert all(result["status"] == "success" for result in results.values())
+
+  def test_failed_dependency_skips_dependents(self):
+    """선행 작업이 실패하면 후행 작업을 실행하지 않고 skipped로 기록하는지 테스트"""
+    configs = [_config("a"), _config("b", depends_on=["kr_stock_a"]), _config("c")]
+    runner = _runner(configs, max_parallel_jobs=2)
+
+    def run_job(name):
+      if name == "kr_stock_a":
+        raise RuntimeError("boom")
+      return {"rows": 1, "failed": 0}
+
+    with patch.object(runner, "_run_job", side_effect=run_job) as mock_run_job:
+      results = runner.run()
+
+    assert results["kr_stock_a"]["status"] == "failed"
+    assert results["kr_stock_b"]["status"] == "skipped"
+    assert results["kr_stock_c"]["status"] == "success"
+    assert "kr_stock_b" not in [call.args[0] for call in mock_run_job.call_args_list]
+
+  def test_cycle_is_rejected(self):
+    """의존 관계에 순환이 있으면 생성 시점에 ValueError가 발생하는지 테스트"""
+    configs = [_config("a", depends_on=["kr_stock_b"]), _config("b", depends_on=["kr_stock_a"])]
+    with pytest.raises(ValueError):
+      _runner(configs)
@@ -0,0 +1,55 @@
+# test/daily_itemchartprice_strategy_test.py
+
+import pandas as pd
+import pytest
+
+from src.etl.transformer.strategies.daily_itermchartprice_strategy import DailyItemchartPriceStrategy
+
+def _raw_df(ticker_count: int = 3, days: int = 4) -> pd.DataFrame:
+  """KIS 훅이 반환하는 형태(output1 1행 + output2 일자별 행)의 여러 종목 원본 데이터를 만듭니다."""
+  records = []
+  for i in reversed(range(ticker_count)): # 종목 순서가 섞여 들어오는 상황
+    ticker = f"{i:06d}"
+    output2 = [
+      {"stck_bsop_date": f"202401{day + 1:02d}", "stck_clpr": str(1000 + day), "stck_oprc": str(990 + day),
+       "acml_vol": str(day * 10), "mod_yn": "N", "data_source": "output2", "ticker": ticker}
+      for day in range(days)
+    ]
+    output2[0]["acml_vol"] = None # output2에 있는 컬럼의 결측치는 output1 값으로 채우지 않음
+    output1 = {"hts_kor_isnm": f"종목{i}", "stck_prpr": "1003", "stck_oprc": "999", "acml_vol": "77",
+               "per": "12.3", "data_source": "output1", "ticker": ticker}
+    records.extend(output2[:2] + [output1] + output2[2:])
+
+  records.append({"hts_kor_isnm": "output1만 있는 종목", "data_source": "output1", "ticker": "900001"})
+  records.append({"stck_bsop_date": "20240101", "stck_clpr": "1", "data_source": "output2", "ticker": "900002"})
+  return pd.DataFrame(records)
+
+class TestDailyItemchartPriceStrategy:
+  """주식일봉차트 변환 전략의 벡터화 경로를 테스트합니다."""
+
+  def test_vectorized_matches_builder(self):
+    """벡터화 변환이 종목별 Builder 변환과 값, dtype, 순서까지 같은 결과를 내는지 테스트"""
+    raw_df = _raw_df()
+
+    expected = DailyItemchartPriceStrategy(vectorized=False).transform(raw_df)
+    actual = DailyItemchartPriceStrategy().transform(raw_df)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["ticker"].tolist() == [f"{i:06d}" for i in range(3) for _ in range(4)]
+
+  @pytest.mark.parametrize("vectorized", [True, False])
+  def test_output1_metadata_is_broadcast(self, vectorized):
+    """output1 기준 정보가 모든 일자 행에 채워지고, 겹치는 컬럼은 output2 값이 우선하는지 테스트 (두 경로 모두)"""
+    result = DailyItemchartPriceStrategy(vectorized=vectorized).transform(_raw_df(ticker_count=1))
+
+    assert result["hts_kor_isnm"].tolist() == ["종목0"] * 4
+    assert result["per"].tolist() == ["12.3"] * 4
+    assert result["stck_oprc"].tolist() == ["990", "991", "992", "993"]
+    assert result["acml_vol"].isna().tolist() == [True, False, False, False]
+    assert result["revl_issu_reas"].tolist() == [None] * 4
+
+  def test_empty_or_unmatched_input(self):
+    """입력이 비었거나 output1/output2가 모두 있는 종목이 없으면 빈 DataFrame을 반환하는지 테스트"""
+    strategy = DailyItemchartPriceStrategy()
+    assert strategy.transform(pd.DataFrame()).empty
+    assert strategy.transform(_raw_df(ticker_count=0)).empty
@@ -0,0 +1,36 @@
+# test/estimate_perform_strategy_test.py
+
+import pandas as pd
+import pytest
+
+from src.etl.transformer.strategies.estimate_perform_strategy import INDEX_NAMES, EstimatePerformStrategy
+
+def _ticker_records(ticker: str, periods: int = 5, data_rows: int = len(INDEX_NAMES)) -> list:
+  """KIS 훅이 반환하는 형태(output1 + output2/output3 데이터 행 + output4 기간)의 한 종목 원본 데이터를 만듭니다."""
+  rows = [{f"data{k + 1}": f"{int(ticker) * 100 + i}.{k}" for k in range(5)} for i in range(data_rows)]
+  return (
+    [{"sht_cd": ticker, "name1": f"애널리스트{ticker}", "rcmd_name": "매수", "data_source": "output1", "ticker": ticker}]
+    + [{**row, "data_source": "output2", "ticker": ticker} for row in rows[:6]]
+    + [{**row, "data_source": "output3", "ticker": ticker} for row in rows[6:]]
+    + [{"dt": f"{2022 + k}.12E", "data_source": "output4", "ticker": ticker} for k in range(periods)]
+  )
+
+class TestEstimatePerformStrategy:
+  """종목추정실적 변환 전략의 벡터화 경로를 테스트합니다."""
+
+  def test_vectorized_matches_builder(self):
+    """벡터화 변환이 종목별 Builder 변환과 값, dtype, 순서까지 같은 결과를 내고, 형식이 맞지 않는 종목은 건너뛰는지 테스트"""
+    records = (
+      _ticker_records("000003", periods=3) + _ticker_records("000001") + _ticker_records("000002")
+      + _ticker_records("000009", data_rows=13) # 데이터 행 수 불일치
+      + [r for r in _ticker_records("000008") if r["data_source"] != "output4"] # 기간 정보 없음
+    )
+    raw_df = pd.DataFrame(records)
+
+    expected = EstimatePerformStrategy(vectorized=False).transform(raw_df)
+    actual = EstimatePerformStrategy().transform(raw_df)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["ticker"].tolist() == ["000001"] * 5 + ["000002"] * 5 + ["000003"] * 3
+    assert actual["period"].tolist()[-3:] == ["2022.12E", "2023.12E", "2024.12E"]
+    assert actual.loc[10, "revenue"] == pytest.approx(300.0) and actual.loc[12, "revenue_yoy"] == pytest.approx(301.2)
@@ -0,0 +1,131 @@
+# test/micro_batch_sink_test.py
+
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.data.schemas.schema_registry import get_schema
+from src.etl.micro_batch_sink import MicroBatchSink
+from src.etl.transformer.KIS_transformer import KISTransformer
+from src.utils.telemetry import RunMetrics
+
+def _rows(ticker, count):
+  return [{"ticker": ticker, "value": str(i), "data_source": "output"} for i in range(count)]
+
+class TestMicroBatchSink:
+  """마이크로 배치 적재기의 상한별 저장 시점과 실패 기록을 테스트합니다."""
+
+  def test_flushes_when_row_ceiling_reached(self):
+    """버퍼의 행 수가 상한에 도달하면 즉시 저장하고, 종료 시 남은 행을 저장하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = True
+    sink = MicroBatchSink(db_handler, "insert.sql", columns=["ticker", "value"], max_rows=5, max_bytes=None)
+
+    with sink:
+      sink.add(("A", None, None), _rows("A", 3))
+      assert db_handler.insert_data.call_count == 0
+      sink.add(("B", None, None), _rows("B", 3))
+      assert db_handler.insert_data.call_count == 1
+      sink.add(("C", None, None), _rows("C", 1))
+
+    flushed = [call.args[0] for call in db_handler.insert_data.call_args_list]
+    assert [len(df) for df in flushed] == [6, 1]
+    assert list(flushed[0].columns) == ["ticker", "value"]
+    assert sink.rows_written == 7
+
+  def test_flushes_when_memory_ceiling_reached(self):
+    """버퍼의 추정 메모리가 상한을 넘으면 행 수와 무관하게 저장하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = True
+    sink = MicroBatchSink(db_handler, "insert.sql", max_rows=None, max_bytes=1)
+
+    sink.add(("A", None, None), _rows("A", 1))
+
+    assert db_handler.insert_data.call_count == 1
+
+  def test_failed_insert_records_work_items(self):
+    """저장에 실패한 묶음의 작업들을 failed_work_items에 기록하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = False
+    sink = MicroBatchSink(db_handler, "insert.sql", max_rows=None, max_bytes=None)
+
+    sink.add(("A", "20240101", "20240410"), _rows("A", 2))
+    sink.add(("B", "20240101", "20240410"), [])
+    assert sink.flush() is False
+
+    assert sink.failed_work_items == [("A", "20240101", "20240410"), ("B", "20240101", "20240410")]
+    assert sink.rows_written == 0
+
+  def test_stop_event_discards_buffer_without_insert(self):
+    """중단 이벤트가 설정되면 데이터와 동반 행을 저장하지 않고 작업을 discarded_work_items에 기록하는지 테스트"""
+    db_handler = MagicMock()
+    stop_event = threading.Event()
+    sink = MicroBatchSink(db_handler, "insert.sql", max_rows=None, max_bytes=None, stop_event=stop_event)
+
+    sink.add(("A", "20240101", "20240410"), _rows("A", 2), [("wm.sql", ("t", "A", "20240410"))])
+    stop_event.set()
+    assert sink.flush() is False
+
+    db_handler.insert_data.assert_not_called()
+    assert sink.discarded_work_items == [("A", "20240101", "20240410")]
+    assert sink.failed_work_items == []
+
+  def test_companion_rows_share_the_insert_call(self):
+    """동반 행(워터마크)이 데이터와 같은 insert_data 호출로 전달되고, 데이터가 없어도 저장되는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = True
+    sink = MicroBatchSink(db_handler, "insert.sql", max_rows=None, max_bytes=None)
+
+    sink.add(("A", "20240101", "20240410"), _rows("A", 2), [("wm.sql", ("t", "A", "20240410"))])
+    sink.add(("B", "20240101", "20240410"), [], [("wm.sql", ("t", "B", "20240410"))])
+    sink.flush()
+    sink.add(("C", "20240101", "20240410"), [], [("wm.sql", ("t", "C", "20240410"))])
+    sink.flush()
+
+    first, second = db_handler.insert_data.call_args_list
+    assert len(first.args[0]) == 2
+    assert first.kwargs["companion_rows"] == {"wm.sql": [("t", "A", "20240410"), ("t", "B", "20240410")]}
+    assert second.args[0].empty and second.kwargs["companion_rows"] == {"wm.sql": [("t", "C", "20240410")]}
+
+  def test_streams_rows_through_transformer_per_ticker(self):
+    """변환 전략이 있으면 종목이 바뀔 때마다 이전 종목을 변환하고, 저장 시 남은 종목까지 변환하는지 테스트"""
+    def chart_rows(ticker, dates):
+      return [{"hts_kor_isnm": f"종목{ticker}", "data_source": "output1", "ticker": ticker}] + [
+        {"stck_bsop_date": date, "stck_clpr": "100", "data_source": "output2", "ticker": ticker} for date in dates
+      ]
+
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = True
+    transformer = KISTransformer()
+    sink = MicroBatchSink(db_handler, "insert.sql", transformer=transformer, transformer_name="daily_itemchartprice",
+                          max_rows=None, max_bytes=None)
+
+    sink.add(("B", "20240101", "20240131"), chart_rows("B", ["20240102", "20240103"]))
+    sink.add(("B", "20240201", "20240229"), chart_rows("B", ["20240201"]))
+    assert sink._frames == [] # 같은 종목의 응답은 모아 둠
+    sink.add(("A", "20240101", "20240131"), chart_rows("A", ["20240102"]))
+    assert len(sink._frames) == 1 and len(sink._frames[0]) == 3
+    sink.flush()
+
+    streamed = db_handler.insert_data.call_args.args[0]
+    batch = transformer.transform("daily_itemchartprice", pd.DataFrame(
+      chart_rows("B", ["20240102", "20240103"]) + chart_rows("B", ["20240201"]) + chart_rows("A", ["20240102"])
+    ))
+    assert streamed["ticker"].tolist() == ["B", "B", "B", "A"]
+    pd.testing.assert_frame_equal(streamed.sort_values(["ticker", "stck_bsop_date"], ignore_index=True), batch)
+
+  def test_schema_parses_numeric_columns(self):
+    """스키마가 있으면 숫자형 컬럼을 변환하고, 결측은 None으로 저장하며 파싱 실패 수를 기록하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.insert_data.return_value = True
+    metrics = RunMetrics("test", "kr_stock_estimate_perform")
+    sink = MicroBatchSink(db_handler, "insert.sql", columns=["ticker", "revenue", "revenue_yoy"], max_rows=None, max_bytes=None,
+                          metrics=metrics, schema=get_schema("KrStockEstimatePerform"))
+
+    sink.add(("A", None, None), [{"ticker": "A", "revenue": "1,234.5", "revenue_yoy": "N/A"}, {"ticker": "A", "revenue": " "}])
+    sink.flush()
+
+    flushed = db_handler.insert_data.call_args.args[0]
+    assert [tuple(row) for row in flushed.itertuples(index=False)] == [("A", 1234.5, None), ("A", None, None)]
+    assert metrics.summary()["parse_failures"] == 1
@@ -0,0 +1,70 @@
+# test/numeric_codec_test.py
+
+import numpy as np
+import pandas as pd
+
+from src.utils.numeric_codec import decode_numeric, null_mask
+
+def _raw_block() -> pd.DataFrame:
+  """KIS 응답처럼 숫자가 문자열로 들어 있는 열 묶음을 만듭니다."""
+  return pd.DataFrame({
+    "stck_prpr": ["1,234,500", " -3.25 ", "+12", "", "  ", None, "N/A", "1e3"],
+    "acml_vol": ["0", "1,000", "7", np.nan, "0.5", "12", "-", "300"],
+  }, dtype=object)
+
+class TestNumericCodec:
+  """KIS 숫자 문자열 코덱의 결측 규칙과 변환 결과를 테스트합니다."""
+
+  def test_decode_matches_per_value_parsing(self):
+    """묶음 변환 결과가 값별 strip/쉼표 제거 후 float 변환과 같고, 파싱 실패를 컬럼별로 세는지 테스트"""
+    block = _raw_block()
+    decoded, failures = decode_numeric(block)
+
+    def parse(value):
+      if value is None or value is np.nan or not value.strip():
+        return np.nan
+      try:
+        return float(value.strip().replace(",", ""))
+      except ValueError:
+        return np.nan
+
+    pd.testing.assert_frame_equal(decoded, block.apply(lambda col: col.map(parse)).astype(float))
+    assert failures == {"stck_prpr": 1, "acml_vol": 1}
+
+  def test_integer_mode_and_null_values(self):
+    """정수 변환은 Int64로 반환하고 소수부가 있는 값을 실패로 세며, null_values는 원본 값으로 비교하는지 테스트"""
+    decoded, failures = decode_numeric(_raw_block()[["acml_vol"]], null_values=["0"], integer=True)
+
+    assert decoded["acml_vol"].dtype == "Int64"
+    assert decoded["acml_vol"].tolist() == [pd.NA, 1000, 7, pd.NA, pd.NA, 12, pd.NA, 300]
+    assert failures == {"acml_vol": 2}
+
+  def test_out_of_range_and_infinite_values_fail(self):
+    """int64 범위를 벗어난 값과 무한대는 변환하지 않고 파싱 실패로 세는지 테스트"""
+    block = pd.DataFrame({"acml_tr_pbmn": ["1e30", "-1e30", "9223372036854775807", "-9223372036854775808", "inf", "12"]}, dtype=object)
+
+    decoded, failures = decode_numeric(block, integer=True)
+    assert decoded["acml_tr_pbmn"].isna().tolist() == [True, True, True, False, True, False]
+    assert decoded["acml_tr_pbmn"].iloc[3] == -2 ** 63
+    assert failures == {"acml_tr_pbmn": 4}
+
+    decoded, failures = decode_numeric(block)
+    assert np.isnan(decoded["acml_tr_pbmn"].iloc[4])
+    assert failures == {"acml_tr_pbmn": 1}
+
+  def test_non_ascii_and_numeric_blocks(self):
+    """ASCII가 아닌 값이 섞인 묶음과 이미 숫자형인 묶음도 같은 규칙으로 변환하는지 테스트"""
+    decoded, failures = decode_numeric(pd.DataFrame({"per": ["12.5", "해당없음", " ", 3]}, dtype=object))
+    assert decoded["per"].tolist()[::3] == [12.5, 3.0]
+    assert decoded["per"].iloc[1:3].isna().all()
+    assert failures == {"per": 1}
+
+    decoded, failures = decode_numeric(pd.DataFrame({"pbr": [0.0, 1.5, np.nan]}), null_values=[0])
+    assert decoded["pbr"].isna().tolist() == [True, False, True]
+    assert failures == {"pbr": 0}
+
+  def test_null_mask(self):
+    """결측 규칙(None/NaN, 공백 문자열, null_values)에 해당하는 위치만 표시하는지 테스트"""
+    block = pd.DataFrame({"name": ["삼성전자", " ", None, "0"], "code": ["005930", "", "0", 0]}, dtype=object)
+    mask = null_mask(block, null_values=["0", 0])
+    assert mask.tolist() == [[False, False], [True, True], [True, True], [True, True]]
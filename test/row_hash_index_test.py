@@ -0,0 +1,32 @@
+# test/row_hash_index_test.py
+
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+
+from src.etl.row_hash_index import RowHashIndex, hash_rows, parse_conflict_columns
+
+class TestRowHashIndex:
+  """행 해시 기반 변경 감지를 테스트합니다."""
+
+  def test_parse_conflict_columns(self):
+    """INSERT 문의 ON CONFLICT 절에서 키 컬럼을 추출하고, 절이 없으면 ValueError가 발생하는지 테스트"""
+    assert parse_conflict_columns("INSERT INTO t (a, b) VALUES (%s, %s)\non conflict (ticker, stac_yymm) DO UPDATE SET b = EXCLUDED.b;") == ["ticker", "stac_yymm"]
+    with pytest.raises(ValueError):
+      parse_conflict_columns("INSERT INTO t (a) VALUES (%s);")
+
+  def test_only_new_or_changed_rows_pass(self):
+    """저장된 해시와 같은 행은 제외하고, 새로 생겼거나 바뀐 행만 해시 갱신과 함께 반환하는지 테스트"""
+    stored = pd.DataFrame({"ticker": ["A", "B"], "price": ["100", None]})
+    db_handler = MagicMock()
+    db_handler.get_row_hashes.return_value = dict(zip(stored["ticker"], hash_rows(stored)))
+    index = RowHashIndex(db_handler, "kr_stock_price_basic", ["ticker"])
+
+    incoming = pd.DataFrame({"ticker": ["A", "B", "C"], "price": ["101", float("nan"), "300"]})
+    changed, companion_rows = index.filter_changed(incoming)
+
+    assert changed["ticker"].tolist() == ["A", "C"]
+    assert [params[1] for _, params in companion_rows] == ["A", "C"]
+
+    index.commit(companion_rows)
+    assert index.filter_changed(incoming)[0].empty
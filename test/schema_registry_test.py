@@ -0,0 +1,57 @@
+# test/schema_registry_test.py
+
+import importlib.util
+
+import pytest
+
+from src.data.schemas.KIS_schemas import KrStockInvestOpinion
+from src.data.schemas.schema_registry import SCHEMA_REGISTRY, SchemaRegistry, parse_ddl_columns
+from src.errors.schema_errors import SchemaDriftError
+from src.etl.KIS_collector import KIS_COLLECTOR_CONFIGS
+
+def _sql_paths(config):
+  table_name, base = f"{config['asset']}_{config['path']}", f"./sql/{config['asset']}/data_lake/{config['table_type']}"
+  return f"{base}/dml/insert_{table_name}.sql", f"{base}/ddl/create_{table_name}.sql"
+
+class TestSchemaRegistry:
+  """스키마 레지스트리의 조회와 스키마/SQL 어긋남 검증을 테스트합니다."""
+
+  @pytest.mark.parametrize("config", KIS_COLLECTOR_CONFIGS, ids=lambda config: config["path"])
+  def test_collector_schemas_match_sql(self, config):
+    """모든 수집 CONFIG의 스키마가 INSERT/DDL SQL과 어긋나지 않는지 테스트"""
+    binding = SCHEMA_REGISTRY.bind(config["schemas"], *_sql_paths(config))
+    assert binding.key_columns and set(binding.key_columns) <= set(binding.insert_columns)
+
+  def test_binding_follows_insert_column_order(self):
+    """저장 전 컬럼 정렬이 스키마 필드 순서가 아니라 INSERT 문의 %s 순서를 따르는지 테스트"""
+    config = next(config for config in KIS_COLLECTOR_CONFIGS if config["schemas"] is KrStockInvestOpinion)
+    binding = SCHEMA_REGISTRY.bind(KrStockInvestOpinion, *_sql_paths(config))
+
+    assert list(binding.column_index[:3]) == ["ticker", "stck_bsop_date", "mbcr_name"]
+    assert SCHEMA_REGISTRY.get("KrStockInvestOpinion").columns[5] == "mbcr_name"
+
+  def test_drift_is_reported_before_insert(self, tmp_path):
+    """INSERT 컬럼 누락, %s 개수 불일치, DDL 컬럼 누락을 SchemaDriftError로 알리는지 테스트"""
+    insert_path, create_path = tmp_path / "insert.sql", tmp_path / "create.sql"
+    insert_path.write_text("INSERT INTO t (ticker, invt_opnn) VALUES (%s, %s, %s) ON CONFLICT (ticker) DO NOTHING;", encoding="utf-8")
+    create_path.write_text("-- 설명\nCREATE TABLE IF NOT EXISTS t (\n  id SERIAL PRIMARY KEY,\n  ticker TEXT, -- 종목코드\n  UNIQUE (ticker)\n);", encoding="utf-8")
+
+    with pytest.raises(SchemaDriftError) as error:
+      SCHEMA_REGISTRY.bind(KrStockInvestOpinion, str(insert_path), str(create_path))
+
+    message = str(error.value)
+    assert "INSERT 문에 없는 스키마 컬럼" in message and "%s 3개 불일치" in message and "DDL에 정의되지 않은 INSERT 컬럼 ['invt_opnn']" in message
+    assert parse_ddl_columns(create_path.read_text(encoding="utf-8")) == ["id", "ticker"]
+
+  def test_duplicate_schema_definition_is_rejected(self, tmp_path):
+    """스키마 모듈에 같은 이름의 dataclass가 두 번 정의되어 있으면 SchemaDriftError가 발생하는지 테스트"""
+    module_path = tmp_path / "duplicated_schemas.py"
+    module_path.write_text(
+      "from dataclasses import dataclass\n\n@dataclass\nclass A:\n  x: str\n\n@dataclass\nclass A:\n  y: float\n", encoding="utf-8"
+    )
+    spec = importlib.util.spec_from_file_location("duplicated_schemas", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    with pytest.raises(SchemaDriftError):
+      SchemaRegistry(module).get("A")
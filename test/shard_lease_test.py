@@ -0,0 +1,77 @@
+# test/shard_lease_test.py
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.etl import shard_lease
+from src.etl.shard_lease import ShardLeaseManager, collect_sharded, shard_of
+
+CONFIG = {"description": "test", "asset": "kr_stock", "path": "price_basic", "table_type": "stock_price"}
+TICKERS = [f"{i:06d}" for i in range(1, 21)]
+
+def _db_handler(claims):
+  """임대 SQL 호출을 흉내 내는 DB 핸들러. claims 순서대로 샤드를 내어 주고, 완료/반납 상태를 기록합니다."""
+  db_handler = MagicMock()
+  pending, finished = list(claims), {}
+
+  def execute_sql(path, params):
+    if path == ShardLeaseManager.CLAIM_PATH:
+      return [(pending.pop(0),)] if pending else []
+    if path == ShardLeaseManager.FINISH_PATH:
+      finished[params["shard_id"]] = params["status"]
+      return [(params["shard_id"],)]
+    return []
+
+  db_handler.execute_sql.side_effect = execute_sql
+  return db_handler, finished
+
+class TestShardLease:
+  """종목 샤드 임대를 통한 분산 수집을 테스트합니다."""
+
+  def test_worker_collects_only_claimed_shards(self):
+    """워커가 임대한 샤드의 종목만 수집하고, 샤드를 완료로 표시하는지 테스트"""
+    db_handler, finished = _db_handler(claims=[2, 0])
+
+    with patch.object(shard_lease, "load_universe", return_value=TICKERS), \
+         patch.object(shard_lease, "KIS_collector", return_value={"rows": 5, "failed": 0}) as mock_collector:
+      totals = collect_sharded(CONFIG, shard_count=3, run_id="r1", worker_id="w1", db_handler=db_handler)
+
+    collected = [call.kwargs["tickers"] for call in mock_collector.call_args_list]
+    assert collected == [[t for t in TICKERS if shard_of(t, 3) == 2], [t for t in TICKERS if shard_of(t, 3) == 0]]
+    assert finished == {2: "done", 0: "done"}
+    assert totals == {"shards": 2, "rows": 10, "failed": 0}
+
+  def test_failed_shard_is_released(self):
+    """샤드 수집 중 예외가 발생하면 샤드를 반납(pending)하고 예외를 전달하는지 테스트"""
+    db_handler, finished = _db_handler(claims=[1])
+
+    with patch.object(shard_lease, "load_universe", return_value=TICKERS), \
+         patch.object(shard_lease, "KIS_collector", side_effect=RuntimeError("boom")):
+      with pytest.raises(RuntimeError):
+        collect_sharded(CONFIG, shard_count=3, run_id="r1", worker_id="w1", db_handler=db_handler)
+
+    assert finished == {1: "pending"}
+
+  def test_lost_lease_stops_shard_without_completing(self):
+    """하트비트가 임대 상실을 발견하면 수집기에 중단 이벤트가 전달되고, 샤드를 완료로 표시하지 않는지 테스트"""
+    db_handler, finished = _db_handler(claims=[1]) # 하트비트 SQL이 빈 결과를 반환하므로 임대를 잃습니다.
+
+    def collector(*args, stop_event, **kwargs):
+      assert stop_event.wait(timeout=5)
+      return {"rows": 0, "failed": 0, "discarded": 3}
+
+    with patch.object(shard_lease, "load_universe", return_value=TICKERS), \
+         patch.object(shard_lease, "KIS_collector", side_effect=collector):
+      totals = collect_sharded(CONFIG, shard_count=3, run_id="r1", worker_id="w1", lease_seconds=0.03, db_handler=db_handler)
+
+    assert finished == {}
+    assert totals == {"shards": 0, "rows": 0, "failed": 0, "discarded": 3}
+
+  def test_sharded_collection_requires_run_id(self, monkeypatch):
+    """워커들이 공유할 run_id가 없으면 임대를 만들기 전에 예외가 발생하는지 테스트"""
+    monkeypatch.delenv("KIS_RUN_ID", raising=False)
+    db_handler, _ = _db_handler(claims=[])
+
+    with pytest.raises(ValueError):
+      collect_sharded(CONFIG, shard_count=3, worker_id="w1", db_handler=db_handler)
+    db_handler.execute_sql.assert_not_called()
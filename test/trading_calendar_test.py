@@ -0,0 +1,46 @@
+# test/trading_calendar_test.py
+
+from datetime import datetime, timedelta
+
+from src.etl.KIS_collector import plan_date_ranges
+from src.utils.trading_calendar import KRXTradingCalendar
+
+class TestKRXTradingCalendar:
+  """KRX 영업일 달력과 상장일 기반 수집 구간 계획을 테스트합니다."""
+
+  def test_trading_days_skip_weekends_and_holidays(self):
+    """주말, 고정 휴장일, 추가 휴장일을 영업일에서 제외하는지 테스트"""
+    calendar = KRXTradingCalendar(holidays=["20240209", "20240212"]) # 설날 연휴, 대체공휴일
+
+    days = calendar.trading_days("20240208", "20240304")
+
+    assert days[:3] == ["20240208", "20240213", "20240214"]
+    assert days[-2:] == ["20240229", "20240304"] # 20240301(삼일절), 주말 제외
+
+  def test_pack_ranges_hold_exact_trading_days(self):
+    """각 구간에 정확히 N 영업일씩 담기고, 두 번째 구간부터는 영업일에서 시작하는지 테스트"""
+    calendar = KRXTradingCalendar()
+
+    ranges = calendar.pack_ranges("20230101", "20231231", 100)
+
+    assert [len(calendar.trading_days(start, end)) for start, end in ranges] == [100, 100, len(calendar.trading_days("20230101", "20231231")) - 200]
+    assert all(calendar.is_trading_day(datetime.strptime(start, "%Y%m%d").date()) for start, _ in ranges[1:])
+
+  def test_pack_ranges_cover_period_without_gaps(self):
+    """구간들이 시작일부터 종료일까지 빈틈없이 이어져, 휴장일로 표시된 날(예: 1998년 이전 토요일)도 조회되는지 테스트"""
+    calendar = KRXTradingCalendar()
+
+    for start_date, end_date, chunk in [("19970101", "19970131", 5), ("19810101", "19841231", 100), ("20240106", "20240110", 2)]:
+      ranges = calendar.pack_ranges(start_date, end_date, chunk)
+      assert ranges[0][0] == start_date and ranges[-1][1] == end_date
+      for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert datetime.strptime(next_start, "%Y%m%d") - datetime.strptime(end, "%Y%m%d") == timedelta(days=1)
+
+  def test_plan_starts_from_listing_date(self):
+    """상장일 이전 기간은 요청하지 않고, 영업일이 없는 기간은 구간을 만들지 않는지 테스트"""
+    calendar = KRXTradingCalendar()
+
+    assert plan_date_ranges("19810101", "20240131", calendar, listing_date="20240115", trading_days_per_chunk=100) == [("20240115", "20240131")]
+    assert plan_date_ranges("20240106", "20240107", calendar, trading_days_per_chunk=100) == [] # 주말
+    assert plan_date_ranges("20240101", "20240131", calendar, listing_date="20240201") == []
+    assert plan_date_ranges("20240101", "20240131", calendar, listing_date="20231201") == [("20240101", "20240131")]
@@ -0,0 +1,56 @@
+# test/universe_test.py
+
+from unittest.mock import MagicMock
+
+from src.etl.universe import UniverseService, normalize_tickers
+from src.utils.get_asset_list import get_asset_list
+
+ROWS = [
+  ("000660", "active", "STK", True, "19961226", None, 9.0e11),
+  ("005930", "active", "STK", True, "19750611", None, 1.2e12),
+  ("035720", "suspended", "STK", False, "20171110", None, None),
+  ("091990", "active", "KSQ", False, "20070703", None, 3.0e10),
+  ("123456", "delisted", "KSQ", False, "20100101", "20200101", 0.0),
+]
+
+def _service(tmp_path, rows=ROWS):
+  db_handler = MagicMock()
+  db_handler.execute_sql.return_value = rows
+  return UniverseService(db_handler, snapshot_dir=tmp_path), db_handler
+
+class TestUniverseService:
+  """종목 유니버스의 정규화, 필터링, 스냅샷 캐시를 테스트합니다."""
+
+  def test_normalize_dedupes_and_validates(self):
+    """중복과 형식이 잘못된 코드를 제외하고 입력 순서를 유지하는지 테스트"""
+    assert normalize_tickers("kr_stock", ["005930", " 00104k", "005930", "5930"]) == ["005930", "00104K"]
+    assert normalize_tickers("us_stock", ["GE", "ge", "BRK.B", "TOOLONG"]) == ["GE", "BRK.B"]
+    assert len(get_asset_list("us_stock")) == len(set(get_asset_list("us_stock")))
+
+  def test_filters_exclude_delisted_and_apply_conditions(self, tmp_path):
+    """상장폐지 종목은 항상 제외하고, 시장/지수 편입/거래 대금/거래정지 조건을 적용하는지 테스트"""
+    service, _ = _service(tmp_path)
+
+    assert service.tickers("kr_stock") == ["000660", "005930", "035720", "091990"]
+    assert service.tickers("kr_stock", markets=["KSQ"]) == ["091990"]
+    assert service.tickers("kr_stock", kospi200=True, min_trading_value=1e12) == ["005930"]
+    assert service.tickers("kr_stock", include_suspended=False) == ["000660", "005930", "091990"]
+
+  def test_snapshot_avoids_repeated_db_reads(self, tmp_path):
+    """스냅샷이 유효한 동안에는 DB를 다시 조회하지 않는지 테스트"""
+    service, db_handler = _service(tmp_path)
+    service.tickers("kr_stock")
+    service.tickers("kr_stock", markets=["STK"])
+
+    assert db_handler.execute_sql.call_count == 1
+    assert UniverseService(MagicMock(), snapshot_dir=tmp_path).tickers("kr_stock", markets=["STK"]) == ["000660", "005930", "035720"]
+
+  def test_snapshot_defaults_to_cache_dir(self, tmp_path, monkeypatch):
+    """스냅샷 디렉터리를 지정하지 않으면 작업 디렉터리가 아닌 KIS_CACHE_DIR 아래에 저장하는지 테스트"""
+    monkeypatch.delenv("KIS_UNIVERSE_SNAPSHOT_DIR", raising=False)
+    monkeypatch.setenv("KIS_CACHE_DIR", str(tmp_path))
+    db_handler = MagicMock()
+    db_handler.execute_sql.return_value = ROWS
+
+    UniverseService(db_handler).tickers("kr_stock")
+    assert (tmp_path / "universe_kr_stock.json").exists()
@@ -0,0 +1,61 @@
+# test/watermark_store_test.py
+
+from unittest.mock import MagicMock, patch
+
+from src.etl import KIS_collector as collector
+from src.etl.watermark_store import WatermarkStore
+
+class TestWatermarkStore:
+  """종목별 워터마크 병합과 시작일 계산을 테스트합니다."""
+
+  def test_load_merges_stored_watermarks_with_table_max(self):
+    """저장된 워터마크와 데이터 테이블의 종목별 MAX 중 늦은 날짜를 사용하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.get_latest_dates_by_ticker.return_value = {"A": "20240105", "B": "20240110"}
+    db_handler.get_watermarks.return_value = {"A": "20240131", "C": "20240120"}
+
+    watermarks = WatermarkStore(db_handler).load("kr_stock_daily", "stck_bsop_date")
+
+    db_handler.create_table.assert_called_once_with(WatermarkStore.DDL_PATH)
+    assert watermarks == {"A": "20240131", "B": "20240110", "C": "20240120"}
+
+  def test_start_dates_are_computed_per_ticker(self):
+    """워터마크가 있는 종목은 다음 날부터, 없는 종목은 기본 시작일부터 수집하는지 테스트"""
+    start_dates = WatermarkStore.start_dates({"A": "20240131", "B": "20241231"}, ["A", "B", "NEW"], "20150101")
+
+    assert start_dates == {"A": "20240201", "B": "20250101", "NEW": "20150101"}
+
+  def test_empty_chunk_does_not_advance_watermark(self):
+    """빈 응답이 돌아온 기간은 워터마크를 전진시키지 않고, 응답에 있는 마지막 기준일자까지만 기록하는지 테스트"""
+    db_handler = MagicMock()
+    db_handler.get_latest_dates_by_ticker.return_value = {}
+    db_handler.get_watermarks.return_value = {}
+    db_handler.get_listing_dates.return_value = {}
+    db_handler.get_checkpoints.return_value = set()
+    db_handler.insert_data.return_value = True
+    chunks = {
+      "20240331": [{"stck_bsop_date": "20240315", "invt_opnn": "매수"}, {"stck_bsop_date": "20240302", "invt_opnn": "매수"}],
+      "20240630": [], # KIS가 아직 데이터를 게시하지 않았거나 빈 응답이 돌아온 기간
+    }
+    kis_hook = MagicMock()
+    kis_hook.iter_endpoint.side_effect = lambda endpoint, **params: iter([chunks[params["end_date"]]])
+
+    with patch.object(collector, "load_universe", return_value=["000001"]), \
+         patch.object(collector, "KRXTradingCalendar"), \
+         patch.object(collector, "plan_date_ranges", return_value=[("20240101", "20240331"), ("20240401", "20240630")]):
+      collector.KIS_collector(
+        collector.KR_STOCK_INVEST_OPINION_CONFIG, max_workers=1, kis_hook=kis_hook,
+        db_handler=db_handler, transformer=MagicMock(), run_id="watermark-test",
+      )
+
+    watermark_rows = [
+      row for call in db_handler.insert_data.call_args_list for row in call.kwargs.get("companion_rows", {}).get(WatermarkStore.DML_PATH, [])
+    ]
+    assert watermark_rows == [("kr_stock_invest_opinion", "000001", "20240315")]
+
+  def test_latest_date_ignores_rows_without_date(self):
+    """기준일자가 없거나 형식이 다른 행(output1 등)은 무시하는지 테스트"""
+    rows = [{"hts_kor_isnm": "종목"}, {"stck_bsop_date": ""}, {"stck_bsop_date": "20240105"}, {"stck_bsop_date": "20240103"}]
+
+    assert WatermarkStore.latest_date(rows, "stck_bsop_date") == "20240105"
+    assert WatermarkStore.latest_date([], "stck_bsop_date") is None